@@ -8,11 +8,22 @@ across multiple platforms.
 __version__ = "0.1.0"
 
 from config import config
-from youtube_client import YouTubeDiscovery
-from twitch_client import TwitchDiscovery
 
 __all__ = [
     'config',
     'YouTubeDiscovery',
     'TwitchDiscovery'
 ]
+
+_LAZY_EXPORTS = {
+    'YouTubeDiscovery': 'youtube_client',
+    'TwitchDiscovery': 'twitch_client',
+}
+
+
+def __getattr__(name):
+    """Import platform clients only when they are first accessed."""
+    if name in _LAZY_EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
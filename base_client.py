@@ -4,11 +4,12 @@ Handles common functionality like retries, rate limiting, and error handling.
 """
 import time
 import random
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Iterator, Optional, Tuple, List
 from dataclasses import dataclass, field
 from ratelimit import limits, sleep_and_retry
 from loguru import logger
 from config import config
+from discovery_budget import Deadline, DeadlineExpired
 
 @dataclass
 class Stream:
@@ -48,24 +49,30 @@ class BaseDiscoveryClient:
         Args:
             url: The URL to request
             params: Query parameters
-            **kwargs: Additional arguments for requests.get()
+            **kwargs: Additional arguments for requests.get(). A ``deadline``
+                (Deadline) caps every attempt's timeout at the time left, so
+                an abandoned fetch thread does not outlive it.
             
         Returns:
             Parsed JSON response as a dictionary
         """
         import requests
-        from requests.exceptions import RequestException
+        from requests.exceptions import RequestException, Timeout
         
         headers = kwargs.pop('headers', {})
         timeout = kwargs.pop('timeout', self.timeout)
+        deadline: Optional[Deadline] = kwargs.pop('deadline', None)
         
         for attempt in range(self.max_retries + 1):
+            remaining = deadline.remaining() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                raise Timeout(f"Discovery deadline passed before requesting {url}")
             try:
                 response = requests.get(
                     url,
                     params=params,
                     headers=headers,
-                    timeout=timeout,
+                    timeout=timeout if remaining is None else min(timeout, remaining),
                     **kwargs
                 )
                 response.raise_for_status()
@@ -79,7 +86,8 @@ class BaseDiscoveryClient:
                 # Exponential backoff with jitter
                 backoff = (2 ** attempt) + random.uniform(0, 1)
                 logger.warning(f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}. Retrying in {backoff:.2f}s")
-                time.sleep(backoff)
+                remaining = deadline.remaining() if deadline is not None else None
+                time.sleep(backoff if remaining is None else min(backoff, remaining))
     
     def _enforce_rate_limit(self):
         """Enforce rate limiting between requests."""
@@ -105,6 +113,74 @@ class BaseDiscoveryClient:
         """
         raise NotImplementedError("Subclasses must implement this method")
     
+    def fetch_raw_page(self, page_token: Optional[str] = None, deadline: Optional[Deadline] = None,
+                       **kwargs) -> Tuple[List[Any], Optional[str]]:
+        """
+        Fetch one page of raw API items without decoding them.
+        
+        Subclasses that can split transport from decoding override this and
+        ``decode_items``; the default fetches already-decoded streams.
+        
+        Args:
+            page_token: Token/cursor for pagination
+            deadline: Optional deadline bounding the page's requests
+                (honoured by subclasses that override this)
+            **kwargs: Platform-specific parameters
+            
+        Returns:
+            Tuple of (list of raw items, next page token/cursor)
+        """
+        return self.fetch_live_streams(page_token=page_token, **kwargs)
+    
+    def decode_items(self, items: List[Any]) -> List[Stream]:
+        """
+        Turn raw items from ``fetch_raw_page`` into Stream objects.
+        
+        Args:
+            items: Raw items of one page
+            
+        Returns:
+            List of Stream objects
+        """
+        return list(items)
+    
+    def iter_raw_pages(self, deadline: Optional[Deadline] = None, **kwargs) -> Iterator[List[Any]]:
+        """
+        Yield raw pages one at a time, following pagination up to ``max_pages``.
+        
+        Args:
+            deadline: Optional deadline; no page is requested after it and
+                requests in flight time out at it
+            **kwargs: Platform-specific parameters
+            
+        Yields:
+            Lists of raw items, one per page
+            
+        Raises:
+            DeadlineExpired: The deadline passed before the last page
+            Exception: Whatever a page fetch raised, so callers can tell a
+                failed source from one that ran out of pages
+        """
+        next_token = None
+        pages_fetched = 0
+        
+        while pages_fetched < self.max_pages:
+            if deadline is not None and deadline.expired():
+                raise DeadlineExpired(f"Deadline passed after {pages_fetched} pages")
+            try:
+                items, next_token = self.fetch_raw_page(page_token=next_token, deadline=deadline, **kwargs)
+            except Exception as e:
+                logger.error(f"Error fetching page {pages_fetched + 1}: {e}")
+                raise
+            
+            if items:
+                yield items
+            
+            if not next_token or not items:
+                break
+            
+            pages_fetched += 1
+    
     def fetch_all_pages(self, **kwargs) -> List[Stream]:
         """
         Fetch all available pages of live streams.
@@ -0,0 +1,203 @@
+"""
+Candidate Pool - Long-lived store of scored, not-yet-exposed streams.
+Keeps a priority index on score and an expiry index on time so a feed can be
+produced at any moment without a fresh discovery pass.
+"""
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from base_client import Stream
+
+
+@dataclass
+class PoolEntry:
+    """A stream held in the candidate pool."""
+    stream: Stream
+    score: float
+    expires_at: float
+    version: int
+
+
+class CandidatePool:
+    """
+    Streams keyed by ``platform:stream_id`` with score and expiry indexes.
+
+    Both indexes are binary heaps with lazy deletion: an upsert or removal
+    bumps the entry's version and leaves the old heap node behind, to be
+    discarded when it surfaces. Heaps are rebuilt once stale nodes outnumber
+    live entries, so memory stays proportional to the pool size. With a
+    ``group`` function each group also gets its own score heap.
+    """
+
+    def __init__(self, freshness_window_minutes: int = 30,
+                 priority: Optional[Callable[[Stream], float]] = None,
+                 group: Optional[Callable[[Stream], str]] = None):
+        """
+        Args:
+            freshness_window_minutes: Default lifetime of a candidate
+            priority: Optional time-independent ranking key for the score
+                heap. Scores computed at different times are not comparable
+                once they decay; without a key the heap orders by score.
+            group: Optional group key of a stream, for ``top_k(per_group=True)``
+        """
+        self.freshness_window_minutes = freshness_window_minutes
+        self.priority = priority
+        self.group = group
+        self._entries: Dict[str, PoolEntry] = {}
+        self._by_score: List[Tuple[float, int, str, int]] = []
+        self._by_group: Dict[str, List[Tuple[float, int, str, int]]] = {}
+        self._by_expiry: List[Tuple[float, str, int]] = []
+        self._versions = itertools.count(1)
+        self._order = itertools.count()
+
+    @staticmethod
+    def key(stream: Stream) -> str:
+        """Pool key for a stream."""
+        return f"{stream.platform}:{stream.stream_id}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[PoolEntry]:
+        """Look up a pooled entry by key."""
+        return self._entries.get(key)
+
+    def upsert(self, stream: Stream, score: float, expires_at: Optional[float] = None,
+               now: Optional[float] = None) -> bool:
+        """
+        Insert or refresh a candidate.
+
+        Args:
+            stream: Stream to pool (replaces any older copy with the same key)
+            score: Priority score, higher is better
+            expires_at: When the stream leaves the pool; defaults to the end of
+                its freshness window (or one window from now if unknown)
+            now: Clock snapshot
+
+        Returns:
+            True if the stream was not pooled before
+        """
+        now = time.time() if now is None else now
+        if expires_at is None:
+            window = self.freshness_window_minutes * 60
+            expires_at = (stream.started_at or now) + window
+
+        key = self.key(stream)
+        is_new = key not in self._entries
+        version = next(self._versions)
+        self._entries[key] = PoolEntry(stream=stream, score=score, expires_at=expires_at, version=version)
+        rank = self.priority(stream) if self.priority is not None else score
+        node = (-rank, next(self._order), key, version)
+        heapq.heappush(self._by_score, node)
+        if self.group is not None:
+            heapq.heappush(self._by_group.setdefault(self.group(stream), []), node)
+        heapq.heappush(self._by_expiry, (expires_at, key, version))
+        self._maybe_rebuild()
+        return is_new
+
+    def upsert_many(self, scored: Iterable[Tuple[Stream, float, float]], now: Optional[float] = None) -> int:
+        """
+        Upsert (stream, score, expires_at) triples.
+
+        Returns:
+            Number of streams that were new to the pool
+        """
+        now = time.time() if now is None else now
+        return sum(self.upsert(stream, score, expires_at, now) for stream, score, expires_at in scored)
+
+    def remove(self, key: str) -> bool:
+        """Drop a candidate (e.g. once it has been exposed)."""
+        return self._entries.pop(key, None) is not None
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Drop every candidate whose expiry time has passed."""
+        now = time.time() if now is None else now
+        expired = 0
+        while self._by_expiry and self._by_expiry[0][0] <= now:
+            _, key, version = heapq.heappop(self._by_expiry)
+            entry = self._entries.get(key)
+            if entry and entry.version == version:
+                del self._entries[key]
+                expired += 1
+        if expired:
+            logger.debug(f"Expired {expired} candidates from pool")
+        return expired
+
+    def top_k(self, k: int, now: Optional[float] = None,
+              exclude: Optional[Callable[[Stream], bool]] = None,
+              per_group: bool = False) -> List[Tuple[Stream, float]]:
+        """
+        Best-ranked live candidates without a full scan.
+
+        Pops valid nodes off the score heap until ``k`` are collected, then
+        pushes them back, so the cost is O((k + skipped) log n).
+
+        Args:
+            k: Number of candidates to return
+            now: Clock snapshot used to expire stale entries first
+            exclude: Optional predicate; matching candidates are skipped but kept
+            per_group: Return the best ``k`` of every group instead (needs
+                ``group``), at O(g (k + skipped) log n) for g groups
+
+        Returns:
+            (stream, score) pairs, best first; scores are the ones stored at
+            upsert time
+        """
+        self.expire(now)
+        if not per_group:
+            return [(entry.stream, entry.score) for _, entry in self._take(self._by_score, k, exclude)]
+        if self.group is None:
+            raise ValueError("per_group needs a pool created with a group function")
+        picked = [item for heap in self._by_group.values() for item in self._take(heap, k, exclude)]
+        picked.sort(key=lambda item: item[0])
+        return [(entry.stream, entry.score) for _, entry in picked]
+
+    def _take(self, heap: List[Tuple[float, int, str, int]], k: int,
+              exclude: Optional[Callable[[Stream], bool]]) -> List[Tuple[Tuple, PoolEntry]]:
+        """Best ``k`` live (node, entry) pairs of a score heap, which is left intact."""
+        picked = []
+        popped = []
+        while heap and len(picked) < k:
+            node = heapq.heappop(heap)
+            entry = self._entries.get(node[2])
+            if not entry or entry.version != node[3]:
+                continue  # stale node, drop it for good
+            popped.append(node)
+            if exclude and exclude(entry.stream):
+                continue
+            picked.append((node, entry))
+
+        for node in popped:
+            heapq.heappush(heap, node)
+        return picked
+
+    def candidates(self, now: Optional[float] = None) -> List[Tuple[Stream, float]]:
+        """All live candidates in insertion order."""
+        self.expire(now)
+        return [(entry.stream, entry.score) for entry in self._entries.values()]
+
+    def _maybe_rebuild(self):
+        """Rebuild the heaps when stale nodes dominate them."""
+        live = len(self._entries)
+        if len(self._by_score) <= 2 * live + 64:
+            return
+        self._by_score = [node for node in self._by_score
+                          if (entry := self._entries.get(node[2])) and entry.version == node[3]]
+        heapq.heapify(self._by_score)
+        if self.group is not None:
+            self._by_group = {}
+            for node in self._by_score:
+                self._by_group.setdefault(self.group(self._entries[node[2]].stream), []).append(node)
+            for heap in self._by_group.values():
+                heapq.heapify(heap)
+        self._by_expiry = [node for node in self._by_expiry
+                           if (entry := self._entries.get(node[1])) and entry.version == node[2]]
+        heapq.heapify(self._by_expiry)
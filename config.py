@@ -1,34 +1,180 @@
 """
 Configuration settings for the Counter-Exposure Engine.
 Loads settings from environment variables with sensible defaults.
+
+Nothing happens at import time: the .env file is loaded, settings are
+validated and the log file sink is set up the first time a setting is read.
 """
 import os
+import threading
 from pathlib import Path
-from dotenv import load_dotenv
 from loguru import logger
 
-# Load environment variables from .env file
-env_path = Path('.') / '.env'
-load_dotenv(dotenv_path=env_path)
+
+class Setting:
+    """A configuration value read from the environment on first access."""
+    
+    def __init__(self, env_name: str, default: str, cast=str):
+        self.env_name = env_name
+        self.default = default
+        self.cast = cast
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner):
+        owner.load()
+        values = owner._values
+        if self.name not in values:
+            values[self.name] = self.cast(os.getenv(self.env_name, self.default))
+        return values[self.name]
+
+
+PROJECT_DIR = Path(__file__).resolve().parent
+
+
+def _flag(value: str) -> bool:
+    return value == '1'
+
+
+def _project_path(value: str) -> str:
+    """Resolve a relative path against the project directory instead of the working directory."""
+    return str(PROJECT_DIR / value)
+
 
 class Config:
     """Application configuration."""
     
     # YouTube API Settings
-    YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY', '')
-    YOUTUBE_MAX_RESULTS = int(os.getenv('YOUTUBE_MAX_RESULTS', '50'))
+    YOUTUBE_API_KEY = Setting('YOUTUBE_API_KEY', '')
+    YOUTUBE_MAX_RESULTS = Setting('YOUTUBE_MAX_RESULTS', '50', int)
     
     # Twitch API Settings
-    TWITCH_CLIENT_ID = os.getenv('TWITCH_CLIENT_ID', '')
-    TWITCH_OAUTH_TOKEN = os.getenv('TWITCH_OAUTH_TOKEN', '')
-    TWITCH_MAX_RESULTS = int(os.getenv('TWITCH_MAX_RESULTS', '50'))
+    TWITCH_CLIENT_ID = Setting('TWITCH_CLIENT_ID', '')
+    TWITCH_OAUTH_TOKEN = Setting('TWITCH_OAUTH_TOKEN', '')
+    TWITCH_MAX_RESULTS = Setting('TWITCH_MAX_RESULTS', '50', int)
     
     # Application Settings
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '10'))
-    MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
-    MAX_PAGES = int(os.getenv('MAX_PAGES', '10'))
+    LOG_LEVEL = Setting('LOG_LEVEL', 'INFO')
+    REQUEST_TIMEOUT = Setting('REQUEST_TIMEOUT', '10', int)
+    MAX_RETRIES = Setting('MAX_RETRIES', '3', int)
+    MAX_PAGES = Setting('MAX_PAGES', '10', int)
+
+    # State files: relative paths resolve against the project directory, so
+    # the engine, the workers and the web server share them wherever started
+    EXPOSURE_TRACKER_DB = Setting('EXPOSURE_TRACKER_DB', 'exposure_tracker.db', _project_path)
+    FEED_HTML_FILE = Setting('FEED_HTML_FILE', 'counter_exposure_feed.html', _project_path)
+    FEED_DATA_FILE = Setting('FEED_DATA_FILE', 'feed_data.json', _project_path)
+    FEED_SNAPSHOT_FILE = Setting('FEED_SNAPSHOT_FILE', 'feed_snapshot.json', _project_path)
+
+    # Exposure History Retention
+    EXPOSURE_HOT_DAYS = Setting('EXPOSURE_HOT_DAYS', '7', int)
+    EXPOSURE_ARCHIVE_DIR = Setting('EXPOSURE_ARCHIVE_DIR', 'exposure_archive')  # Relative to the tracker database
+    EXPOSURE_ARCHIVE_RETENTION_DAYS = Setting('EXPOSURE_ARCHIVE_RETENTION_DAYS', '0', int)
+
+    # Resident Discovery Daemon
+    ENGINE_DAEMON = Setting('ENGINE_DAEMON', '0', _flag)
+    ENGINE_DAEMON_INTERVAL = Setting('ENGINE_DAEMON_INTERVAL', '600', int)
+    ENGINE_DAEMON_FEED_COUNT = Setting('ENGINE_DAEMON_FEED_COUNT', '20', int)
 
+    # Discovery Pipeline
+    PIPELINE_QUEUE_SIZE = Setting('PIPELINE_QUEUE_SIZE', '8', int)
+    PIPELINE_DECODE_WORKERS = Setting('PIPELINE_DECODE_WORKERS', '2', int)
+    PIPELINE_VALIDATE_WORKERS = Setting('PIPELINE_VALIDATE_WORKERS', '2', int)
+
+    # Discovery Time Budgets (seconds, 0 = run until every source finishes)
+    ENGINE_CYCLE_BUDGET = Setting('ENGINE_CYCLE_BUDGET', '0', float)
+    DISCOVERY_BUDGET_SECONDS = Setting('DISCOVERY_BUDGET_SECONDS', '0', float)
+    SOURCE_YIELD_FILE = Setting('SOURCE_YIELD_FILE', 'source_yield.json', _project_path)
+
+    # Feed Profiles: JSON list (or path to a JSON file) of feeds selected
+    # from one shared discovery pass, e.g.
+    # [{"name": "tiny", "max_viewers": 2}, {"name": "es", "languages": ["es"]}]
+    FEED_PROFILES = Setting('FEED_PROFILES', '')
+
+    # Reverse Discovery
+    REVERSE_MIN_INTERVAL = Setting('REVERSE_MIN_INTERVAL', '1.0', float)  # Seconds between requests to one host
+    REVERSE_JITTER = Setting('REVERSE_JITTER', '2.0', float)  # Extra random seconds per interval
+    REVERSE_QUERY_BUDGET = Setting('REVERSE_QUERY_BUDGET', '40', int)  # Requests per query, 0 = unlimited
+    REVERSE_WORKERS = Setting('REVERSE_WORKERS', '4', int)
+    REVERSE_PARSE_PROCESSES = Setting('REVERSE_PARSE_PROCESSES', '0', int)  # 0 = one per core, 1 = in-thread
+    LAST_PAGE_CACHE_TTL = Setting('LAST_PAGE_CACHE_TTL', '21600', int)  # Seconds a found last page is reused
+    CRAWL_FRONTIER_DB = Setting('CRAWL_FRONTIER_DB', 'crawl_frontier.db', _project_path)
+    CRAWL_FRONTIER_TTL = Setting('CRAWL_FRONTIER_TTL', '21600', int)  # Seconds a crawled page stays fresh
+
+    # Local LLM (Ollama) Content Validation
+    OLLAMA_URL = Setting('OLLAMA_URL', 'http://localhost:11434')
+    OLLAMA_MODEL = Setting('OLLAMA_MODEL', 'llama3.2:latest')
+    OLLAMA_KEEP_ALIVE = Setting('OLLAMA_KEEP_ALIVE', '30m')
+    LLM_BATCH_SIZE = Setting('LLM_BATCH_SIZE', '16', int)
+    LLM_TIMEOUT = Setting('LLM_TIMEOUT', '60', int)
+    OLLAMA_HEALTH_INTERVAL = Setting('OLLAMA_HEALTH_INTERVAL', '30', float)  # Seconds between probes while up
+    OLLAMA_HEALTH_MAX_BACKOFF = Setting('OLLAMA_HEALTH_MAX_BACKOFF', '300', float)  # Longest wait while down
+    LLM_STREAMING = Setting('LLM_STREAMING', '1', _flag)  # Stop generating once the verdict is known
+    LLM_CONCURRENCY = Setting('LLM_CONCURRENCY', '4', int)  # Validation calls in flight at once
+    VALIDATION_BUDGET_SECONDS = Setting('VALIDATION_BUDGET_SECONDS', '0', float)  # 0 = no overall limit
+
+    # Heuristic Filter Rules (extend the built-in phrase lists)
+    # HEURISTIC_MISMATCHES: JSON object (or path to one) of query term -> contradicting phrases
+    HEURISTIC_MISMATCHES = Setting('HEURISTIC_MISMATCHES', '')
+    SPAM_KEYWORDS = Setting('SPAM_KEYWORDS', '')  # Comma-separated extra spam phrases
+
+    # Local Relevance Model (between the heuristics and the LLM)
+    RELEVANCE_MODEL = Setting('RELEVANCE_MODEL', '1', _flag)
+    RELEVANCE_MIN_SAMPLES = Setting('RELEVANCE_MIN_SAMPLES', '200', int)
+    RELEVANCE_MAX_SAMPLES = Setting('RELEVANCE_MAX_SAMPLES', '20000', int)
+    RELEVANCE_RETRAIN_INTERVAL = Setting('RELEVANCE_RETRAIN_INTERVAL', '1800', float)  # Seconds between retrains
+    RELEVANCE_LOW = Setting('RELEVANCE_LOW', '0.2', float)  # Below: mismatch without asking the LLM
+    RELEVANCE_HIGH = Setting('RELEVANCE_HIGH', '0.8', float)  # Above: match without asking the LLM
+
+    # Validation Verdict Cache
+    VALIDATION_CACHE_DB = Setting('VALIDATION_CACHE_DB', 'validation_cache.db', _project_path)
+    VALIDATION_CACHE_TTL = Setting('VALIDATION_CACHE_TTL', '604800', int)
+    VALIDATION_CACHE_MAX_ENTRIES = Setting('VALIDATION_CACHE_MAX_ENTRIES', '50000', int)
+
+    # Discovery Job Queue (shared by worker processes and nodes)
+    JOB_QUEUE_DB = Setting('JOB_QUEUE_DB', 'discovery_jobs.db', _project_path)
+    JOB_QUEUE_JOURNAL_MODE = Setting('JOB_QUEUE_JOURNAL_MODE', 'DELETE')  # WAL only if every worker is on one host
+    JOB_VISIBILITY_TIMEOUT = Setting('JOB_VISIBILITY_TIMEOUT', '300', int)
+    JOB_MAX_ATTEMPTS = Setting('JOB_MAX_ATTEMPTS', '3', int)
+    DISCOVERY_WORKERS = Setting('DISCOVERY_WORKERS', '0', int)
+    TWITCH_PARTITION_LANGUAGES = Setting('TWITCH_PARTITION_LANGUAGES', 'en,es,pt,de,fr,ja,ko,ru')
+
+    _values = {}
+    _loaded = False
+    _load_lock = threading.RLock()
+    
+    @classmethod
+    def load(cls):
+        """Load .env, configure logging and validate, once per process."""
+        if cls._loaded:
+            return
+        with cls._load_lock:
+            if cls._loaded:
+                return
+            cls._loaded = True
+            
+            from dotenv import load_dotenv
+            
+            # Load environment variables from .env file
+            env_path = Path('.') / '.env'
+            load_dotenv(dotenv_path=env_path)
+            
+            cls.setup_logging()
+            cls.validate()
+    
+    @classmethod
+    def setup_logging(cls):
+        """Send logs to the rotating log file."""
+        logger.remove()  # Remove default handler
+        logger.add(
+            "counter_exposure_engine.log",
+            rotation="10 MB",
+            retention="7 days",
+            level=cls.LOG_LEVEL,
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}"
+        )
+    
     @classmethod
     def validate(cls):
         """Validate required configuration."""
@@ -38,16 +184,6 @@ class Config:
         if not all([cls.TWITCH_CLIENT_ID, cls.TWITCH_OAUTH_TOKEN]):
             logger.warning("Twitch credentials not fully configured. Twitch integration will be disabled.")
 
-# Initialize and validate config
+
+# Settings are resolved lazily; see Config.load
 config = Config()
-config.validate()
-
-# Configure logging
-logger.remove()  # Remove default handler
-logger.add(
-    "counter_exposure_engine.log",
-    rotation="10 MB",
-    retention="7 days",
-    level=config.LOG_LEVEL,
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}"
-)
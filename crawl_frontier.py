@@ -0,0 +1,130 @@
+"""
+Crawl Frontier - Persistent record of crawled reverse discovery pages.
+Each (query, source, page) unit is stored once it has been fetched and
+parsed, together with its results and the fetch time. An interrupted run
+(a redeploy, a block) resumes from the stored units instead of fetching
+every page again, and pages fetched within the freshness TTL are served
+from the frontier until they go stale.
+"""
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+class CrawlFrontier:
+    """
+    SQLite-backed store of crawled pages.
+
+    A unit's ``state`` carries what is needed to continue past it, e.g. the
+    continuation token of a YouTube page or the last page found for a
+    Google query.
+    """
+
+    def __init__(self, db_path: str = "crawl_frontier.db", ttl_seconds: float = 6 * 3600):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+        self._init_database()
+
+    def _init_database(self):
+        """Create the pages table."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                query TEXT NOT NULL,
+                source TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                results TEXT NOT NULL,
+                state TEXT,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (query, source, page)
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_fetched ON pages(fetched_at)")
+        conn.commit()
+        conn.close()
+
+    def get(self, query: str, source: str, page: int,
+            now: Optional[float] = None) -> Optional[Tuple[List[Dict], Dict]]:
+        """
+        A unit fetched within the TTL.
+
+        Returns:
+            (results, state), or None if the unit is missing or stale
+        """
+        now = time.time() if now is None else now
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            "SELECT results, state FROM pages WHERE query = ? AND source = ? AND page = ? AND fetched_at > ?",
+            (query, source, page, now - self.ttl_seconds)
+        ).fetchone()
+        conn.close()
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if row is None:
+            return None
+        return json.loads(row[0]), json.loads(row[1]) if row[1] else {}
+
+    def done(self, query: str, source: str, page: int, results: List[Dict],
+             state: Optional[Dict] = None, now: Optional[float] = None):
+        """Record a fetched and parsed unit, replacing an older fetch of it."""
+        now = time.time() if now is None else now
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO pages (query, source, page, results, state, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (query, source, page, json.dumps(results), json.dumps(state) if state else None, now)
+        )
+        conn.commit()
+        conn.close()
+
+        with self._lock:
+            self.writes += 1
+
+    def progress(self, query: str, source: str, now: Optional[float] = None) -> List[int]:
+        """Pages of a query and source that are done and still fresh."""
+        now = time.time() if now is None else now
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute(
+            "SELECT page FROM pages WHERE query = ? AND source = ? AND fetched_at > ? ORDER BY page",
+            (query, source, now - self.ttl_seconds)
+        ).fetchall()
+        conn.close()
+        return [page for (page,) in rows]
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete stale units."""
+        now = time.time() if now is None else now
+        conn = sqlite3.connect(self.db_path)
+        removed = conn.execute("DELETE FROM pages WHERE fetched_at <= ?", (now - self.ttl_seconds,)).rowcount
+        conn.commit()
+        conn.close()
+        if removed:
+            logger.debug(f"Pruned {removed} stale crawl frontier pages")
+        return removed
+
+    def __len__(self) -> int:
+        conn = sqlite3.connect(self.db_path)
+        count = conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        conn.close()
+        return count
+
+    def get_stats(self) -> Dict:
+        """Units served from the frontier since this process started, plus its size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "size": len(self),
+            "ttl_seconds": self.ttl_seconds
+        }
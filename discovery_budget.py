@@ -0,0 +1,134 @@
+"""
+Discovery Budgets - Deadlines, per-source progress and yield estimates.
+Lets a discovery cycle run against a time budget: sources are started in
+order of the yield per second they delivered before, whatever has not
+finished at the deadline is cancelled, and each source's completeness is
+reported alongside the feed built from what did arrive.
+"""
+import json
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from loguru import logger
+
+# SourceProgress.status values
+PENDING = "pending"
+RUNNING = "running"
+COMPLETE = "complete"
+CANCELLED = "cancelled"  # Started, cut off by the deadline
+SKIPPED = "skipped"  # Never started before the deadline
+FAILED = "failed"
+
+
+class DeadlineExpired(Exception):
+    """Raised by work that stops early because its deadline has passed."""
+
+
+class Deadline:
+    """A point in time a discovery cycle has to finish by (None = no limit)."""
+
+    def __init__(self, budget_seconds: Optional[float] = None):
+        self.budget_seconds = budget_seconds or None
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + self.budget_seconds if self.budget_seconds else None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, never negative; None when unbounded."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+@dataclass
+class SourceProgress:
+    """How far one source got during a cycle."""
+    name: str
+    status: str = PENDING
+    items: int = 0
+    pages: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    def as_dict(self) -> Dict:
+        data = asdict(self)
+        data["seconds"] = round(self.seconds, 3)
+        del data["name"]
+        return data
+
+
+def summarize(progress: Iterable[SourceProgress]) -> Dict:
+    """Counts per status plus each source's progress, for reports and stats."""
+    progress = list(progress)
+    counts: Dict[str, int] = {}
+    for entry in progress:
+        counts[entry.status] = counts.get(entry.status, 0) + 1
+    return {
+        "complete": counts.get(COMPLETE, 0) == len(progress),
+        "status_counts": counts,
+        "sources": {entry.name: entry.as_dict() for entry in progress}
+    }
+
+
+class YieldEstimator:
+    """
+    Exponentially weighted items-per-second per source.
+
+    Sources never measured rank first, so every source gets sampled once.
+    With a ``path`` the estimates persist between runs.
+    """
+
+    def __init__(self, alpha: float = 0.3, path: Optional[Union[str, Path]] = None):
+        self.alpha = alpha
+        self.path = Path(path) if path else None
+        self._rates: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def expected(self, name: str) -> Optional[float]:
+        """Estimated items per second, or None if never measured."""
+        return self._rates.get(name)
+
+    def record(self, name: str, items: int, seconds: float):
+        """Fold one completed (or cut-off) run of a source into its estimate."""
+        rate = items / max(seconds, 1e-3)
+        with self._lock:
+            previous = self._rates.get(name)
+            self._rates[name] = rate if previous is None else previous + self.alpha * (rate - previous)
+
+    def order(self, names: Iterable[str]) -> List[str]:
+        """Names sorted by expected yield, unmeasured first, ties in given order."""
+        names = list(names)
+        position = {name: index for index, name in enumerate(names)}
+        return sorted(names, key=lambda name: (
+            self._rates.get(name) is not None, -(self._rates.get(name) or 0.0), position[name]
+        ))
+
+    def save(self):
+        """Persist estimates (atomically) when a path is configured."""
+        if not self.path:
+            return
+        from feed_snapshot import atomic_write_bytes
+
+        with self._lock:
+            data = json.dumps(self._rates, sort_keys=True).encode("utf-8")
+        try:
+            atomic_write_bytes(self.path, data)
+        except OSError as e:
+            logger.warning(f"Could not save source yield estimates: {e}")
+
+    def _load(self):
+        if not (self.path and self.path.exists()):
+            return
+        try:
+            self._rates = {name: float(rate) for name, rate in json.loads(self.path.read_text()).items()}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable source yield estimates: {e}")
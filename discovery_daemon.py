@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Resident Discovery Daemon
+Keeps one CounterExposureEngine (clients, tracker, candidate pool) alive on a
+persistent event loop and runs discovery cycles on a schedule, so callers read
+the latest precomputed feed instead of triggering a cold pipeline.
+"""
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from config import config
+from exposure_engine import CounterExposureEngine
+
+
+@dataclass(frozen=True)
+class EngineFeed:
+    """An immutable, fully built feed published by the daemon."""
+    items: Tuple[Dict, ...] = ()
+    cycle: int = 0
+    generated_at: Optional[float] = None
+    duration_seconds: float = 0.0
+    stats: Dict = field(default_factory=dict)
+    profiles: Dict[str, Tuple[Dict, ...]] = field(default_factory=dict)  # Feed per configured profile
+
+
+class DiscoveryDaemon:
+    """Runs engine discovery cycles on a background event loop."""
+
+    def __init__(self, engine: Optional[CounterExposureEngine] = None,
+                 interval_seconds: Optional[int] = None, feed_count: Optional[int] = None):
+        self.engine = engine or CounterExposureEngine()
+        self.interval_seconds = interval_seconds or config.ENGINE_DAEMON_INTERVAL
+        self.feed_count = feed_count or config.ENGINE_DAEMON_FEED_COUNT
+        self.last_error: Optional[str] = None
+
+        self._snapshot = EngineFeed(stats=self.engine.get_stats())
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._cycle_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def latest_feed(self) -> EngineFeed:
+        """Most recent published feed; a plain attribute read, never blocks."""
+        return self._snapshot
+
+    def get_stats(self) -> Dict:
+        """
+        Engine statistics captured at the end of the last cycle.
+
+        While the loop is not running nothing refreshes that capture (other
+        processes may still be recording exposures), so the engine is queried
+        live instead.
+        """
+        snapshot = self._snapshot
+        return {
+            **(snapshot.stats if self.running else self.engine.get_stats()),
+            "daemon": {
+                "running": self.running,
+                "cycle": snapshot.cycle,
+                "generated_at": snapshot.generated_at,
+                "duration_seconds": round(snapshot.duration_seconds, 3),
+                "interval_seconds": self.interval_seconds,
+                "last_error": self.last_error
+            }
+        }
+
+    def start(self, run_immediately: bool = True) -> "DiscoveryDaemon":
+        """Start the event loop thread and the discovery schedule."""
+        if self.running:
+            return self
+
+        self._stopping = False
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run_loop():
+            asyncio.set_event_loop(self._loop)
+            self._loop.create_task(self._schedule(run_immediately))
+            started.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run_loop, name="discovery-daemon", daemon=True)
+        self._thread.start()
+        started.wait()
+        logger.info(f"Discovery daemon started (every {self.interval_seconds}s, {self.feed_count} streams per feed)")
+        return self
+
+    def stop(self, timeout: float = 10.0):
+        """Stop scheduling cycles and shut down the event loop."""
+        if not self.running:
+            return
+        self._stopping = True
+
+        def shutdown():
+            for task in asyncio.all_tasks(self._loop):
+                task.cancel()
+            self._loop.call_soon(self._loop.stop)
+
+        self._loop.call_soon_threadsafe(shutdown)
+        self._thread.join(timeout)
+        logger.info("Discovery daemon stopped")
+
+    def trigger(self) -> Future:
+        """Run a cycle now on the daemon loop; returns a future with the new snapshot."""
+        if not self.running:
+            raise RuntimeError("Discovery daemon is not running")
+        return asyncio.run_coroutine_threadsafe(self.run_cycle(), self._loop)
+
+    async def run_cycle(self) -> EngineFeed:
+        """Run one discovery cycle and publish its feed."""
+        async with self._cycle_lock:
+            started = time.time()
+            budget = config.ENGINE_CYCLE_BUDGET or None
+            try:
+                profiles = {}
+                if self.engine.profiles:
+                    # One discovery pass serves every profile; the first one is the main feed
+                    feeds = await self.engine.generate_profile_feeds_async(budget_seconds=budget)
+                    profiles = {name: tuple(items) for name, items in feeds.items()}
+                    items = next(iter(feeds.values()))
+                else:
+                    items = await self.engine.generate_exposure_feed_async(self.feed_count, budget)
+                self.last_error = None
+            except Exception as e:
+                logger.error(f"Discovery cycle failed: {e}")
+                self.last_error = str(e)
+                return self._snapshot
+
+            self._snapshot = EngineFeed(
+                items=tuple(items),
+                cycle=self._snapshot.cycle + 1,
+                generated_at=time.time(),
+                duration_seconds=time.time() - started,
+                stats=self.engine.get_stats(),
+                profiles=profiles
+            )
+            logger.info(f"Discovery cycle {self._snapshot.cycle} published {len(items)} streams")
+            return self._snapshot
+
+    async def _schedule(self, run_immediately: bool):
+        """Run cycles every ``interval_seconds`` until stopped."""
+        if not run_immediately:
+            await asyncio.sleep(self.interval_seconds)
+        while not self._stopping:
+            await self.run_cycle()
+            await asyncio.sleep(self.interval_seconds)
+
+
+_default_daemon: Optional[DiscoveryDaemon] = None
+_default_lock = threading.Lock()
+
+
+def get_daemon() -> DiscoveryDaemon:
+    """Process-wide daemon instance, created on first use (not started)."""
+    global _default_daemon
+    with _default_lock:
+        if _default_daemon is None:
+            _default_daemon = DiscoveryDaemon()
+        return _default_daemon
+
+
+if __name__ == "__main__":
+    daemon = get_daemon().start()
+    try:
+        while True:
+            time.sleep(daemon.interval_seconds)
+            print(json.dumps(daemon.get_stats(), indent=2))
+    except KeyboardInterrupt:
+        daemon.stop()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Distributed Discovery Workers
+Splits a discovery cycle into jobs (one per YouTube search term, Twitch
+language partition and reverse-search query) on the shared job queue.
+Worker processes - local or on other nodes sharing the queue database -
+claim and run them, and the coordinator merges their results into one
+published feed.
+
+Usage:
+    python discovery_workers.py coordinator --workers 4
+    python discovery_workers.py worker            # join from another node
+"""
+import argparse
+import multiprocessing
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from config import config
+from job_queue import Job, JobQueue, worker_id
+
+YOUTUBE_TERM = "youtube_term"
+TWITCH_PARTITION = "twitch_partition"
+REVERSE_QUERY = "reverse_query"
+
+
+def default_queue() -> JobQueue:
+    """Job queue configured from the environment."""
+    return JobQueue(
+        db_path=config.JOB_QUEUE_DB,
+        visibility_timeout=config.JOB_VISIBILITY_TIMEOUT,
+        max_attempts=config.JOB_MAX_ATTEMPTS,
+        journal_mode=config.JOB_QUEUE_JOURNAL_MODE
+    )
+
+
+def stream_item(stream, score: float) -> Dict:
+    """
+    Feed item for a live Twitch stream, in the SimpleWebUI item format.
+
+    Args:
+        stream: The live stream
+        score: Its underexposure score from the engine's FairnessScheduler
+    """
+    return {
+        'title': stream.title,
+        'channel': stream.channel_name,
+        'url': stream.url,
+        'thumbnail': stream.thumbnail_url or '',
+        'description': ', '.join(stream.tags),
+        'view_count': stream.viewer_count,
+        'published': stream.started_at,
+        'platform': stream.platform.title(),
+        'is_live': True,
+        'category': stream.language or 'twitch',
+        'underexposure_score': round(score, 3)
+    }
+
+
+class DiscoveryWorker:
+    """Claims discovery jobs from the queue and runs them."""
+
+    def __init__(self, queue: Optional[JobQueue] = None, owner: Optional[str] = None):
+        self.queue = queue or default_queue()
+        self.owner = owner or worker_id()
+        self.handlers = {
+            YOUTUBE_TERM: self._youtube_term,
+            TWITCH_PARTITION: self._twitch_partition,
+            REVERSE_QUERY: self._reverse_query,
+        }
+        self._ui = None
+        self._youtube = None
+        self._twitch = None
+        self._tracker = None
+        self.processed = 0
+        self.failed = 0
+
+    @property
+    def ui(self):
+        """SimpleWebUI (and its validator), built on the first job that needs it."""
+        if self._ui is None:
+            from simple_web_ui import SimpleWebUI
+            self._ui = SimpleWebUI()
+        return self._ui
+
+    def _youtube_term(self, payload: Dict) -> List[Dict]:
+        api_key = self.ui.get_api_key(interactive=False)
+        if not api_key:
+            return []
+        if self._youtube is None:
+            from youtube_client import YouTubeDiscovery
+            self._youtube = YouTubeDiscovery(api_key=api_key)
+        return self.ui.discover_youtube_term(self._youtube, api_key, payload["term"])
+
+    def _twitch_partition(self, payload: Dict) -> List[Dict]:
+        """
+        Live streams of one language, or of every language not in
+        ``payload["exclude"]`` when ``payload["language"]`` is None, scored
+        and filtered like the engine does.
+        """
+        from exposure_engine import ExposureTracker, FairnessScheduler
+
+        if self._twitch is None:
+            from twitch_client import TwitchDiscovery
+            self._twitch = TwitchDiscovery()
+        if self._tracker is None:
+            self._tracker = ExposureTracker(config.EXPOSURE_TRACKER_DB)
+
+        scheduler = FairnessScheduler(max_viewer_threshold=payload.get("max_viewers", 5))
+        excluded = set(payload.get("exclude", ()))
+        items = []
+        page_token = None
+        for _ in range(config.MAX_PAGES):
+            streams, page_token = self._twitch.fetch_live_streams(
+                language=payload.get("language"), page_token=page_token
+            )
+            streams = [stream for stream in streams if stream.language not in excluded]
+            items.extend(stream_item(stream, score)
+                         for stream, score in scheduler.filter_eligible_streams(streams, self._tracker))
+            if not page_token:
+                break
+        return items
+
+    def _reverse_query(self, payload: Dict) -> List[Dict]:
+        return self.ui.discover_reverse([payload["query"]])
+
+    def run_job(self, job: Job) -> bool:
+        """
+        Run one claimed job, keeping its lease alive while it works.
+
+        Returns:
+            True if the job completed and its result was stored
+        """
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            self.queue.fail(job, self.owner, f"unknown job kind '{job.kind}'")
+            self.failed += 1
+            return False
+
+        stop_heartbeat = threading.Event()
+
+        def heartbeat():
+            while not stop_heartbeat.wait(self.queue.visibility_timeout / 3):
+                if not self.queue.extend(job, self.owner):
+                    return
+
+        beat = threading.Thread(target=heartbeat, daemon=True)
+        beat.start()
+        try:
+            result = handler(job.payload)
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+            self.queue.fail(job, self.owner, str(e))
+            self.failed += 1
+            return False
+        finally:
+            stop_heartbeat.set()
+
+        if not self.queue.complete(job, self.owner, result):
+            logger.warning(f"Job {job.id} lease was lost before completion; result discarded")
+            return False
+        self.processed += 1
+        return True
+
+    def run(self, batch: Optional[str] = None, poll_interval: float = 1.0,
+            stop: Optional[threading.Event] = None) -> int:
+        """
+        Claim and run jobs until stopped.
+
+        Args:
+            batch: When set, exit once this batch is finished
+            poll_interval: Seconds to wait when no job is visible
+            stop: Optional event that ends the loop
+
+        Returns:
+            Number of jobs completed
+        """
+        logger.info(f"Discovery worker {self.owner} started")
+        while not (stop and stop.is_set()):
+            job = self.queue.claim(self.owner)
+            if job is not None:
+                self.run_job(job)
+                continue
+            if batch is not None and self.queue.is_finished(batch):
+                break
+            time.sleep(poll_interval)
+        logger.info(f"Discovery worker {self.owner} done: {self.processed} completed, {self.failed} failed")
+        return self.processed
+
+
+def _worker_process(batch: Optional[str]):
+    """Entry point of a spawned local worker process."""
+    DiscoveryWorker().run(batch=batch)
+
+
+class DiscoveryCoordinator:
+    """Enqueues discovery cycles and merges worker results into the feed."""
+
+    def __init__(self, queue: Optional[JobQueue] = None):
+        self.queue = queue or default_queue()
+
+    def plan_jobs(self) -> List[Tuple[str, Dict]]:
+        """Units of work for one discovery cycle."""
+        from simple_web_ui import REVERSE_QUERIES, SEARCH_TERMS
+
+        jobs = []
+        if config.YOUTUBE_API_KEY:
+            jobs.extend((YOUTUBE_TERM, {"term": term}) for term in dict.fromkeys(SEARCH_TERMS))
+        if config.TWITCH_CLIENT_ID and config.TWITCH_OAUTH_TOKEN:
+            languages = [lang.strip() for lang in config.TWITCH_PARTITION_LANGUAGES.split(",") if lang.strip()]
+            jobs.extend((TWITCH_PARTITION, {"language": lang}) for lang in languages)
+            # Streams in every other language
+            jobs.append((TWITCH_PARTITION, {"language": None, "exclude": languages}))
+        jobs.extend((REVERSE_QUERY, {"query": query}) for query in REVERSE_QUERIES)
+        return jobs
+
+    def enqueue_cycle(self) -> str:
+        """Enqueue one cycle's jobs and return its batch id."""
+        batch = f"cycle-{int(time.time())}-{uuid.uuid4().hex[:6]}"
+        self.queue.enqueue(batch, self.plan_jobs())
+        return batch
+
+    def wait(self, batch: str, timeout: Optional[float] = None, poll_interval: float = 2.0) -> bool:
+        """Wait for a batch to finish; False if the timeout ran out first."""
+        deadline = None if timeout is None else time.time() + timeout
+        while not self.queue.is_finished(batch):
+            if deadline is not None and time.time() >= deadline:
+                return False
+            time.sleep(poll_interval)
+        return True
+
+    def merge(self, batch: str) -> List[Dict]:
+        """Combine the batch's results, keeping the best-scored copy of each URL."""
+        merged: Dict[str, Dict] = {}
+        for items in self.queue.results(batch):
+            for item in items:
+                current = merged.get(item['url'])
+                if current is None or item['underexposure_score'] > current['underexposure_score']:
+                    merged[item['url']] = item
+        return list(merged.values())
+
+    def run_cycle(self, workers: int = 0, timeout: Optional[float] = None):
+        """
+        Run a full cycle: enqueue, let workers drain it, merge and publish.
+
+        Args:
+            workers: Local worker processes to start for this cycle (0 relies
+                on workers that are already running, e.g. started with
+                ``python discovery_workers.py worker``)
+            timeout: Give up waiting after this many seconds and publish
+                whatever has completed
+
+        Returns:
+            The merged, ranked feed items
+        """
+        from simple_web_ui import SimpleWebUI
+
+        batch = self.enqueue_cycle()
+        # Not daemonic: daemonic processes may not start children, so their
+        # reverse searches could not parse on a ParsePool. They are joined
+        # below instead, and terminated if the wait is cut short.
+        processes = [multiprocessing.Process(target=_worker_process, args=(batch,)) for _ in range(workers)]
+        for process in processes:
+            process.start()
+
+        finished = False
+        try:
+            finished = self.wait(batch, timeout)
+        finally:
+            for process in processes:
+                if not finished:
+                    process.terminate()  # Their leases expire and the jobs are retried next time
+                process.join()
+
+        status = self.queue.batch_status(batch)
+        logger.info(f"Batch {batch} {'finished' if finished else 'timed out'}: {status}")
+
+        ui = SimpleWebUI()
+        content = ui.finalize(self.merge(batch))
+        ui.publish(content)
+        return content
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Distributed discovery workers')
+    parser.add_argument('role', choices=['coordinator', 'worker'])
+    parser.add_argument('--workers', type=int, default=max(1, config.DISCOVERY_WORKERS or multiprocessing.cpu_count()),
+                        help='Local worker processes started by the coordinator')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='Seconds the coordinator waits before publishing partial results')
+    args = parser.parse_args()
+
+    if args.role == 'worker':
+        try:
+            DiscoveryWorker().run()
+        except KeyboardInterrupt:
+            pass
+    else:
+        content = DiscoveryCoordinator().run_cycle(workers=args.workers, timeout=args.timeout)
+        print(f"\n✅ Published {len(content)} items")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,46 @@ Counter-Exposure Engine - Main orchestration module
 Discovers and surfaces underexposed live streams across platforms.
 """
 import asyncio
+import gzip
+import heapq
+import os
+import re
 import sqlite3
 import time
 import json
-from typing import List, Dict, Set, Optional, Tuple
+from typing import Callable, List, Dict, Set, Optional, Sequence, Tuple
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime, timedelta
+from pathlib import Path
 from loguru import logger
 import random
 
-from youtube_client import YouTubeDiscovery
-from twitch_client import TwitchDiscovery
-from base_client import Stream
+from base_client import BaseDiscoveryClient, Stream
+from candidate_pool import CandidatePool
 from config import config
+from discovery_budget import (
+    CANCELLED, COMPLETE, FAILED, PENDING, RUNNING, SKIPPED, Deadline, DeadlineExpired, SourceProgress, YieldEstimator,
+    summarize
+)
+from feed_profiles import FeedProfile, load_profiles
+from pipeline import Pipeline, Stage
+from sources import SourceRegistry, default_registry
+
+np = None  # numpy, imported on first batch scoring call
+
+
+def _numpy():
+    """Import numpy on first use; returns None when it is not installed."""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+        np = numpy
+    return np
 
 
 @dataclass
@@ -30,19 +57,110 @@ class ExposureRecord:
 
 
 class ExposureTracker:
-    """Tracks which streams have been exposed to prevent repeats."""
+    """Tracks which streams have been exposed to prevent repeats.
+
+    Exposures are stored in one table per local day (``exposures_YYYYMMDD``)
+    so the hot path only ever reads and writes today's small partition.
+    Partitions older than ``hot_days`` are compacted into gzip-compressed
+    columnar archive files that ``get_exposure_stats`` still reads for
+    longer windows.
+    """
+    
+    PARTITION_PREFIX = "exposures_"
+    ARCHIVE_SUFFIX = ".json.gz"
+    ARCHIVE_FORMAT = "exposures-columnar/1"
+    COLUMNS = ("stream_id", "platform", "channel_name", "exposed_at", "score", "viewer_count")
+    STATS_CHUNK = 100  # Partitions per UNION ALL; SQLite caps a compound SELECT at 500 terms
     
-    def __init__(self, db_path: str = "exposure_tracker.db"):
+    def __init__(self, db_path: str = "exposure_tracker.db", archive_dir: Optional[str] = None,
+                 hot_days: Optional[int] = None, archive_retention_days: Optional[int] = None):
         self.db_path = db_path
-        self._init_database()
+        self.archive_dir = Path(archive_dir) if archive_dir else Path(db_path).parent / config.EXPOSURE_ARCHIVE_DIR
+        self.hot_days = config.EXPOSURE_HOT_DAYS if hot_days is None else hot_days
+        self.archive_retention_days = (
+            config.EXPOSURE_ARCHIVE_RETENTION_DAYS if archive_retention_days is None else archive_retention_days
+        )
+        self._partitions: Set[str] = set()
         self._exposed_today: Set[str] = set()
+        self._today_partition = ""
+        self._today_end = 0.0
+        self._init_database()
+        self.compact_partitions()
         self._load_today_exposures()
     
+    @classmethod
+    def partition_for(cls, timestamp: float) -> str:
+        """Name of the daily partition table holding a given timestamp."""
+        return f"{cls.PARTITION_PREFIX}{datetime.fromtimestamp(timestamp):%Y%m%d}"
+    
+    @classmethod
+    def _partition_day(cls, partition: str) -> datetime:
+        """Local midnight of the day a partition covers."""
+        return datetime.strptime(partition[len(cls.PARTITION_PREFIX):], "%Y%m%d")
+    
+    @classmethod
+    def _is_partition(cls, name: str) -> bool:
+        """Whether a table or archive name is a daily partition's (``exposures_1`` is not)."""
+        if not name.startswith(cls.PARTITION_PREFIX) or not re.fullmatch(r"\d{8}", name[len(cls.PARTITION_PREFIX):]):
+            return False
+        try:
+            cls._partition_day(name)
+        except ValueError:
+            logger.debug(f"Ignoring {name}: not a partition date")
+            return False
+        return True
+    
     def _init_database(self):
-        """Initialize SQLite database for exposure tracking."""
+        """Initialize SQLite database and discover existing partitions."""
         conn = sqlite3.connect(self.db_path)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS exposures (
+        self._refresh_partitions(conn)
+        self._migrate_legacy_table(conn)
+        conn.commit()
+        conn.close()
+    
+    def _refresh_partitions(self, conn: sqlite3.Connection):
+        """
+        Reload the partition names from the database.
+        
+        Other processes sharing the database create and compact partitions
+        too, so the cached set is refreshed whenever it may have missed one.
+        """
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE ? ESCAPE '\\'",
+            (self.PARTITION_PREFIX.replace("_", "\\_") + "%",)
+        )
+        self._partitions = {name for (name,) in cursor.fetchall() if self._is_partition(name)}
+    
+    def _migrate_legacy_table(self, conn: sqlite3.Connection):
+        """Move rows from the old unpartitioned ``exposures`` table into daily partitions."""
+        legacy = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'exposures'"
+        ).fetchone()
+        if not legacy:
+            return
+        
+        rows = conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM exposures").fetchall()
+        by_partition: Dict[str, List[Tuple]] = {}
+        for row in rows:
+            by_partition.setdefault(self.partition_for(row[3]), []).append(row)
+        
+        for partition, partition_rows in by_partition.items():
+            self._ensure_partition(conn, partition)
+            conn.executemany(
+                f"INSERT INTO {partition} ({', '.join(self.COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                partition_rows
+            )
+        
+        conn.execute("DROP TABLE exposures")
+        logger.info(f"Migrated {len(rows)} legacy exposures into {len(by_partition)} daily partitions")
+    
+    def _ensure_partition(self, conn: sqlite3.Connection, partition: str):
+        """Create a daily partition table (and its lookup index) if needed."""
+        if partition in self._partitions:
+            return
+        
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {partition} (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 stream_id TEXT NOT NULL,
                 platform TEXT NOT NULL,
@@ -53,34 +171,49 @@ class ExposureTracker:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_stream_platform ON exposures(stream_id, platform)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_exposed_at ON exposures(exposed_at)")
-        conn.commit()
-        conn.close()
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{partition}_stream ON {partition}(stream_id, platform)")
+        self._partitions.add(partition)
     
     def _load_today_exposures(self):
         """Load today's exposures into memory for fast lookup."""
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+        now = time.time()
+        today_start = datetime.fromtimestamp(now).replace(hour=0, minute=0, second=0, microsecond=0)
+        self._today_partition = self.partition_for(now)
+        self._today_end = (today_start + timedelta(days=1)).timestamp()
+        self._exposed_today = set()
         
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute(
-            "SELECT stream_id, platform FROM exposures WHERE exposed_at >= ?",
-            (today_start,)
-        )
-        
-        for stream_id, platform in cursor.fetchall():
-            self._exposed_today.add(f"{platform}:{stream_id}")
-        
+        if self._today_partition not in self._partitions:
+            self._refresh_partitions(conn)
+        if self._today_partition in self._partitions:
+            cursor = conn.execute(f"SELECT stream_id, platform FROM {self._today_partition}")
+            
+            for stream_id, platform in cursor.fetchall():
+                self._exposed_today.add(f"{platform}:{stream_id}")
         conn.close()
         logger.info(f"Loaded {len(self._exposed_today)} exposures from today")
     
+    def _roll_day_if_needed(self):
+        """Switch to a new current partition after local midnight."""
+        if time.time() >= self._today_end:
+            self._load_today_exposures()
+            self.compact_partitions()
+    
+    def exposed_flags(self, streams: List[Stream]) -> List[bool]:
+        """Check a batch of streams against today's exposures in one pass."""
+        self._roll_day_if_needed()
+        exposed = self._exposed_today
+        return [f"{stream.platform}:{stream.stream_id}" in exposed for stream in streams]
+    
     def is_exposed_today(self, stream: Stream) -> bool:
         """Check if stream was already exposed today."""
+        self._roll_day_if_needed()
         key = f"{stream.platform}:{stream.stream_id}"
         return key in self._exposed_today
     
     def record_exposure(self, stream: Stream, score: float):
         """Record that a stream was exposed."""
+        self._roll_day_if_needed()
         record = ExposureRecord(
             stream_id=stream.stream_id,
             platform=stream.platform,
@@ -89,10 +222,12 @@ class ExposureTracker:
             score=score,
             viewer_count=stream.viewer_count
         )
+        partition = self.partition_for(record.exposed_at)
         
         conn = sqlite3.connect(self.db_path)
-        conn.execute("""
-            INSERT INTO exposures 
+        self._ensure_partition(conn, partition)
+        conn.execute(f"""
+            INSERT INTO {partition}
             (stream_id, platform, channel_name, exposed_at, score, viewer_count)
             VALUES (?, ?, ?, ?, ?, ?)
         """, (
@@ -108,47 +243,271 @@ class ExposureTracker:
         
         logger.info(f"Recorded exposure: {stream.platform}:{stream.channel_name}")
     
+    def _archive_path(self, partition: str) -> Path:
+        return self.archive_dir / f"{partition}{self.ARCHIVE_SUFFIX}"
+    
+    def _archived_partitions(self) -> List[str]:
+        """Names of partitions that have been compacted to archive files."""
+        if not self.archive_dir.exists():
+            return []
+        names = (path.name[:-len(self.ARCHIVE_SUFFIX)]
+                 for path in self.archive_dir.glob(f"{self.PARTITION_PREFIX}*{self.ARCHIVE_SUFFIX}"))
+        return sorted(name for name in names if self._is_partition(name))
+    
+    def _write_archive(self, partition: str, rows: List[Tuple]):
+        """Write a partition's rows to a compressed column-oriented archive file."""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": self.ARCHIVE_FORMAT,
+            "partition": partition,
+            "rows": len(rows),
+            "columns": {name: [row[i] for row in rows] for i, name in enumerate(self.COLUMNS)}
+        }
+        
+        path = self._archive_path(partition)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=9) as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    
+    def _read_archive(self, partition: str) -> Dict[str, list]:
+        """Read the columns of an archived partition."""
+        with gzip.open(self._archive_path(partition), "rt", encoding="utf-8") as f:
+            return json.load(f)["columns"]
+    
+    def compact_partitions(self, now: Optional[float] = None) -> List[str]:
+        """
+        Apply the retention policy to old partitions.
+        
+        Partitions older than ``hot_days`` are written to archive files and
+        dropped from SQLite. Archives older than ``archive_retention_days`` are
+        deleted (0 keeps them forever).
+        
+        Returns:
+            Names of the partitions compacted in this call
+        """
+        now = now or time.time()
+        today = datetime.fromtimestamp(now).replace(hour=0, minute=0, second=0, microsecond=0)
+        hot_cutoff = today - timedelta(days=self.hot_days)
+        
+        compacted = []
+        conn = sqlite3.connect(self.db_path)
+        self._refresh_partitions(conn)
+        stale = sorted(p for p in self._partitions if self._partition_day(p) < hot_cutoff)
+        if stale:
+            for partition in stale:
+                rows = conn.execute(
+                    f"SELECT {', '.join(self.COLUMNS)} FROM {partition} ORDER BY id"
+                ).fetchall()
+                if self._archive_path(partition).exists():
+                    # Partition was re-created after an earlier compaction; merge
+                    columns = self._read_archive(partition)
+                    rows = list(zip(*(columns[name] for name in self.COLUMNS))) + rows
+                self._write_archive(partition, rows)
+                conn.execute(f"DROP TABLE {partition}")
+                conn.commit()
+                self._partitions.discard(partition)
+                compacted.append(partition)
+            logger.info(f"Compacted {len(compacted)} exposure partitions into {self.archive_dir}")
+        conn.close()
+        
+        if self.archive_retention_days > 0:
+            archive_cutoff = today - timedelta(days=self.archive_retention_days)
+            for partition in self._archived_partitions():
+                if self._partition_day(partition) < archive_cutoff:
+                    self._archive_path(partition).unlink()
+                    logger.info(f"Deleted expired exposure archive {partition}")
+        
+        return compacted
+    
     def get_exposure_stats(self, days: int = 7) -> Dict:
         """Get exposure statistics for the last N days."""
         cutoff = time.time() - (days * 24 * 3600)
+        cutoff_day = datetime.fromtimestamp(cutoff).replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        # platform -> [count, score_sum, viewer_sum]
+        totals: Dict[str, List[float]] = {}
+        
+        def add(platform: str, count: int, score_sum: float, viewer_sum: float):
+            entry = totals.setdefault(platform, [0, 0.0, 0.0])
+            entry[0] += count
+            entry[1] += score_sum
+            entry[2] += viewer_sum
         
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("""
-            SELECT platform, COUNT(*) as count, AVG(score) as avg_score, AVG(viewer_count) as avg_viewers
-            FROM exposures 
-            WHERE exposed_at >= ?
-            GROUP BY platform
-        """, (cutoff,))
+        self._refresh_partitions(conn)
+        live = [p for p in sorted(self._partitions) if self._partition_day(p) >= cutoff_day]
+        for start in range(0, len(live), self.STATS_CHUNK):
+            chunk = live[start:start + self.STATS_CHUNK]
+            query = " UNION ALL ".join(
+                f"SELECT platform, COUNT(*), SUM(score), SUM(viewer_count) FROM {p} "
+                f"WHERE exposed_at >= ? GROUP BY platform"
+                for p in chunk
+            )
+            for row in conn.execute(query, (cutoff,) * len(chunk)).fetchall():
+                add(*row)
+        conn.close()
+        
+        for partition in self._archived_partitions():
+            if self._partition_day(partition) < cutoff_day:
+                continue
+            columns = self._read_archive(partition)
+            for platform, exposed_at, score, viewers in zip(
+                columns["platform"], columns["exposed_at"], columns["score"], columns["viewer_count"]
+            ):
+                if exposed_at >= cutoff:
+                    add(platform, 1, score, viewers)
         
         stats = {}
-        for platform, count, avg_score, avg_viewers in cursor.fetchall():
+        for platform, (count, score_sum, viewer_sum) in totals.items():
             stats[platform] = {
                 "count": count,
-                "avg_score": round(avg_score, 2),
-                "avg_viewers": round(avg_viewers, 1)
+                "avg_score": round(score_sum / count, 2),
+                "avg_viewers": round(viewer_sum / count, 1)
             }
         
-        conn.close()
         return stats
 
 
+class FairnessAllocator:
+    """
+    Deficit round-robin slot allocation across diversity groups.
+    
+    Every cycle each group with candidates earns a quantum of slots
+    proportional to its weight, and slots go one at a time to the group with
+    the largest accumulated deficit. Deficits persist in the tracker database,
+    so a group that is short-changed in one cycle is paid back in the next
+    and exposure stays proportional over the long run. Allocation is
+    O(g + k log g) for g active groups and k slots.
+    
+    Allocators sharing a database keep separate deficits under different
+    namespaces (one per feed profile, for example).
+    """
+    
+    def __init__(self, db_path: str = "exposure_tracker.db", max_deficit: float = 50.0,
+                 namespace: str = ""):
+        self.db_path = db_path
+        self.max_deficit = max_deficit
+        self.namespace = namespace
+        self._deficits: Dict[str, float] = {}
+        self._served: Dict[str, int] = {}
+        self._init_database()
+    
+    def _init_database(self):
+        """Create the deficit table and load persisted counters."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS fairness_deficits (
+                group_key TEXT PRIMARY KEY,
+                deficit REAL NOT NULL,
+                served INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )
+        """)
+        conn.commit()
+        for stored_key, deficit, served in conn.execute(
+            "SELECT group_key, deficit, served FROM fairness_deficits"
+        ).fetchall():
+            # Group keys hold no "/", so the namespace is everything before the last one
+            namespace, _, group_key = stored_key.rpartition("/")
+            if namespace == self.namespace:
+                self._deficits[group_key] = deficit
+                self._served[group_key] = served
+        conn.close()
+    
+    def _stored_key(self, group_key: str) -> str:
+        return f"{self.namespace}/{group_key}" if self.namespace else group_key
+    
+    def allocate(self, group_sizes: Dict[str, int], count: int,
+                 weights: Optional[Dict[str, float]] = None) -> Dict[str, int]:
+        """
+        Split ``count`` slots across groups.
+        
+        Args:
+            group_sizes: Number of candidates available per group key
+            count: Slots to hand out this cycle
+            weights: Optional relative share per group key (default 1.0)
+            
+        Returns:
+            Number of slots granted per group key
+        """
+        weights = weights or {}
+        active = [key for key, size in group_sizes.items() if size > 0 and weights.get(key, 1.0) > 0]
+        if not active or count <= 0:
+            return {}
+        
+        total_weight = sum(weights.get(key, 1.0) for key in active)
+        for key in active:
+            quantum = count * weights.get(key, 1.0) / total_weight
+            self._deficits[key] = self._deficits.get(key, 0.0) + quantum
+        
+        # Random tie-break so equal deficits do not always favour the same key
+        heap = [(-self._deficits[key], random.random(), key) for key in active]
+        heapq.heapify(heap)
+        
+        quotas: Dict[str, int] = {}
+        remaining = count
+        while heap and remaining:
+            _, tie, key = heapq.heappop(heap)
+            quotas[key] = quotas.get(key, 0) + 1
+            self._deficits[key] -= 1
+            remaining -= 1
+            if quotas[key] < group_sizes[key]:
+                heapq.heappush(heap, (-self._deficits[key], tie, key))
+        
+        for key in active:
+            self._deficits[key] = max(-self.max_deficit, min(self.max_deficit, self._deficits[key]))
+            self._served[key] = self._served.get(key, 0) + quotas.get(key, 0)
+        self._persist(active)
+        
+        return quotas
+    
+    def _persist(self, keys: List[str]):
+        """Write the counters of the given groups back to the database."""
+        now = time.time()
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany("""
+            INSERT INTO fairness_deficits (group_key, deficit, served, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(group_key) DO UPDATE SET
+                deficit = excluded.deficit,
+                served = excluded.served,
+                updated_at = excluded.updated_at
+        """, [(self._stored_key(key), self._deficits[key], self._served[key], now) for key in keys])
+        conn.commit()
+        conn.close()
+    
+    def get_stats(self) -> Dict:
+        """Get allocator statistics."""
+        return {
+            "groups": len(self._deficits),
+            "total_served": sum(self._served.values())
+        }
+
+
 class FairnessScheduler:
     """Ensures fair exposure across different categories and platforms."""
     
-    def __init__(self, max_viewer_threshold: int = 5):
+    PLATFORM_CODES = {"youtube": 0, "twitch": 1}
+    UNKNOWN_PLATFORM_CODE = -1
+    BATCH_MIN_STREAMS = 64  # Below this the scalar path is cheaper than building arrays
+    
+    def __init__(self, max_viewer_threshold: int = 5, allocator: Optional[FairnessAllocator] = None):
         self.max_viewer_threshold = max_viewer_threshold
         self.freshness_window_minutes = 30
+        self.allocator = allocator
     
-    def calculate_underexposure_score(self, stream: Stream) -> float:
+    def calculate_underexposure_score(self, stream: Stream, now: Optional[float] = None) -> float:
         """Calculate how underexposed a stream is (higher = more underexposed)."""
         if not stream.started_at:
             return 0.0
+        now = time.time() if now is None else now
         
         # Base score inversely related to viewer count
         viewer_score = max(0, (self.max_viewer_threshold - stream.viewer_count) / self.max_viewer_threshold)
         
         # Freshness bonus (newer streams get higher priority)
-        stream_age_minutes = (time.time() - stream.started_at) / 60
+        stream_age_minutes = (now - stream.started_at) / 60
         freshness_score = max(0, (self.freshness_window_minutes - stream_age_minutes) / self.freshness_window_minutes)
         
         # Platform diversity bonus (slight preference for less common platforms)
@@ -159,8 +518,116 @@ class FairnessScheduler:
         
         return min(1.0, max(0.0, total_score))
     
-    def filter_eligible_streams(self, streams: List[Stream], tracker: ExposureTracker) -> List[Tuple[Stream, float]]:
+    def priority(self, stream: Stream) -> float:
+        """
+        Time-independent ranking key for pooled streams.
+        
+        Inside its freshness window a stream's score is this key minus
+        ``0.3 * now / window`` (the sum never reaches the 1.0 clamp), so
+        streams scored at different times order by key exactly as they would
+        by score at any single moment.
+        """
+        if not stream.started_at:
+            return float("-inf")
+        viewer_score = max(0, (self.max_viewer_threshold - stream.viewer_count) / self.max_viewer_threshold)
+        platform_bonus = 0.1 if stream.platform != "youtube" else 0.0
+        return (viewer_score * 0.6) + platform_bonus + 0.3 * stream.started_at / (self.freshness_window_minutes * 60)
+    
+    def eligible_until(self, stream: Stream) -> float:
+        """
+        Time at which a stream stops being eligible, assuming its viewer count holds.
+        
+        That is the earlier of the end of its freshness window and the moment
+        its decaying freshness bonus drops the score to the 0.1 minimum.
+        """
+        if not stream.started_at:
+            return 0.0
+        viewer_score = max(0, (self.max_viewer_threshold - stream.viewer_count) / self.max_viewer_threshold)
+        platform_bonus = 0.1 if stream.platform != "youtube" else 0.0
+        required_freshness = max(0.0, (0.1 - viewer_score * 0.6 - platform_bonus) / 0.3)
+        return stream.started_at + self.freshness_window_minutes * 60 * (1 - required_freshness)
+    
+    @classmethod
+    def encode_platforms(cls, platforms: Sequence[str]) -> "np.ndarray":
+        """Map platform names to the integer codes used by ``score_batch``."""
+        if _numpy() is None:
+            raise RuntimeError("numpy is required for batch scoring")
+        return np.fromiter(
+            (cls.PLATFORM_CODES.get(p, cls.UNKNOWN_PLATFORM_CODE) for p in platforms),
+            dtype=np.int16, count=len(platforms)
+        )
+    
+    def score_batch(
+        self,
+        viewer_counts: Sequence[int],
+        started_at: Sequence[float],
+        platform_codes: Sequence[int],
+        exposed: Optional[Sequence[bool]] = None,
+        now: Optional[float] = None
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Score a batch of streams in one vectorized pass.
+        
+        Mirrors ``filter_eligible_streams``/``calculate_underexposure_score``
+        exactly (same operations in the same order) against a single clock
+        snapshot.
+        
+        Args:
+            viewer_counts: Viewer count per stream
+            started_at: Start timestamp per stream (NaN or 0 when unknown)
+            platform_codes: Codes from ``encode_platforms``
+            exposed: Optional already-exposed-today flag per stream
+            now: Clock snapshot; defaults to ``time.time()``
+            
+        Returns:
+            Tuple of (eligibility mask, underexposure scores)
+        """
+        if _numpy() is None:
+            raise RuntimeError("numpy is required for batch scoring")
+        now = time.time() if now is None else now
+        threshold = self.max_viewer_threshold
+        window = self.freshness_window_minutes
+        
+        viewers = np.asarray(viewer_counts, dtype=np.float64)
+        started = np.asarray(started_at, dtype=np.float64)
+        codes = np.asarray(platform_codes)
+        has_start = ~np.isnan(started) & (started != 0)
+        
+        with np.errstate(invalid="ignore"):
+            viewer_score = np.maximum(0, (threshold - viewers) / threshold)
+            age_seconds = now - started
+            freshness_score = np.maximum(0, (window - age_seconds / 60) / window)
+            platform_bonus = np.where(codes != self.PLATFORM_CODES["youtube"], 0.1, 0.0)
+            total_score = (viewer_score * 0.6) + (freshness_score * 0.3) + platform_bonus
+            scores = np.where(has_start, np.minimum(1.0, np.maximum(0.0, total_score)), 0.0)
+            too_old = has_start & (age_seconds > (window * 60))
+        
+        mask = (viewers <= threshold) & ~too_old & (scores > 0.1)
+        if exposed is not None:
+            mask &= ~np.asarray(exposed, dtype=bool)
+        return mask, scores
+    
+    def filter_eligible_streams(
+        self, streams: List[Stream], tracker: ExposureTracker, now: Optional[float] = None
+    ) -> List[Tuple[Stream, float]]:
         """Filter streams that are eligible for exposure and calculate scores."""
+        now = time.time() if now is None else now
+        if len(streams) < self.BATCH_MIN_STREAMS or _numpy() is None:
+            return self._filter_eligible_scalar(streams, tracker, now)
+        
+        mask, scores = self.score_batch(
+            [stream.viewer_count for stream in streams],
+            [stream.started_at or 0.0 for stream in streams],
+            self.encode_platforms([stream.platform for stream in streams]),
+            exposed=tracker.exposed_flags(streams),
+            now=now
+        )
+        return [(streams[i], float(scores[i])) for i in np.flatnonzero(mask)]
+    
+    def _filter_eligible_scalar(
+        self, streams: List[Stream], tracker: ExposureTracker, now: float
+    ) -> List[Tuple[Stream, float]]:
+        """Per-stream reference implementation of ``filter_eligible_streams``."""
         eligible = []
         
         for stream in streams:
@@ -173,44 +640,87 @@ class FairnessScheduler:
                 continue
             
             # Skip if too old
-            if stream.started_at and (time.time() - stream.started_at) > (self.freshness_window_minutes * 60):
+            if stream.started_at and (now - stream.started_at) > (self.freshness_window_minutes * 60):
                 continue
             
-            score = self.calculate_underexposure_score(stream)
+            score = self.calculate_underexposure_score(stream, now)
             if score > 0.1:  # Minimum threshold
                 eligible.append((stream, score))
         
         return eligible
     
-    def select_diverse_streams(self, scored_streams: List[Tuple[Stream, float]], count: int = 10) -> List[Tuple[Stream, float]]:
-        """Select a diverse set of streams for exposure."""
+    @staticmethod
+    def group_key(stream: Stream) -> str:
+        """Diversity group a stream belongs to (platform and language)."""
+        return f"{stream.platform}:{stream.language or 'unknown'}"
+    
+    def select_diverse_streams(
+        self,
+        scored_streams: List[Tuple[Stream, float]],
+        count: int = 10,
+        weights: Optional[Dict[str, float]] = None
+    ) -> List[Tuple[Stream, float]]:
+        """
+        Select a diverse set of streams for exposure.
+        
+        Streams are grouped by platform and language and picked round-robin
+        across groups in a random group order, best score first within each
+        group. Each group keeps a heap of its candidates and a cursor heap
+        orders groups by the virtual time of their next turn, so selection
+        costs O(n + k log g) for n candidates, k picks and g groups.
+        
+        With an ``allocator`` configured, each group's number of picks is
+        capped by its deficit round-robin quota, which balances exposure
+        across cycles rather than within this batch only.
+        
+        Args:
+            scored_streams: (stream, score) pairs
+            count: Number of streams to select
+            weights: Optional relative slot share per group key (default 1.0);
+                a group with weight 2 gets two picks for every one of a
+                weight-1 group, and groups with weight <= 0 are skipped
+            
+        Returns:
+            Selected (stream, score) pairs in pick order
+        """
         if not scored_streams:
             return []
+        weights = weights or {}
         
-        # Group by platform and language for diversity
-        platform_groups = {}
-        for stream, score in scored_streams:
-            platform = stream.platform
-            language = stream.language or "unknown"
-            key = f"{platform}:{language}"
-            
-            if key not in platform_groups:
-                platform_groups[key] = []
-            platform_groups[key].append((stream, score))
+        # Group by platform and language for diversity; heap entries keep the
+        # original position so equal scores stay in discovery order
+        groups: Dict[str, List[Tuple[float, int, Tuple[Stream, float]]]] = {}
+        for seq, item in enumerate(scored_streams):
+            groups.setdefault(self.group_key(item[0]), []).append((-item[1], seq, item))
         
-        # Sort each group by score
-        for key in platform_groups:
-            platform_groups[key].sort(key=lambda x: x[1], reverse=True)
+        for heap in groups.values():
+            heapq.heapify(heap)
         
-        # Round-robin selection for diversity
-        selected = []
-        group_keys = list(platform_groups.keys())
+        group_keys = list(groups.keys())
         random.shuffle(group_keys)  # Randomize order for fairness
         
-        while len(selected) < count and any(platform_groups.values()):
-            for key in group_keys:
-                if platform_groups[key] and len(selected) < count:
-                    selected.append(platform_groups[key].pop(0))
+        quotas = None
+        if self.allocator:
+            quotas = self.allocator.allocate({key: len(heap) for key, heap in groups.items()}, count, weights)
+            group_keys = [key for key in group_keys if quotas.get(key)]
+        
+        # Round-robin cursor: (virtual time of next turn, tie-break order, key)
+        cursor = [
+            (0.0, order, key) for order, key in enumerate(group_keys)
+            if weights.get(key, 1.0) > 0
+        ]
+        
+        selected = []
+        while cursor and len(selected) < count:
+            turn, order, key = heapq.heappop(cursor)
+            heap = groups[key]
+            selected.append(heapq.heappop(heap)[2])
+            if quotas is not None:
+                quotas[key] -= 1
+                if not quotas[key]:
+                    continue
+            if heap:
+                heapq.heappush(cursor, (turn + 1.0 / weights.get(key, 1.0), order, key))
         
         return selected
 
@@ -218,60 +728,216 @@ class FairnessScheduler:
 class CounterExposureEngine:
     """Main engine for discovering and exposing underexposed streams."""
     
-    def __init__(self):
-        self.youtube_client = YouTubeDiscovery() if config.YOUTUBE_API_KEY else None
-        self.twitch_client = TwitchDiscovery() if all([config.TWITCH_CLIENT_ID, config.TWITCH_OAUTH_TOKEN]) else None
-        self.tracker = ExposureTracker()
-        self.scheduler = FairnessScheduler()
+    def __init__(self, sources: Optional[SourceRegistry] = None,
+                 profiles: Optional[List[FeedProfile]] = None):
+        # Platform clients are imported and built on first use by the registry
+        self.sources = sources or default_registry()
+        self.profiles = load_profiles(config.FEED_PROFILES) if profiles is None else profiles
+        self.tracker = ExposureTracker(config.EXPOSURE_TRACKER_DB)
+        self.scheduler = FairnessScheduler(allocator=FairnessAllocator(self.tracker.db_path))
+        self.pool = CandidatePool(self.scheduler.freshness_window_minutes, priority=self.scheduler.priority,
+                                  group=self.scheduler.group_key)
+        self._profile_allocators: Dict[str, FairnessAllocator] = {}
+        self.stream_validators: List[Callable[[List[Stream]], List[Stream]]] = []
+        self.pipeline_stats: Dict[str, Dict] = {}
+        self.yields = YieldEstimator()  # Streams per second each source delivered in past cycles
+        self.source_progress: Dict[str, SourceProgress] = {}
         
-        logger.info(f"Initialized engine - YouTube: {'✓' if self.youtube_client else '✗'}, Twitch: {'✓' if self.twitch_client else '✗'}")
+        logger.info("Initialized engine - " + ", ".join(
+            f"{name}: {'✓' if self.sources.is_enabled(name) else '✗'}" for name in self.sources.names()
+        ))
     
-    async def discover_streams(self) -> List[Stream]:
-        """Discover live streams from all available platforms."""
-        all_streams = []
-        
-        # Fetch from YouTube
-        if self.youtube_client:
-            try:
-                yt_streams = self.youtube_client.fetch_all_pages(query="")
-                all_streams.extend(yt_streams)
-                logger.info(f"Discovered {len(yt_streams)} YouTube streams")
-            except Exception as e:
-                logger.error(f"YouTube discovery failed: {e}")
-        
-        # Fetch from Twitch
-        if self.twitch_client:
-            try:
-                twitch_streams = self.twitch_client.fetch_all_pages()
-                all_streams.extend(twitch_streams)
-                logger.info(f"Discovered {len(twitch_streams)} Twitch streams")
-            except Exception as e:
-                logger.error(f"Twitch discovery failed: {e}")
-        
-        return all_streams
-    
-    def generate_exposure_feed(self, count: int = 20) -> List[Dict]:
-        """Generate a feed of underexposed streams ready for exposure."""
-        # Discover streams
-        streams = asyncio.run(self.discover_streams())
-        logger.info(f"Total streams discovered: {len(streams)}")
-        
-        # Filter and score eligible streams
-        eligible = self.scheduler.filter_eligible_streams(streams, self.tracker)
-        logger.info(f"Eligible underexposed streams: {len(eligible)}")
-        
-        if not eligible:
-            logger.warning("No eligible streams found")
-            return []
+    @property
+    def youtube_client(self):
+        return self.sources.get("youtube")
+    
+    @youtube_client.setter
+    def youtube_client(self, client):
+        self.sources.set("youtube", client)
+    
+    @property
+    def twitch_client(self):
+        return self.sources.get("twitch")
+    
+    @twitch_client.setter
+    def twitch_client(self, client):
+        self.sources.set("twitch", client)
+    
+    def _sources(self) -> List[Tuple[str, BaseDiscoveryClient, Dict]]:
+        """Enabled platform clients with the arguments used to page through them, best yield first."""
+        clients = {name: (name, client, kwargs) for name, client, kwargs in self.sources.clients()}
+        return [clients[name] for name in self.yields.order(clients)]
+    
+    def _start_progress(self, sources: List[Tuple[str, BaseDiscoveryClient, Dict]]):
+        """Reset per-source progress for a new cycle."""
+        self.source_progress = {name: SourceProgress(name) for name, _, _ in sources}
+    
+    def _finish_progress(self):
+        """Settle sources the deadline cut off; only complete runs feed the yield estimates."""
+        for progress in self.source_progress.values():
+            if progress.status == RUNNING:
+                progress.status = CANCELLED
+            elif progress.status == PENDING:
+                progress.status = SKIPPED
+    
+    def _build_pipeline(self, seen: Set[str], now: Optional[float] = None,
+                        validate: bool = False, scheduler: Optional[FairnessScheduler] = None) -> Pipeline:
+        """
+        Assemble the discovery pipeline.
         
-        # Select diverse streams for exposure
-        selected = self.scheduler.select_diverse_streams(eligible, count)
-        logger.info(f"Selected {len(selected)} streams for exposure")
+        fetch → decode → dedupe, followed by validate → score → pool when
+        ``now`` is given (or validate alone with ``validate``). Items flowing
+        between stages are page-sized batches so scoring stays vectorized.
+        ``seen`` collects the keys of every distinct stream discovered, and
+        ``scheduler`` (the engine's by default) decides which streams are pooled.
+        """
+        scheduler = scheduler or self.scheduler
+        stages = [
+            Stage("fetch", self._fetch_stage, workers=max(1, len(self._sources())),
+                  queue_size=config.PIPELINE_QUEUE_SIZE, blocking=True),
+            Stage("decode", self._decode_stage, workers=config.PIPELINE_DECODE_WORKERS,
+                  queue_size=config.PIPELINE_QUEUE_SIZE, blocking=True),
+            Stage("dedupe", partial(self._dedupe_stage, seen=seen),
+                  queue_size=config.PIPELINE_QUEUE_SIZE),
+        ]
+        if now is not None or validate:
+            stages.append(
+                Stage("validate", self._validate_stage, workers=config.PIPELINE_VALIDATE_WORKERS,
+                      queue_size=config.PIPELINE_QUEUE_SIZE, blocking=True)
+            )
+        if now is not None:
+            stages += [
+                Stage("score", partial(self._score_stage, now=now, scheduler=scheduler),
+                      queue_size=config.PIPELINE_QUEUE_SIZE),
+                Stage("pool", partial(self._pool_stage, now=now, scheduler=scheduler),
+                      queue_size=config.PIPELINE_QUEUE_SIZE),
+            ]
+        return Pipeline(stages)
+    
+    def _fetch_stage(self, source: Tuple[str, BaseDiscoveryClient, Dict]):
+        """
+        Yield raw pages from one platform as they arrive.
         
-        # Record exposures and format output
+        A source ends COMPLETE only when it runs out of pages; one cut off by
+        the deadline (or whose request timed out at it) ends CANCELLED, and
+        any other error ends it FAILED. Only complete runs are yield samples.
+        """
+        name, client, kwargs = source
+        deadline = kwargs.get("deadline")
+        progress = self.source_progress.setdefault(name, SourceProgress(name))
+        progress.status = RUNNING
+        started = time.monotonic()
+        try:
+            for items in client.iter_raw_pages(**kwargs):
+                progress.pages += 1
+                progress.items += len(items)
+                progress.seconds = time.monotonic() - started
+                yield client, items
+        except Exception as e:
+            progress.seconds = time.monotonic() - started
+            if isinstance(e, DeadlineExpired) or (deadline is not None and deadline.expired()):
+                progress.status = CANCELLED
+                logger.info(f"Fetched {progress.pages} {name} pages before the deadline")
+                return
+            progress.status = FAILED
+            progress.error = str(e)
+            raise
+        progress.seconds = time.monotonic() - started
+        progress.status = COMPLETE
+        self.yields.record(name, progress.items, progress.seconds)
+        logger.info(f"Fetched {progress.pages} {name} pages")
+    
+    def _decode_stage(self, page: Tuple[BaseDiscoveryClient, List]) -> List[List[Stream]]:
+        """Turn a raw page into Stream objects."""
+        client, items = page
+        streams = client.decode_items(items)
+        return [streams] if streams else []
+    
+    def _dedupe_stage(self, streams: List[Stream], seen: Set[str]) -> List[List[Stream]]:
+        """Drop streams already seen earlier in this discovery pass."""
+        unique = []
+        for stream in streams:
+            key = f"{stream.platform}:{stream.stream_id}"
+            if key not in seen:
+                seen.add(key)
+                unique.append(stream)
+        return [unique] if unique else []
+    
+    def _validate_stage(self, streams: List[Stream]) -> List[List[Stream]]:
+        """Drop streams exposed today and apply any configured content validators."""
+        exposed = self.tracker.exposed_flags(streams)
+        streams = [stream for stream, seen in zip(streams, exposed) if not seen]
+        for validator in self.stream_validators:
+            if not streams:
+                break
+            streams = validator(streams)
+        return [streams] if streams else []
+    
+    def _score_stage(self, streams: List[Stream], now: float,
+                     scheduler: FairnessScheduler) -> List[Tuple[List[Stream], List[Tuple[Stream, float]]]]:
+        """Score a batch; passes the batch along so the pool can drop ineligible copies."""
+        return [(streams, scheduler.filter_eligible_streams(streams, self.tracker, now))]
+    
+    def _pool_stage(self, batch: Tuple[List[Stream], List[Tuple[Stream, float]]], now: float,
+                    scheduler: FairnessScheduler) -> List[int]:
+        """Upsert eligible streams into the candidate pool."""
+        streams, eligible = batch
+        added = self.pool.upsert_many(
+            ((stream, score, scheduler.eligible_until(stream)) for stream, score in eligible), now
+        )
+        
+        # Rediscovered streams that are no longer eligible leave the pool
+        eligible_keys = {self.pool.key(stream) for stream, _ in eligible}
+        for stream in streams:
+            key = self.pool.key(stream)
+            if key not in eligible_keys:
+                self.pool.remove(key)
+        return [added]
+    
+    async def _run_pipeline(self, pipeline: Pipeline, budget_seconds: Optional[float] = None) -> List:
+        """
+        Run a discovery pipeline over every source, stopping at the budget if one is given.
+        
+        Cancelling the pipeline cannot stop fetch threads blocked in a
+        request, so each source is also handed the deadline to use as its
+        request timeout.
+        """
+        deadline = Deadline(budget_seconds)
+        sources = [(name, client, {**kwargs, "deadline": deadline}) for name, client, kwargs in self._sources()]
+        self._start_progress(sources)
+        results = await pipeline.run(sources, timeout=deadline.remaining())
+        self.pipeline_stats = pipeline.get_stats()
+        self._finish_progress()
+        if pipeline.timed_out:
+            counts = summarize(self.source_progress.values())["status_counts"]
+            logger.warning(f"Discovery hit its {budget_seconds}s budget: {counts}")
+        return results
+    
+    async def discover_streams(self, budget_seconds: Optional[float] = None) -> List[Stream]:
+        """Discover live streams from all available platforms."""
+        batches = await self._run_pipeline(self._build_pipeline(set()), budget_seconds)
+        return [stream for batch in batches for stream in batch]
+    
+    def _expose(self, selected: List[Tuple[Stream, float]], now: float,
+                scheduler: Optional[FairnessScheduler] = None,
+                recorded: Optional[Set[str]] = None) -> List[Dict]:
+        """
+        Record exposures for selected streams and format them as feed items.
+        
+        ``recorded`` collects keys already recorded in this cycle, so a stream
+        that appears in several profile feeds is only recorded once.
+        """
+        scheduler = scheduler or self.scheduler
         exposure_feed = []
-        for stream, score in selected:
-            self.tracker.record_exposure(stream, score)
+        for stream, _ in selected:
+            # Pooled scores were computed when the stream was discovered; report the current one
+            score = scheduler.calculate_underexposure_score(stream, now)
+            key = self.pool.key(stream)
+            if recorded is None or key not in recorded:
+                self.tracker.record_exposure(stream, score)
+                if recorded is not None:
+                    recorded.add(key)
+            self.pool.remove(key)
             
             exposure_feed.append({
                 "platform": stream.platform,
@@ -285,19 +951,203 @@ class CounterExposureEngine:
                 "language": stream.language,
                 "tags": stream.tags,
                 "underexposure_score": round(score, 3),
-                "exposed_at": time.time()
+                "exposed_at": now
             })
         
         return exposure_feed
     
+    @staticmethod
+    def _run_sync(coroutine):
+        """
+        Run a discovery coroutine on a fresh event loop.
+        
+        Unlike ``asyncio.run`` this does not wait for worker threads still
+        blocked in a cancelled fetch, so a time budget bounds the call.
+        """
+        loop = asyncio.new_event_loop()
+        executor = ThreadPoolExecutor(thread_name_prefix="discovery")
+        loop.set_default_executor(executor)
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            executor.shutdown(wait=False, cancel_futures=True)
+            loop.close()
+    
+    def generate_exposure_feed(self, count: int = 20, budget_seconds: Optional[float] = None) -> List[Dict]:
+        """
+        Generate a feed of underexposed streams ready for exposure.
+        
+        Args:
+            count: Number of streams in the feed
+            budget_seconds: Optional time budget for discovery; sources still
+                running at the deadline are cancelled and the feed is built
+                from what arrived (see ``source_progress``)
+        """
+        return self._run_sync(self.generate_exposure_feed_async(count, budget_seconds))
+    
+    async def generate_exposure_feed_async(self, count: int = 20,
+                                           budget_seconds: Optional[float] = None) -> List[Dict]:
+        """Coroutine form of ``generate_exposure_feed`` for callers that own an event loop."""
+        # Discover, validate and score streams into the candidate pool; the
+        # pool stage upserts as pages arrive, so a cut-off cycle keeps them
+        now = time.time()
+        seen: Set[str] = set()
+        added = sum(await self._run_pipeline(self._build_pipeline(seen, now), budget_seconds))
+        logger.info(f"Total streams discovered: {len(seen)}")
+        
+        now = time.time()
+        self.pool.expire(now)
+        logger.info(f"Candidate pool: {len(self.pool)} streams ({added} new)")
+        return self.feed_from_pool(count, now)
+    
+    def profile_scheduler(self, profile: FeedProfile) -> FairnessScheduler:
+        """Scheduler configured with a profile's thresholds and its own fairness deficits."""
+        allocator = self._profile_allocators.get(profile.name)
+        if allocator is None:
+            allocator = FairnessAllocator(self.tracker.db_path, namespace=profile.name)
+            self._profile_allocators[profile.name] = allocator
+        scheduler = FairnessScheduler(max_viewer_threshold=profile.max_viewers, allocator=allocator)
+        scheduler.freshness_window_minutes = profile.freshness_window_minutes
+        return scheduler
+    
+    def pool_scheduler(self, profiles: List[FeedProfile]) -> FairnessScheduler:
+        """
+        Scheduler that pools every stream the engine or any profile could select.
+        
+        Scores grow with both the viewer threshold and the freshness window,
+        so the largest of each admits a superset of every profile's streams.
+        """
+        scheduler = FairnessScheduler(max_viewer_threshold=max(
+            [self.scheduler.max_viewer_threshold] + [profile.max_viewers for profile in profiles]
+        ))
+        scheduler.freshness_window_minutes = max(
+            [self.scheduler.freshness_window_minutes] + [profile.freshness_window_minutes for profile in profiles]
+        )
+        return scheduler
+    
+    def select_profiles(
+        self, streams: List[Stream], profiles: List[FeedProfile], now: Optional[float] = None
+    ) -> Dict[str, List[Tuple[Stream, float]]]:
+        """
+        Select every profile's streams from one shared candidate set.
+        
+        The per-stream columns (viewers, start times, platform codes and
+        exposure flags) are built once; each profile then costs one
+        vectorized scoring pass plus its diversity selection.
+        
+        Returns:
+            Selected (stream, score) pairs per profile name
+        """
+        now = time.time() if now is None else now
+        batch = len(streams) >= FairnessScheduler.BATCH_MIN_STREAMS and _numpy() is not None
+        if batch:
+            viewers = np.array([stream.viewer_count for stream in streams], dtype=np.float64)
+            started = np.array([stream.started_at or 0.0 for stream in streams], dtype=np.float64)
+            codes = FairnessScheduler.encode_platforms([stream.platform for stream in streams])
+            exposed = self.tracker.exposed_flags(streams)
+        
+        selections = {}
+        for profile in profiles:
+            scheduler = self.profile_scheduler(profile)
+            if batch:
+                mask, scores = scheduler.score_batch(viewers, started, codes, exposed=exposed, now=now)
+                eligible = [(streams[i], float(scores[i])) for i in np.flatnonzero(mask)
+                            if profile.matches(streams[i])]
+            else:
+                eligible = scheduler._filter_eligible_scalar(
+                    [stream for stream in streams if profile.matches(stream)], self.tracker, now
+                )
+            selections[profile.name] = scheduler.select_diverse_streams(eligible, profile.count, profile.weights)
+        return selections
+    
+    def generate_profile_feeds(self, profiles: Optional[List[FeedProfile]] = None,
+                               budget_seconds: Optional[float] = None) -> Dict[str, List[Dict]]:
+        """Generate one feed per profile from a single discovery pass."""
+        return self._run_sync(self.generate_profile_feeds_async(profiles, budget_seconds))
+    
+    async def generate_profile_feeds_async(
+        self, profiles: Optional[List[FeedProfile]] = None, budget_seconds: Optional[float] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        Coroutine form of ``generate_profile_feeds``.
+        
+        Args:
+            profiles: Profiles to evaluate; defaults to the configured ones
+            budget_seconds: Optional time budget for the discovery pass
+            
+        Returns:
+            Feed items per profile name, in profile order
+        """
+        profiles = self.profiles if profiles is None else profiles
+        # Discoveries go into the shared pool like a single-feed cycle's, so
+        # streams no profile selects now stay available to the next cycle
+        now = time.time()
+        seen: Set[str] = set()
+        pipeline = self._build_pipeline(seen, now, scheduler=self.pool_scheduler(profiles))
+        added = sum(await self._run_pipeline(pipeline, budget_seconds))
+        logger.info(f"Total streams discovered: {len(seen)}")
+        
+        now = time.time()
+        self.pool.expire(now)
+        streams = [stream for stream, _ in self.pool.candidates(now)]
+        logger.info(f"Candidate pool: {len(self.pool)} streams ({added} new)")
+        
+        selections = self.select_profiles(streams, profiles, now)
+        recorded: Set[str] = set()
+        feeds = {}
+        for profile in profiles:
+            selected = selections[profile.name]
+            logger.info(f"Profile '{profile.name}': selected {len(selected)} streams")
+            feeds[profile.name] = self._expose(selected, now, self.profile_scheduler(profile), recorded)
+        return feeds
+    
+    def feed_from_pool(self, count: int = 20, now: Optional[float] = None) -> List[Dict]:
+        """
+        Generate a feed from the pooled candidates without a discovery pass.
+        
+        Diversity selection never takes more than ``count`` streams from one
+        group, so it only needs each group's best ``count`` eligible streams,
+        which the pool's per-group heaps yield without scanning or rescoring
+        the whole pool. ``generate_exposure_feed`` ends here too.
+        """
+        now = time.time() if now is None else now
+        # The pool may hold streams only a wider feed profile accepts
+        shortlist = self.pool.top_k(
+            count, now, per_group=True,
+            exclude=lambda stream: not self.scheduler.filter_eligible_streams([stream], self.tracker, now)
+        )
+        if not shortlist:
+            logger.warning("No eligible streams found")
+            return []
+        
+        # Pooled scores were computed by the cycle that found each stream;
+        # rescore the shortlist against one clock so older finds do not outrank
+        candidates = [(stream, self.scheduler.calculate_underexposure_score(stream, now)) for stream, _ in shortlist]
+        selected = self.scheduler.select_diverse_streams(candidates, count)
+        logger.info(f"Selected {len(selected)} streams for exposure")
+        return self._expose(selected, now)
+    
     def get_stats(self) -> Dict:
         """Get engine statistics."""
         return {
             "platforms_enabled": {
-                "youtube": self.youtube_client is not None,
-                "twitch": self.twitch_client is not None
+                name: self.sources.is_enabled(name) for name in self.sources.names()
             },
             "exposure_stats": self.tracker.get_exposure_stats(),
+            "candidate_pool": {
+                "size": len(self.pool)
+            },
+            "pipeline": self.pipeline_stats,
+            "sources": {
+                **summarize(self.source_progress.values()),
+                "expected_yield_per_second": {
+                    name: round(rate, 2) for name in self.sources.names()
+                    if (rate := self.yields.expected(name)) is not None
+                }
+            },
+            "profiles": [profile.name for profile in self.profiles],
+            "fairness": self.scheduler.allocator.get_stats() if self.scheduler.allocator else {},
             "scheduler_config": {
                 "max_viewer_threshold": self.scheduler.max_viewer_threshold,
                 "freshness_window_minutes": self.scheduler.freshness_window_minutes
@@ -0,0 +1,64 @@
+"""
+Feed Profiles - Several feeds selected from one discovery pass.
+A profile bundles scheduler parameters, stream filters and a feed size.
+The engine discovers streams once into its candidate pool, then evaluates
+every profile against that shared pool.
+"""
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from base_client import Stream
+
+
+@dataclass
+class FeedProfile:
+    """Selection parameters for one feed."""
+    name: str
+    count: int = 20
+    max_viewers: int = 5
+    freshness_window_minutes: int = 30
+    platforms: Optional[List[str]] = None  # None accepts every platform
+    languages: Optional[List[str]] = None  # None accepts every language
+    weights: Dict[str, float] = field(default_factory=dict)  # Diversity group weights
+
+    def matches(self, stream: Stream) -> bool:
+        """Whether a stream passes the profile's platform and language filters."""
+        if self.platforms is not None and stream.platform not in self.platforms:
+            return False
+        if self.languages is not None and (stream.language or "unknown") not in self.languages:
+            return False
+        return True
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FeedProfile":
+        unknown = set(data) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Unknown feed profile fields: {', '.join(sorted(unknown))}")
+        if "name" not in data:
+            raise ValueError("Feed profile needs a name")
+        return cls(**data)
+
+
+def load_profiles(spec: str) -> List[FeedProfile]:
+    """
+    Parse feed profiles from configuration.
+
+    Args:
+        spec: A JSON list of profile objects, or the path of a file holding one
+
+    Returns:
+        Profiles in declaration order (empty when ``spec`` is empty)
+    """
+    spec = (spec or "").strip()
+    if not spec:
+        return []
+    if not spec.startswith("["):
+        spec = Path(spec).read_text(encoding="utf-8")
+
+    profiles = [FeedProfile.from_dict(entry) for entry in json.loads(spec)]
+    names = [profile.name for profile in profiles]
+    if len(set(names)) != len(names):
+        raise ValueError("Feed profile names must be unique")
+    return profiles
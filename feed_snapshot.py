@@ -0,0 +1,244 @@
+"""
+Feed Snapshots - Double-buffered publishing of the generated feed.
+The next feed is built completely in memory and then published with one
+reference swap. On disk each version gets its own directory, and replacing
+the manifest (temp file + rename) is the single commit point. Readers always
+see a whole snapshot, never a half-written one or the files of two different
+publishes, and never wait on the writer.
+"""
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from config import config
+
+try:
+    import fcntl
+except ImportError:  # Windows: publishers are only serialised within one process
+    fcntl = None
+
+
+@dataclass(frozen=True)
+class FeedSnapshot:
+    """One immutable, fully rendered version of the feed."""
+    version: int
+    created_at: float
+    items: Tuple[Dict, ...]
+    feed_json: bytes
+    html: bytes
+    meta: Dict = field(default_factory=dict)  # e.g. per-source discovery completeness
+
+    @property
+    def etag(self) -> str:
+        return f'"feed-{self.version}"'
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """Write a file so readers see either the old or the new contents."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+class SnapshotManager:
+    """
+    Publishes feed snapshots with monotonically increasing versions.
+
+    ``current()`` is a plain attribute read; ``publish()`` serialises writers
+    with a lock, writes the files, then swaps the in-memory reference. The
+    CLI, the worker coordinator and the web server publish from separate
+    processes, so the lock is also a ``flock`` on a file next to the
+    manifest, held while a version number is allocated and written.
+
+    Each version's files go into their own directory under ``versions_dir``
+    and the manifest, written last, names the current one; ``html_path`` and
+    ``data_path`` are refreshed afterwards as copies for people and tools
+    that open them directly. ``current()`` stats the manifest at most once
+    per ``check_interval`` seconds and reloads the snapshot when it changed.
+    """
+
+    KEEP_VERSIONS = 5  # Version directories kept for readers still loading an older one
+
+    def __init__(self, html_path: Union[str, Path] = "counter_exposure_feed.html",
+                 data_path: Union[str, Path] = "feed_data.json",
+                 manifest_path: Union[str, Path] = "feed_snapshot.json",
+                 check_interval: float = 1.0):
+        self.html_path = Path(html_path)
+        self.data_path = Path(data_path)
+        self.manifest_path = Path(manifest_path)
+        self.versions_dir = self.manifest_path.with_name(f"{self.manifest_path.stem}_versions")
+        self.lock_path = self.manifest_path.with_name(f"{self.manifest_path.name}.lock")
+        self.check_interval = check_interval
+        self._current: Optional[FeedSnapshot] = None
+        self._publish_lock = threading.RLock()
+        self._loaded = False
+        self._manifest_stamp: Optional[Tuple[int, int, int]] = None
+        self._checked_at = float("-inf")
+
+    def current(self) -> Optional[FeedSnapshot]:
+        """Latest published snapshot, by this process or another one."""
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            self._refresh(blocking=not self._loaded)
+        return self._current
+
+    def publish(self, items: List[Dict], html: str, meta: Optional[Dict] = None) -> FeedSnapshot:
+        """
+        Publish a new feed version.
+
+        Args:
+            items: Feed items, serialised to ``feed_data.json``
+            html: Rendered feed page
+            meta: Extra information stored with the snapshot and its manifest
+
+        Returns:
+            The snapshot that is now current
+        """
+        feed_json = json.dumps(items, indent=2, default=str).encode("utf-8")
+        html_bytes = html.encode("utf-8")
+
+        with self._publisher():
+            self._refresh()  # Number after the latest version, whoever published it
+            previous = self._current
+            snapshot = FeedSnapshot(
+                version=(previous.version if previous else 0) + 1,
+                created_at=time.time(),
+                items=tuple(items),
+                feed_json=feed_json,
+                html=html_bytes,
+                meta=meta or {}
+            )
+
+            version_dir = self.versions_dir / f"v{snapshot.version}"
+            atomic_write_bytes(version_dir / self.data_path.name, snapshot.feed_json)
+            atomic_write_bytes(version_dir / self.html_path.name, snapshot.html)
+            atomic_write_bytes(self.manifest_path, json.dumps({
+                "version": snapshot.version,
+                "created_at": snapshot.created_at,
+                "items": len(snapshot.items),
+                "dir": version_dir.name,
+                "meta": snapshot.meta
+            }, default=str).encode("utf-8"))  # The commit point for every process
+
+            self._manifest_stamp = self._stamp()
+            self._current = snapshot  # The swap: readers pick this up on their next call
+
+            atomic_write_bytes(self.data_path, snapshot.feed_json)
+            atomic_write_bytes(self.html_path, snapshot.html)
+            self._prune_versions(snapshot.version)
+
+        logger.info(f"Published feed snapshot v{snapshot.version} ({len(items)} items)")
+        return snapshot
+
+    @contextmanager
+    def _publisher(self):
+        """Hold the publish lock of this process and, where supported, of every process."""
+        with self._publish_lock:
+            if fcntl is None:
+                yield
+                return
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _prune_versions(self, version: int):
+        """Delete version directories more than KEEP_VERSIONS behind ``version``."""
+        for path in self.versions_dir.glob("v*"):
+            number = path.name[1:]
+            if number.isdigit() and int(number) <= version - self.KEEP_VERSIONS:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _stamp(self) -> Optional[Tuple[int, int, int]]:
+        """Identity of the manifest file on disk (None if there is none)."""
+        try:
+            stat = self.manifest_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _refresh(self, blocking: bool = True):
+        """
+        Load the snapshot on disk if its manifest changed since the last look.
+
+        Args:
+            blocking: Wait for a publish in progress; otherwise keep serving
+                the current snapshot and let that publish swap in the new one
+        """
+        stamp = self._stamp()
+        if self._loaded and stamp == self._manifest_stamp:
+            return
+        if not self._publish_lock.acquire(blocking=blocking):
+            return
+        try:
+            if self._loaded and stamp == self._manifest_stamp:
+                return
+            self._loaded = True
+            self._manifest_stamp = stamp
+            self._load_from_disk()
+        finally:
+            self._publish_lock.release()
+
+    def _load_from_disk(self):
+        """Replace the in-memory snapshot with the one the manifest names."""
+        try:
+            manifest = {}
+            if self.manifest_path.exists():
+                manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            version = int(manifest.get("version", 0))
+            if self._current is not None and self._current.version == version:
+                return
+            data_path, html_path = self.data_path, self.html_path  # Published before version directories
+            if manifest.get("dir"):
+                data_path = self.versions_dir / manifest["dir"] / self.data_path.name
+                html_path = self.versions_dir / manifest["dir"] / self.html_path.name
+            if not (html_path.exists() and data_path.exists()):
+                return
+            feed_json = data_path.read_bytes()
+            self._current = FeedSnapshot(
+                version=version,
+                created_at=float(manifest.get("created_at", data_path.stat().st_mtime)),
+                items=tuple(json.loads(feed_json)),
+                feed_json=feed_json,
+                html=html_path.read_bytes(),
+                meta=manifest.get("meta", {})
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load feed snapshot from disk: {e}")
+
+
+_default_manager: Optional[SnapshotManager] = None
+_default_lock = threading.Lock()
+
+
+def get_snapshot_manager() -> SnapshotManager:
+    """Process-wide snapshot manager shared by the UI and the web server."""
+    global _default_manager
+    with _default_lock:
+        if _default_manager is None:
+            _default_manager = SnapshotManager(config.FEED_HTML_FILE, config.FEED_DATA_FILE, config.FEED_SNAPSHOT_FILE)
+        return _default_manager
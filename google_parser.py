@@ -0,0 +1,307 @@
+"""
+Google Parser - Extracts organic results from Google result pages.
+One streaming handler picks result links, titles and snippets out of
+tokenizer events in a single pass. lxml's HTML parser feeds it when lxml is
+installed; otherwise the standard library's html.parser does. Either way,
+parse time grows linearly with page size.
+
+Run as a script to benchmark the backends on saved pages:
+    python google_parser.py [page.html ...] --repeat 50
+"""
+import argparse
+import json
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+from urllib.parse import parse_qs, urlparse
+
+# Classes Google has used for the snippet block of an organic result
+SNIPPET_CLASSES = frozenset({'VwiC3b', 'aCOpRe', 'IsZvec', 'st', 's3v9rd', 'lEBKkf'})
+# Elements that end the plain-text snippet of a result without a snippet block
+BLOCK_TAGS = frozenset({'div', 'p', 'li', 'ul', 'ol', 'table', 'tr', 'td', 'section', 'article', 'footer'})
+SKIP_TAGS = frozenset({'script', 'style', 'noscript', 'template'})
+GOOGLE_DOMAINS = ('google.com', 'googleusercontent.com', 'googleadservices.com')
+
+DEFAULT_PAGES = [Path(__file__).parent / 'tests' / 'test_data' / 'google_serp.html']
+
+
+class GoogleHit(NamedTuple):
+    """One organic result, in page order."""
+    url: str
+    title: str
+    snippet: str
+
+
+def result_url(href: Optional[str]) -> Optional[str]:
+    """
+    Target URL of a result link.
+
+    Unwraps Google's ``/url?q=...`` redirects and drops links back into
+    Google (including its ad redirects) or without an http(s) target.
+    """
+    if not href:
+        return None
+    parsed = urlparse(href)
+    if parsed.path == '/url' and (not parsed.netloc or parsed.netloc.endswith('google.com')):
+        params = parse_qs(parsed.query)
+        target = params.get('q') or params.get('url')
+        if not target:
+            return None
+        href = target[0]
+        parsed = urlparse(href)
+    if parsed.scheme not in ('http', 'https'):
+        return None
+    host = (parsed.hostname or '').lower()
+    if any(host == domain or host.endswith('.' + domain) for domain in GOOGLE_DOMAINS):
+        return None
+    return href
+
+
+def _collapse(parts: List[str]) -> str:
+    return ' '.join(''.join(parts).split())
+
+
+def _is_snippet(attrs: Dict[str, str]) -> bool:
+    classes = (attrs.get('class') or '').split()
+    return (not SNIPPET_CLASSES.isdisjoint(classes) or 'data-sncf' in attrs
+            or attrs.get('data-content-feature') == '1')
+
+
+class _ResultCollector:
+    """
+    Parser target turning start/end/data events into GoogleHits.
+
+    An ``<h3>`` inside a link (current layout) or holding one (older
+    layouts) opens a result. Its snippet is the first snippet-class block
+    that follows; failing that, the first run of text outside links and
+    ``<cite>`` breadcrumbs. The next title or the end of the page closes it.
+    """
+
+    def __init__(self):
+        self.hits: List[GoogleHit] = []
+        self._seen = set()
+        self._skip = 0  # Depth inside script/style
+        self._href: Optional[str] = None  # Link of the open <a>
+        self._h3 = 0
+        self._title: List[str] = []
+        self._title_href: Optional[str] = None
+        self._cite = 0
+        self._current: Optional[GoogleHit] = None
+        self._snippet: List[str] = []
+        self._snippet_tag: Optional[str] = None
+        self._snippet_depth = 0
+        self._fallback: List[str] = []
+        self._fallback_done = False
+
+    def start(self, tag: str, attrs: Dict[str, str]):
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self._skip += 1
+            return
+        if self._snippet_tag == tag:
+            self._snippet_depth += 1
+        elif self._current and self._snippet_tag is None and not self._snippet and _is_snippet(attrs):
+            self._snippet_tag, self._snippet_depth = tag, 1
+        self._boundary(tag)
+
+        if tag == 'a':
+            self._href = attrs.get('href')
+            if self._h3:
+                self._title_href = self._href
+        elif tag == 'h3':
+            if not self._h3:
+                self._finish()
+                self._title = []
+                self._title_href = self._href
+            self._h3 += 1
+        elif tag == 'cite':
+            self._cite += 1
+
+    def end(self, tag: str):
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+            return
+        if tag == self._snippet_tag:
+            self._snippet_depth -= 1
+            if not self._snippet_depth:
+                self._snippet_tag = None
+        self._boundary(tag)
+
+        if tag == 'a':
+            self._href = None
+        elif tag == 'h3' and self._h3:
+            self._h3 -= 1
+            if not self._h3:
+                self._open_result()
+        elif tag == 'cite' and self._cite:
+            self._cite -= 1
+
+    def _boundary(self, tag: str):
+        """Block elements separate words and end a plain-text snippet."""
+        if tag in BLOCK_TAGS or tag == 'br':
+            if self._snippet_tag:
+                self._snippet.append(' ')
+            elif tag != 'br' and self._fallback:
+                self._fallback_done = True
+
+    def data(self, text: str):
+        if self._skip:
+            return
+        if self._h3:
+            self._title.append(text)
+        elif self._current is None or self._cite:
+            return
+        elif self._snippet_tag:
+            self._snippet.append(text)
+        elif self._href is None and not self._fallback_done and (self._fallback or text.strip()):
+            self._fallback.append(text)
+
+    def _open_result(self):
+        url = result_url(self._title_href)
+        title = _collapse(self._title)
+        if url and title and url not in self._seen:
+            self._seen.add(url)
+            self._current = GoogleHit(url, title, '')
+            self._snippet, self._fallback = [], []
+            self._snippet_tag, self._fallback_done = None, False
+
+    def _finish(self):
+        if self._current is not None:
+            snippet = _collapse(self._snippet) or _collapse(self._fallback)
+            self.hits.append(self._current._replace(snippet=snippet))
+            self._current = None
+
+    def close(self) -> List[GoogleHit]:
+        self._finish()
+        return self.hits
+
+
+class _StdlibTokenizer(HTMLParser):
+    """Feeds html.parser events to a parser target, like lxml's target API."""
+
+    def __init__(self, target: _ResultCollector):
+        super().__init__(convert_charrefs=True)
+        self.target = target
+
+    def handle_starttag(self, tag, attrs):
+        self.target.start(tag, {name: value or '' for name, value in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self.target.end(tag)
+
+    def handle_endtag(self, tag):
+        self.target.end(tag)
+
+    def handle_data(self, data):
+        self.target.data(data)
+
+
+def _lxml_etree():
+    try:
+        from lxml import etree
+    except ImportError:
+        return None
+    return etree
+
+
+def parse_google_results(html: str, backend: str = "auto") -> List[GoogleHit]:
+    """
+    Organic results of a Google result page.
+
+    Args:
+        html: Page HTML
+        backend: "lxml", "html.parser" or "auto" (lxml when installed)
+
+    Returns:
+        Results in page order, without duplicate URLs
+    """
+    if backend not in ("auto", "lxml", "html.parser"):
+        raise ValueError(f"Unknown parser backend: {backend}")
+    if not html:
+        return []
+    collector = _ResultCollector()
+    etree = _lxml_etree() if backend != "html.parser" else None
+    if etree is not None:
+        parser = etree.HTMLParser(target=collector)
+        parser.feed(html)
+        return parser.close()
+    if backend == "lxml":
+        raise ImportError("lxml is not installed (pip install -r requirements-web.txt)")
+    tokenizer = _StdlibTokenizer(collector)
+    tokenizer.feed(html)
+    tokenizer.close()
+    return collector.close()
+
+
+def _regex_baseline(html: str) -> List[GoogleHit]:
+    """The regex extraction this parser replaced, kept as the benchmark baseline."""
+    import re
+    pattern = r'<h3[^>]*>.*?<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>.*?</h3>.*?<span[^>]*>(.*?)</span>'
+    return [GoogleHit(url, re.sub(r'<[^>]+>', '', title).strip(), re.sub(r'<[^>]+>', '', snippet).strip())
+            for url, title, snippet in re.findall(pattern, html, re.DOTALL | re.IGNORECASE)
+            if 'google.com' not in url]
+
+
+def benchmark(path: Path, repeat: int = 20, backends: Optional[List[str]] = None, scale: int = 1) -> List[Dict]:
+    """
+    Time each backend on a saved page and score it against the page's
+    ``<name>.expected.json`` (a list of result URLs), when present.
+
+    Args:
+        path: Saved result page
+        repeat: Parses per backend
+        backends: Backends to time (default: lxml, html.parser and regex)
+        scale: Repeat the page this many times to time larger inputs
+    """
+    html = path.read_text(encoding='utf-8') * scale
+    expected_path = path.with_name(path.stem + '.expected.json')
+    expected = json.loads(expected_path.read_text()) if expected_path.exists() else None
+    parsers = {
+        "lxml": lambda page: parse_google_results(page, "lxml"),
+        "html.parser": lambda page: parse_google_results(page, "html.parser"),
+        "regex": _regex_baseline,
+    }
+    rows = []
+    for name in backends or list(parsers):
+        if name == "lxml" and _lxml_etree() is None:
+            continue
+        parse = parsers[name]
+        started = time.perf_counter()
+        for _ in range(repeat):
+            hits = parse(html)
+        elapsed = time.perf_counter() - started
+        urls = {hit.url for hit in hits}
+        rows.append({
+            "page": path.name if scale == 1 else f"{path.name} x{scale}",
+            "kilobytes": round(len(html.encode('utf-8')) / 1024, 1),
+            "backend": name,
+            "ms_per_page": round(elapsed / repeat * 1000, 3),
+            "results": len(hits),
+            "recall": round(len(urls & set(expected)) / len(expected), 3) if expected else None,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Google result page parsing on saved pages')
+    parser.add_argument('pages', nargs='*', type=Path, default=DEFAULT_PAGES)
+    parser.add_argument('--repeat', type=int, default=20, help='Parses per page and backend')
+    parser.add_argument('--backend', action='append', choices=['lxml', 'html.parser', 'regex'],
+                        help='Backend to time (repeatable; default: all)')
+    parser.add_argument('--scale', type=int, default=1, help='Also time each page repeated this many times')
+    args = parser.parse_args()
+
+    print(f"{'page':<28} {'KB':>8} {'backend':<12} {'ms/page':>9} {'results':>8} {'recall':>7}")
+    for path in args.pages:
+        for scale in sorted({1, args.scale}):
+            for row in benchmark(path, args.repeat, args.backend, scale):
+                recall = '-' if row['recall'] is None else f"{row['recall']:.0%}"
+                print(f"{row['page']:<28} {row['kilobytes']:>8} {row['backend']:<12} "
+                      f"{row['ms_per_page']:>9} {row['results']:>8} {recall:>7}")
+
+
+if __name__ == "__main__":
+    main()
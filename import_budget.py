@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Import Time Budget
+Measures cold import time of the CLI and server entry points with
+``python -X importtime`` and fails when one goes over its budget, so a
+heavy module-level import does not creep back in unnoticed.
+
+Usage:
+    python import_budget.py            # check all entry points
+    python import_budget.py run_engine # check one
+"""
+import subprocess
+import sys
+from typing import Dict, Optional
+
+# Cumulative import time budgets in milliseconds (about 1.5x measured)
+BUDGETS_MS: Dict[str, int] = {
+    "exposure_engine": 200,
+    "run_engine": 250,
+    "web_server": 450,
+}
+
+RUNS = 3  # Best of N, to keep disk cache noise out of the result
+
+
+def measure_import_ms(module: str) -> Optional[float]:
+    """
+    Cold-import a module in a fresh interpreter.
+
+    Returns:
+        Cumulative import time in milliseconds, or None if the import failed
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        return None
+
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    return None
+
+
+def main(modules) -> int:
+    over_budget = False
+
+    for module in modules:
+        budget = BUDGETS_MS[module]
+        timings = [measure_import_ms(module) for _ in range(RUNS)]
+        timings = [t for t in timings if t is not None]
+
+        if not timings:
+            print(f"⏭️  {module}: could not be imported here (missing dependencies?), skipped")
+            continue
+
+        best = min(timings)
+        status = "✅" if best <= budget else "❌"
+        print(f"{status} {module}: {best:.1f} ms (budget {budget} ms)")
+        over_budget = over_budget or best > budget
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    requested = sys.argv[1:] or list(BUDGETS_MS)
+    unknown = [m for m in requested if m not in BUDGETS_MS]
+    if unknown:
+        print(f"No budget for: {', '.join(unknown)}")
+        sys.exit(2)
+    sys.exit(main(requested))
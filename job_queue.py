@@ -0,0 +1,240 @@
+"""
+Discovery Job Queue - SQLite-backed work queue with leases.
+A coordinator enqueues units of discovery work; any number of worker
+processes - on this host or on other nodes sharing the database file -
+claim them under a lease. A job whose lease runs out without being
+completed becomes visible again, so a crashed worker only delays its job.
+"""
+import json
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+
+@dataclass
+class Job:
+    """A claimed unit of work."""
+    id: int
+    batch: str
+    kind: str
+    payload: Dict[str, Any]
+    attempts: int
+    lease_expires_at: float
+
+
+def worker_id() -> str:
+    """Identifier that is unique per process."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class JobQueue:
+    """
+    Leased jobs stored in one SQLite table.
+
+    Claims run inside ``BEGIN IMMEDIATE`` transactions, which take SQLite's
+    write lock up front, so two processes can never lease the same job.
+    Every state change checks the lease owner, so a worker whose lease has
+    already expired cannot overwrite the result of the worker that took over.
+    """
+
+    PENDING = "pending"
+    LEASED = "leased"
+    DONE = "done"
+    FAILED = "failed"
+
+    JOURNAL_MODES = frozenset({"DELETE", "TRUNCATE", "PERSIST", "WAL"})
+
+    def __init__(self, db_path: str = "discovery_jobs.db", visibility_timeout: float = 300,
+                 max_attempts: int = 3, journal_mode: str = "DELETE"):
+        """
+        Args:
+            db_path: Queue database, shared by every worker
+            visibility_timeout: Seconds a claimed job stays leased
+            max_attempts: Claims before a job is marked failed
+            journal_mode: SQLite journal mode. The default rollback journal
+                works for nodes sharing the file over network storage; WAL
+                lets readers run alongside a writer, but only on one host.
+        """
+        journal_mode = journal_mode.upper()
+        if journal_mode not in self.JOURNAL_MODES:
+            raise ValueError(f"Unsupported journal mode: {journal_mode}")
+        self.db_path = db_path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.journal_mode = journal_mode
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA busy_timeout = 30000")
+        return conn
+
+    def _init_database(self):
+        """Create the jobs table."""
+        conn = self._connect()
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                batch TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires_at REAL,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs(status, lease_expires_at, id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_batch ON jobs(batch, status)")
+        conn.close()
+
+    def enqueue(self, batch: str, jobs: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Add (kind, payload) jobs to a batch.
+
+        Returns:
+            Number of jobs enqueued
+        """
+        now = time.time()
+        rows = [(batch, kind, json.dumps(payload, sort_keys=True), self.PENDING, now, now)
+                for kind, payload in jobs]
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany("""
+            INSERT INTO jobs (batch, kind, payload, status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, rows)
+        conn.execute("COMMIT")
+        conn.close()
+        logger.info(f"Enqueued {len(rows)} jobs in batch {batch}")
+        return len(rows)
+
+    def claim(self, owner: str, now: Optional[float] = None) -> Optional[Job]:
+        """
+        Lease the oldest visible job.
+
+        A job is visible when it is pending, or leased with an expired lease
+        and attempts left.
+
+        Args:
+            owner: Worker identifier recorded as the lease owner
+            now: Clock snapshot
+
+        Returns:
+            The claimed job, or None if nothing is available
+        """
+        now = time.time() if now is None else now
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # Leases that expired on their last attempt are given up on
+            conn.execute("""
+                UPDATE jobs SET status = ?, error = COALESCE(error, 'lease expired'), updated_at = ?
+                WHERE status = ? AND lease_expires_at <= ? AND attempts >= ?
+            """, (self.FAILED, now, self.LEASED, now, self.max_attempts))
+            row = conn.execute("""
+                SELECT id, batch, kind, payload, attempts FROM jobs
+                WHERE status = ? OR (status = ? AND lease_expires_at <= ?)
+                ORDER BY id LIMIT 1
+            """, (self.PENDING, self.LEASED, now)).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            job_id, batch, kind, payload, attempts = row
+            lease_expires_at = now + self.visibility_timeout
+            conn.execute("""
+                UPDATE jobs SET status = ?, attempts = attempts + 1, lease_owner = ?,
+                    lease_expires_at = ?, updated_at = ?
+                WHERE id = ?
+            """, (self.LEASED, owner, lease_expires_at, now, job_id))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        return Job(id=job_id, batch=batch, kind=kind, payload=json.loads(payload),
+                   attempts=attempts + 1, lease_expires_at=lease_expires_at)
+
+    def extend(self, job: Job, owner: str) -> bool:
+        """Renew a lease for a long-running job; False if it was lost."""
+        lease_expires_at = time.time() + self.visibility_timeout
+        if self._update_leased(job, owner, "lease_expires_at = ?", (lease_expires_at,)):
+            job.lease_expires_at = lease_expires_at
+            return True
+        return False
+
+    def complete(self, job: Job, owner: str, result: Any) -> bool:
+        """Store a job's result; False if the lease had been lost."""
+        return self._update_leased(
+            job, owner, "status = ?, result = ?, error = NULL", (self.DONE, json.dumps(result, default=str))
+        )
+
+    def fail(self, job: Job, owner: str, error: str) -> bool:
+        """Release a failed job for retry, or mark it failed when out of attempts."""
+        status = self.FAILED if job.attempts >= self.max_attempts else self.PENDING
+        return self._update_leased(job, owner, "status = ?, error = ?, lease_owner = NULL", (status, error))
+
+    def _update_leased(self, job: Job, owner: str, assignments: str, values: Tuple) -> bool:
+        conn = self._connect()
+        cursor = conn.execute(f"""
+            UPDATE jobs SET {assignments}, updated_at = ?
+            WHERE id = ? AND status = ? AND lease_owner = ?
+        """, (*values, time.time(), job.id, self.LEASED, owner))
+        conn.close()
+        return cursor.rowcount == 1
+
+    def batch_status(self, batch: str) -> Dict[str, int]:
+        """Job counts per status for a batch."""
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT status, COUNT(*) FROM jobs WHERE batch = ? GROUP BY status", (batch,)
+        ).fetchall()
+        conn.close()
+        counts = {status: 0 for status in (self.PENDING, self.LEASED, self.DONE, self.FAILED)}
+        counts.update(dict(rows))
+        return counts
+
+    def is_finished(self, batch: str) -> bool:
+        """True once every job in the batch is done or has failed for good."""
+        counts = self.batch_status(batch)
+        return counts[self.PENDING] == 0 and counts[self.LEASED] == 0
+
+    def results(self, batch: str) -> List[Any]:
+        """Results of the completed jobs in a batch, in enqueue order."""
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT result FROM jobs WHERE batch = ? AND status = ? ORDER BY id", (batch, self.DONE)
+        ).fetchall()
+        conn.close()
+        return [json.loads(result) for (result,) in rows]
+
+    def purge(self, older_than_seconds: float = 7 * 24 * 3600) -> int:
+        """Delete finished jobs older than the cutoff."""
+        conn = self._connect()
+        cursor = conn.execute(
+            "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+            (self.DONE, self.FAILED, time.time() - older_than_seconds)
+        )
+        conn.close()
+        return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, int]:
+        """Job counts per status across all batches."""
+        conn = self._connect()
+        rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        conn.close()
+        return dict(rows)
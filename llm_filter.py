@@ -2,38 +2,239 @@
 LLM-based content filtering for search result validation.
 Uses local LLM to validate if content matches search intent.
 """
-from typing import List, Dict, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, List, Dict, Optional, Tuple
 import json
+import re
+import threading
+import time
 from loguru import logger
 
+from config import config
+from discovery_budget import Deadline
+from ollama_health import get_health_monitor
+from pattern_matcher import PatternMatcher
+from relevance_model import RelevanceModel, train_from_rows
+from verdict_cache import VerdictCache
+
+# Bump when a prompt, the heuristics or the relevance model's features
+# change, so cached verdicts of that tier are not reused
+PROMPT_VERSION = "1"
+HEURISTIC_VERSION = "1"
+RELEVANCE_VERSION = "1"
+
+# Known mismatches: query term -> content phrases that contradict it
+MISMATCHES = {
+    "tech": ["texas tech", "georgia tech", "virginia tech", "louisiana tech"],
+    "gaming": ["gambling", "casino", "betting", "poker chips"],
+    "music": ["music video only"],  # If query is "music tutorial" but it's just a music video
+    "tutorial": ["live stream", "live game", "live match"],
+    "vlog": ["live stream", "live game", "live match"]
+}
+TUTORIAL_VLOG_TERMS = ["tutorial", "vlog", "how to", "guide"]
+LIVE_INDICATORS = ["live stream", "live game", "live match", "live event", "streaming now"]
+LIVE_EXCEPTIONS = ["live coding", "live tutorial"]  # "live coding tutorial" is okay
+
+# Fields of a verdict that is still being streamed. A number only counts once
+# something follows it, so a "0." cut off mid-token is never read as 0
+_STREAM_IS_MATCH = re.compile(r'"is_match"\s*:\s*"?(true|false)\b', re.IGNORECASE)
+_STREAM_CONFIDENCE = re.compile(r'"confidence"\s*:\s*"?(\d+(?:\.\d+)?)"?\s*[,}\s]')
+_STREAM_BATCH_ENTRY = re.compile(
+    r'"id"\s*:\s*"?(\d+)"?\s*,\s*"is_match"\s*:\s*"?(true|false)"?\s*,'
+    r'\s*"confidence"\s*:\s*"?(\d+(?:\.\d+)?)"?\s*[,}\s]', re.IGNORECASE
+)
+
+
+def early_verdict(text: str) -> Optional[Dict]:
+    """
+    Verdict from a partial single-item answer, once is_match and confidence are complete.
+    
+    Returns:
+        The verdict (reason left empty), or None if either field is still missing
+    """
+    is_match = _STREAM_IS_MATCH.search(text)
+    confidence = _STREAM_CONFIDENCE.search(text)
+    if not (is_match and confidence):
+        return None
+    return {
+        "is_match": is_match.group(1).lower() == "true",
+        "confidence": min(1.0, max(0.0, float(confidence.group(1)))),
+        "reason": "",
+        "method": "llm"
+    }
+
+
+def early_batch_verdicts(text: str, count: int) -> Dict[int, Dict]:
+    """Verdicts by id from a partial batch answer whose entries list id, is_match, confidence first."""
+    verdicts = {}
+    for match in _STREAM_BATCH_ENTRY.finditer(text):
+        index = int(match.group(1))
+        if 0 <= index < count and index not in verdicts:
+            verdicts[index] = {
+                "is_match": match.group(2).lower() == "true",
+                "confidence": min(1.0, max(0.0, float(match.group(3)))),
+                "reason": "",
+                "method": "llm"
+            }
+    return verdicts
+
+
+class HeuristicRules:
+    """
+    Compiled heuristic validation rules.
+    
+    Queries and contents are each scanned once by a PatternMatcher; the
+    rules are then evaluated on the sets of phrases found, in the same
+    order as the original rule lists, so verdicts and reasons do not
+    depend on how many rules there are.
+    """
+    
+    def __init__(self, mismatches: Dict[str, List[str]]):
+        self.mismatches = {term.lower(): [exclusion.lower() for exclusion in exclusions]
+                           for term, exclusions in mismatches.items()}
+        self._term_rank = {term: rank for rank, term in enumerate(self.mismatches)}
+        self._exclusion_rank: Dict[str, Dict[str, int]] = {}
+        for term, exclusions in self.mismatches.items():
+            ranks = self._exclusion_rank[term] = {}
+            for rank, exclusion in enumerate(exclusions):
+                ranks.setdefault(exclusion, rank)
+        
+        self.tutorial_terms = set(TUTORIAL_VLOG_TERMS)
+        self.live_indicators = set(LIVE_INDICATORS)
+        self.query_matcher = PatternMatcher([*self.mismatches, *TUTORIAL_VLOG_TERMS])
+        self.content_matcher = PatternMatcher([
+            *(exclusion for exclusions in self.mismatches.values() for exclusion in exclusions),
+            *LIVE_INDICATORS, *LIVE_EXCEPTIONS
+        ])
+    
+    def validate(self, query: str, title: str, description: str) -> Dict:
+        query_lower = query.lower()
+        combined = f"{title.lower()} {(description or '').lower()}"
+        return self._verdict(self.query_matcher.matches(query_lower), self.content_matcher.matches(combined))
+    
+    def validate_batch(self, items: List[Tuple[str, str, str]]) -> List[Dict]:
+        query_hits = self.query_matcher.matches_batch(query.lower() for query, _, _ in items)
+        content_hits = self.content_matcher.matches_batch(
+            f"{title.lower()} {(description or '').lower()}" for _, title, description in items
+        )
+        return [self._verdict(query, content) for query, content in zip(query_hits, content_hits)]
+    
+    def _verdict(self, query_hits: set, content_hits: set) -> Dict:
+        # Check for mismatches, first matching rule wins
+        for search_term in sorted(query_hits & self._term_rank.keys(), key=self._term_rank.get):
+            ranks = self._exclusion_rank[search_term]
+            found = [exclusion for exclusion in content_hits if exclusion in ranks]
+            if found:
+                exclusion = min(found, key=ranks.get)
+                return {
+                    "is_match": False,
+                    "confidence": 0.9,
+                    "reason": f"'{exclusion}' detected - likely mismatch for '{search_term}' search",
+                    "method": "heuristic"
+                }
+        
+        # Check for tutorial/vlog + live mismatch
+        if query_hits & self.tutorial_terms and content_hits & self.live_indicators:
+            if not content_hits.intersection(LIVE_EXCEPTIONS):
+                return {
+                    "is_match": False,
+                    "confidence": 0.85,
+                    "reason": "Tutorial/guide query returned live stream content",
+                    "method": "heuristic"
+                }
+        
+        # If no mismatches found, it's probably okay
+        return {
+            "is_match": True,
+            "confidence": 0.7,
+            "reason": "No obvious mismatches detected",
+            "method": "heuristic"
+        }
+
+
+@lru_cache(maxsize=None)
+def heuristic_rules() -> HeuristicRules:
+    """
+    The built-in rules plus HEURISTIC_MISMATCHES, compiled once per process.
+    
+    HEURISTIC_MISMATCHES is a JSON object (or the path of a file holding
+    one) mapping query terms to extra contradicting phrases.
+    """
+    mismatches = {term: list(exclusions) for term, exclusions in MISMATCHES.items()}
+    spec = (config.HEURISTIC_MISMATCHES or "").strip()
+    if spec:
+        if not spec.startswith("{"):
+            spec = Path(spec).read_text(encoding="utf-8")
+        for term, exclusions in json.loads(spec).items():
+            mismatches.setdefault(term.lower(), []).extend(exclusions)
+    return HeuristicRules(mismatches)
+
 class LLMContentValidator:
     """Validates search results using LLM reasoning."""
     
-    def __init__(self, use_local: bool = True):
+    def __init__(self, use_local: bool = True, base_url: Optional[str] = None,
+                 model: Optional[str] = None, batch_size: Optional[int] = None,
+                 cache: Optional[VerdictCache] = None, use_cache: bool = True):
         """
         Initialize validator.
         
         Args:
             use_local: Use local LLM (Ollama) vs cloud API
+            base_url: Ollama server URL (defaults to OLLAMA_URL)
+            model: Ollama model name (defaults to OLLAMA_MODEL)
+            batch_size: Items per batched prompt (defaults to LLM_BATCH_SIZE)
+            cache: Verdict cache to use (defaults to one configured from VALIDATION_CACHE_*)
+            use_cache: Set False to always validate from scratch
         """
         self.use_local = use_local
-        self.ollama_available = False
+        self._ollama_override: Optional[bool] = None
+        self.base_url = (base_url or config.OLLAMA_URL).rstrip('/')
+        self.model = model or config.OLLAMA_MODEL
+        self.batch_size = max(1, batch_size or config.LLM_BATCH_SIZE)
+        self.keep_alive = config.OLLAMA_KEEP_ALIVE  # Keep the model loaded between batches
+        self._session = None
+        self.tier_counts = {"cache": 0, "heuristic": 0, "model": 0, "llm": 0, "fallback": 0}
+        self._tier_lock = threading.Lock()
+        self.early_stops = 0  # Streamed completions abandoned once the verdict was known
+        self._relevance: Optional[RelevanceModel] = None
+        self._relevance_trained_at: Optional[float] = None  # time.monotonic() of the last training
+        self._relevance_lock = threading.RLock()
+        self.cache = None
+        if use_cache:
+            self.cache = cache if cache is not None else VerdictCache(
+                config.VALIDATION_CACHE_DB,
+                ttl_seconds=config.VALIDATION_CACHE_TTL,
+                max_entries=config.VALIDATION_CACHE_MAX_ENTRIES
+            )
         
-        if use_local:
-            self._check_ollama()
+        # Shared background probe; never blocks construction
+        self.health = get_health_monitor(self.base_url) if use_local else None
     
-    def _check_ollama(self):
-        """Check if Ollama is available locally."""
-        try:
-            import requests
-            response = requests.get('http://localhost:11434/api/tags', timeout=2)
-            self.ollama_available = response.status_code == 200
-            if self.ollama_available:
-                logger.info("✓ Ollama detected - using local LLM for filtering")
-            else:
-                logger.warning("⚠ Ollama not available - using heuristic filtering")
-        except:
-            logger.warning("⚠ Ollama not available - using heuristic filtering")
+    @property
+    def ollama_available(self) -> bool:
+        """Whether to ask the LLM, from the shared health monitor's cached state."""
+        if self._ollama_override is not None:
+            return self._ollama_override
+        return self.health is not None and self.health.available
+    
+    @ollama_available.setter
+    def ollama_available(self, value: Optional[bool]):
+        """Force LLM use on or off (None returns to the health monitor)."""
+        self._ollama_override = value
+    
+    def _report_failure(self, error: Exception, deadline: Optional[Deadline] = None):
+        """
+        Trip to heuristics until the health monitor's next successful probe.
+        
+        Only connection-level errors count (requests' exceptions are
+        OSErrors); an unparseable answer, or a call cut short by the
+        caller's deadline, says nothing about the server.
+        """
+        if deadline is not None and deadline.expired():
+            return
+        if self.health is not None and isinstance(error, OSError):
+            self.health.mark_failed(error)
     
     def validate_search_match(self, query: str, title: str, description: str = "") -> Dict:
         """
@@ -49,18 +250,262 @@ class LLMContentValidator:
                 "is_match": bool,
                 "confidence": float,
                 "reason": str,
-                "method": "llm" | "heuristic"
+                "method": "llm" | "model" | "heuristic"
             }
         """
-        if self.ollama_available:
-            return self._llm_validate(query, title, description)
+        return self.validate_batch([(query, title, description)])[0]
+    
+    def validate_batch(self, items: List[Tuple[str, str, str]], timeout: Optional[float] = None) -> List[Dict]:
+        """
+        Validate many (query, title, description) triples.
+        
+        Cached verdicts are reused (even while Ollama is down); each tier's
+        verdicts are stored under a key versioned by what produced them.
+        Cache misses go through a cascade, cheapest tier first:
+        
+        1. Compiled heuristics settle clear mismatches.
+        2. The local relevance model, trained on cached LLM verdicts,
+           settles items it is confident about.
+        3. Only the remaining ambiguous items are sent to the LLM, packed
+           ``batch_size`` to a prompt; without Ollama they keep their
+           heuristic verdict.
+        
+        ``tier_counts`` records how many items each tier resolved.
+        
+        Args:
+            items: (query, title, description) triples
+            timeout: Optional bound in seconds on the whole call; model
+                requests are given at most the time left, and items not
+                reached in time keep their heuristic verdict
+            
+        Returns:
+            One result dict (as from ``validate_search_match``) per item, in order
+        """
+        deadline = Deadline(timeout)
+        keys = [self._cache_keys(*item) for item in items]
+        if self.cache is not None:
+            cached = self.cache.get_first([tuple(item_keys.values()) for item_keys in keys])
         else:
-            return self._heuristic_validate(query, title, description)
+            cached = [None] * len(items)
+        
+        misses = {}  # LLM key -> index of the first uncached item with that key
+        for index, verdict in enumerate(cached):
+            if verdict is None:
+                misses.setdefault(keys[index]["llm"], index)
+        self._count_tier("cache", len(items) - sum(verdict is None for verdict in cached))
+        
+        fresh = dict(zip(misses, self._cascade([items[index] for index in misses.values()], deadline)))
+        if self.cache is not None:
+            verdicts, inputs = {}, {}
+            for index in misses.values():
+                verdict = fresh[keys[index]["llm"]]
+                if self._cacheable(verdict):
+                    key = keys[index][verdict['method']]
+                    verdicts[key], inputs[key] = verdict, items[index]
+            self.cache.put_many(verdicts, inputs=inputs)
+        
+        return [dict(verdict or fresh[item_keys["llm"]]) for verdict, item_keys in zip(cached, keys)]
     
-    def _llm_validate(self, query: str, title: str, description: str) -> Dict:
-        """Use local LLM (Ollama) for validation."""
-        import requests
+    def _cache_keys(self, query: str, title: str, description: str) -> Dict[str, str]:
+        """Cache key per tier, in lookup order: LLM, heuristic, relevance model."""
+        thresholds = f"{config.RELEVANCE_LOW}:{config.RELEVANCE_HIGH}"
+        return {
+            "llm": VerdictCache.key(query, title, description, self.model, PROMPT_VERSION),
+            "heuristic": VerdictCache.key(query, title, description, "heuristic", HEURISTIC_VERSION),
+            "model": VerdictCache.key(query, title, description, f"relevance:{self.model}",
+                                      f"{RELEVANCE_VERSION}:{thresholds}"),
+        }
+    
+    @staticmethod
+    def _cacheable(verdict: Dict) -> bool:
+        """
+        Whether a verdict may be reused.
+        
+        Heuristics only decide mismatches; a heuristic match is a fallback
+        for an unavailable or failed LLM and should be asked again.
+        """
+        method = verdict.get('method')
+        if 'is_match' not in verdict or method not in ("llm", "model", "heuristic"):
+            return False
+        return method != "heuristic" or not verdict['is_match']
+    
+    def _count_tier(self, tier: str, count: int = 1):
+        with self._tier_lock:
+            self.tier_counts[tier] += count
+    
+    def _cascade(self, items: List[Tuple[str, str, str]], deadline: Optional[Deadline] = None) -> List[Dict]:
+        """Validate items without consulting the cache, cheapest tier first."""
+        results: List[Optional[Dict]] = [None] * len(items)
+        heuristics = self.heuristic_validate_batch(items)
+        undecided = []
+        for index, verdict in enumerate(heuristics):
+            if verdict['is_match']:
+                undecided.append(index)  # "No obvious mismatch" is not a decision
+            else:
+                results[index] = verdict
+        self._count_tier("heuristic", len(items) - len(undecided))
+        
+        model = self.relevance_model()
+        if model is not None and undecided:
+            low, high = config.RELEVANCE_LOW, config.RELEVANCE_HIGH
+            probabilities = model.predict_proba([items[index] for index in undecided])
+            ambiguous = []
+            for index, probability in zip(undecided, probabilities):
+                if low < probability < high:
+                    ambiguous.append(index)
+                    continue
+                results[index] = {
+                    "is_match": bool(probability >= high),
+                    "confidence": round(float(max(probability, 1 - probability)), 3),
+                    "reason": f"Relevance model (p={probability:.2f})",
+                    "method": "model"
+                }
+            self._count_tier("model", len(undecided) - len(ambiguous))
+            undecided = ambiguous
         
+        if undecided and self.ollama_available:
+            escalated = self._validate_llm([items[index] for index in undecided], deadline)
+            for index, verdict in zip(undecided, escalated):
+                results[index] = verdict
+                self._count_tier("llm" if verdict.get('method') == 'llm' else "fallback")
+        else:
+            for index in undecided:
+                results[index] = heuristics[index]
+            self._count_tier("heuristic", len(undecided))
+        return results
+    
+    def _validate_llm(self, items: List[Tuple[str, str, str]], deadline: Optional[Deadline] = None) -> List[Dict]:
+        """Ask the LLM about items, one prompt per ``batch_size`` of them, until the deadline."""
+        if len(items) == 1 and not (deadline and deadline.expired()):
+            return [self._llm_validate(*items[0], deadline=deadline)]
+        
+        results = []
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            if deadline and deadline.expired():
+                results.extend(self.heuristic_validate_batch(batch))
+            else:
+                results.extend(self._llm_validate_batch(batch, deadline))
+        return results
+    
+    @staticmethod
+    def _call_timeout(timeout: float, deadline: Optional[Deadline]) -> float:
+        """A request timeout cut down to what is left of the caller's deadline."""
+        remaining = deadline.remaining() if deadline is not None else None
+        return timeout if remaining is None else max(0.001, min(timeout, remaining))
+    
+    def relevance_model(self) -> Optional[RelevanceModel]:
+        """
+        The local relevance model, trained on cached LLM verdicts.
+        
+        It is trained on first use and retrained every
+        RELEVANCE_RETRAIN_INTERVAL seconds, so a long-lived validator picks
+        up verdicts cached since (and gets a model once there are enough).
+        Only the first training makes callers wait; later ones keep serving
+        the previous model until the new one is ready.
+        
+        Returns:
+            The model, or None while it is disabled or there are too few
+            verdicts to train on
+        """
+        if not (config.RELEVANCE_MODEL and self.cache is not None):
+            return None
+        if self._relevance_stale():
+            if self._relevance_lock.acquire(blocking=self._relevance_trained_at is None):
+                try:
+                    if self._relevance_stale():
+                        self.train_relevance_model()
+                finally:
+                    self._relevance_lock.release()
+        return self._relevance
+    
+    def _relevance_stale(self) -> bool:
+        trained_at = self._relevance_trained_at
+        return trained_at is None or time.monotonic() - trained_at >= config.RELEVANCE_RETRAIN_INTERVAL
+    
+    def train_relevance_model(self) -> Optional[RelevanceModel]:
+        """(Re)train the relevance model from the verdict cache."""
+        with self._relevance_lock:
+            rows = self.cache.training_rows(limit=config.RELEVANCE_MAX_SAMPLES)
+            model = train_from_rows(rows, min_samples=config.RELEVANCE_MIN_SAMPLES)
+            if model is not None:
+                logger.info(f"Relevance model trained on {model.samples} cached LLM verdicts")
+            self._relevance = model
+            self._relevance_trained_at = time.monotonic()
+        return model
+    
+    def get_stats(self) -> Dict:
+        """Validator configuration, items resolved per tier and verdict cache statistics."""
+        with self._tier_lock:
+            tiers = dict(self.tier_counts)
+        total = sum(tiers.values())
+        return {
+            "method": "llm" if self.ollama_available else "heuristic",
+            "model": self.model if self.ollama_available else None,
+            "tiers": tiers,
+            "tier_fractions": {tier: round(count / total, 3) if total else 0.0 for tier, count in tiers.items()},
+            "early_stops": self.early_stops,
+            "relevance_model_samples": self._relevance.samples if self._relevance else 0,
+            "ollama": self.health.status() if self.health is not None else None,
+            "cache": self.cache.get_stats() if self.cache is not None else None
+        }
+    
+    def _generate(self, prompt: str, timeout: int, until: Optional[Callable[[str], bool]] = None) -> str:
+        """
+        Run one Ollama completion and return its text.
+        
+        Args:
+            prompt: Prompt text
+            timeout: Request timeout; while streaming, it applies per read
+                and also bounds the whole completion
+            until: With LLM_STREAMING, the completion is streamed and
+                abandoned as soon as ``until(text_so_far)`` is true; the
+                partial text is returned. Disconnecting makes Ollama stop
+                generating, freeing it for the next request.
+        """
+        if self._session is None:
+            import requests
+            self._session = requests.Session()  # Reuse the connection across calls
+        
+        stream = until is not None and config.LLM_STREAMING
+        response = self._session.post(
+            f'{self.base_url}/api/generate',
+            json={
+                "model": self.model,
+                "prompt": prompt,
+                "stream": stream,
+                "format": "json",
+                "keep_alive": self.keep_alive,
+                "options": {"temperature": 0}
+            },
+            timeout=timeout,
+            stream=stream
+        )
+        response.raise_for_status()
+        if not stream:
+            return response.json()['response']
+        
+        text = ""
+        give_up_at = time.monotonic() + timeout
+        try:
+            for line in response.iter_lines(chunk_size=None):  # Lines as soon as they arrive
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                text += chunk.get('response', '')
+                if chunk.get('done') or time.monotonic() >= give_up_at:
+                    break
+                if until(text):
+                    with self._tier_lock:
+                        self.early_stops += 1
+                    break
+        finally:
+            response.close()
+        return text
+    
+    def _llm_validate(self, query: str, title: str, description: str,
+                      deadline: Optional[Deadline] = None) -> Dict:
+        """Use local LLM (Ollama) for validation."""
         prompt = f"""Does this content match the search intent?
 
 Search Query: "{query}"
@@ -81,78 +526,129 @@ Answer ONLY with JSON:
 }}"""
         
         try:
-            response = requests.post(
-                'http://localhost:11434/api/generate',
-                json={
-                    "model": "llama3.2:latest",  # or whatever model is available
-                    "prompt": prompt,
-                    "stream": False,
-                    "format": "json"
-                },
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                llm_response = json.loads(result['response'])
-                llm_response['method'] = 'llm'
-                return llm_response
+            text = self._generate(prompt, timeout=self._call_timeout(10, deadline),
+                                  until=lambda text: early_verdict(text) is not None)
+            try:
+                llm_response = json.loads(text)
+            except ValueError:
+                # Streaming stopped once is_match and confidence were known
+                llm_response = early_verdict(text)
+                if llm_response is None:
+                    raise
+            llm_response['method'] = 'llm'
+            return llm_response
         except Exception as e:
             logger.warning(f"LLM validation failed: {e}, falling back to heuristics")
+            self._report_failure(e, deadline)
         
         # Fallback to heuristics
         return self._heuristic_validate(query, title, description)
     
-    def _heuristic_validate(self, query: str, title: str, description: str) -> Dict:
-        """Heuristic-based validation (no LLM needed)."""
-        query_lower = query.lower()
-        title_lower = title.lower()
-        desc_lower = description.lower()
-        combined = f"{title_lower} {desc_lower}"
-        
-        # Known mismatches
-        mismatches = {
-            "tech": ["texas tech", "georgia tech", "virginia tech", "louisiana tech"],
-            "gaming": ["gambling", "casino", "betting", "poker chips"],
-            "music": ["music video only"],  # If query is "music tutorial" but it's just a music video
-            "tutorial": ["live stream", "live game", "live match"],
-            "vlog": ["live stream", "live game", "live match"]
-        }
+    @staticmethod
+    def _batch_prompt(items: List[Tuple[str, str, str]]) -> str:
+        """One prompt asking for a verdict on every numbered item."""
+        lines = []
+        for index, (query, title, description) in enumerate(items):
+            lines.append(
+                f'{index}. Search Query: {json.dumps(query)} | Title: {json.dumps(title)}'
+                f' | Description: {json.dumps((description or "")[:300])}'
+            )
+        listing = "\n".join(lines)
         
-        # Check for mismatches
-        for search_term, exclusions in mismatches.items():
-            if search_term in query_lower:
-                for exclusion in exclusions:
-                    if exclusion in combined:
-                        return {
-                            "is_match": False,
-                            "confidence": 0.9,
-                            "reason": f"'{exclusion}' detected - likely mismatch for '{search_term}' search",
-                            "method": "heuristic"
-                        }
+        return f"""For each numbered item, does the content match its search intent?
+
+{listing}
+
+Consider:
+- "tech" tutorial ≠ "Texas Tech" sports
+- "gaming" content ≠ casino gambling
+- "music" tutorial ≠ music video
+
+Answer ONLY with JSON, one entry per item, using the item numbers as ids:
+{{"results": [
+    {{"id": 0, "is_match": true/false, "confidence": 0.0-1.0, "reason": "brief explanation"}}
+]}}"""
+    
+    @staticmethod
+    def _parse_batch_response(text: str, count: int) -> Dict[int, Dict]:
+        """
+        Extract per-item verdicts from a batch answer.
         
-        # Check for tutorial/vlog + live mismatch
-        tutorial_vlog_terms = ["tutorial", "vlog", "how to", "guide"]
-        live_indicators = ["live stream", "live game", "live match", "live event", "streaming now"]
-        
-        if any(term in query_lower for term in tutorial_vlog_terms):
-            if any(indicator in combined for indicator in live_indicators):
-                # Exception: "live coding tutorial" is okay
-                if "live coding" not in combined and "live tutorial" not in combined:
-                    return {
-                        "is_match": False,
-                        "confidence": 0.85,
-                        "reason": "Tutorial/guide query returned live stream content",
-                        "method": "heuristic"
-                    }
+        Accepts ``{"results": [...]}`` or a bare array. If the JSON as a
+        whole is broken (e.g. truncated), every complete ``{...}`` object in
+        it is salvaged individually.
         
-        # If no mismatches found, it's probably okay
-        return {
-            "is_match": True,
-            "confidence": 0.7,
-            "reason": "No obvious mismatches detected",
-            "method": "heuristic"
-        }
+        Returns:
+            Verdicts by item id; ids the answer did not cover are absent
+        """
+        try:
+            parsed = json.loads(text)
+            entries = parsed.get('results', []) if isinstance(parsed, dict) else parsed
+        except ValueError:
+            decoder = json.JSONDecoder()
+            entries = []
+            position = text.find('{')
+            while position != -1:
+                try:
+                    entry, end = decoder.raw_decode(text, position)
+                except ValueError:
+                    position = text.find('{', position + 1)
+                    continue
+                if isinstance(entry, dict) and 'id' in entry:
+                    entries.append(entry)
+                    position = text.find('{', end)
+                else:
+                    position = text.find('{', position + 1)
+        
+        verdicts = {}
+        for entry in entries if isinstance(entries, list) else []:
+            try:
+                index = int(entry['id'])
+                is_match = entry['is_match']
+                if isinstance(is_match, str):
+                    is_match = is_match.strip().lower() == 'true'
+                verdict = {
+                    "is_match": bool(is_match),
+                    "confidence": min(1.0, max(0.0, float(entry.get('confidence', 0.5)))),
+                    "reason": str(entry.get('reason', '')),
+                    "method": "llm"
+                }
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 0 <= index < count and index not in verdicts:
+                verdicts[index] = verdict
+        return verdicts
+    
+    def _llm_validate_batch(self, items: List[Tuple[str, str, str]],
+                            deadline: Optional[Deadline] = None) -> List[Dict]:
+        """Validate one batch with a single model call, filling gaps with heuristics."""
+        verdicts = {}
+        count = len(items)
+        try:
+            timeout = self._call_timeout(config.LLM_TIMEOUT, deadline)
+            text = self._generate(self._batch_prompt(items), timeout=timeout,
+                                  until=lambda text: len(early_batch_verdicts(text, count)) == count)
+            verdicts = self._parse_batch_response(text, count)
+            for index, verdict in early_batch_verdicts(text, count).items():
+                verdicts.setdefault(index, verdict)  # Entries cut off after their confidence
+        except Exception as e:
+            logger.warning(f"LLM batch validation failed: {e}, falling back to heuristics")
+            self._report_failure(e, deadline)
+        
+        if len(verdicts) < len(items):
+            logger.debug(f"LLM answered {len(verdicts)}/{len(items)} items; using heuristics for the rest")
+        return [
+            verdicts.get(index) or self._heuristic_validate(*item)
+            for index, item in enumerate(items)
+        ]
+    
+    def _heuristic_validate(self, query: str, title: str, description: str) -> Dict:
+        """Heuristic-based validation (no LLM needed)."""
+        return heuristic_rules().validate(query, title, description)
+    
+    def heuristic_validate_batch(self, items: List[Tuple[str, str, str]]) -> List[Dict]:
+        """Heuristic verdicts for many (query, title, description) triples."""
+        return heuristic_rules().validate_batch(items)
     
     def filter_results(self, query: str, results: List[Dict]) -> List[Dict]:
         """
@@ -166,14 +662,12 @@ Answer ONLY with JSON:
             Filtered list with only matching results
         """
         filtered = []
+        validations = self.validate_batch([
+            (query, result.get('title', ''), result.get('description', '') or result.get('snippet', ''))
+            for result in results
+        ])
         
-        for result in results:
-            validation = self.validate_search_match(
-                query,
-                result.get('title', ''),
-                result.get('description', '') or result.get('snippet', '')
-            )
-            
+        for result, validation in zip(results, validations):
             if validation['is_match']:
                 result['validation'] = validation
                 filtered.append(result)
@@ -186,6 +680,7 @@ Answer ONLY with JSON:
 # Quick test
 if __name__ == "__main__":
     validator = LLMContentValidator()
+    validator.health.wait_ready(5)
     
     test_cases = [
         {
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Mock Ollama Server - Offline stand-in for the Ollama HTTP API.
+Serves ``/api/tags`` and ``/api/generate`` (streamed or not) with
+configurable latency so validation throughput can be measured without a
+model. Verdicts come from
+the heuristic validator, answered in the format the prompt asks for
+(batched ``{"results": [...]}`` or a single verdict).
+
+Usage:
+    python mock_ollama.py --port 11434 --latency 0.5 --token-latency 0.02 --parallel 4
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+# Lines of LLMContentValidator._batch_prompt: 0. Search Query: "q" | Title: "t" | Description: "d"
+_BATCH_ITEM = re.compile(r'^(\d+)\. Search Query: (".*?") \| Title: (".*?") \| Description: (".*")$', re.MULTILINE)
+TOKEN_CHARS = 4  # Characters per streamed "token"
+_SINGLE_ITEM = re.compile(r'Search Query: "(.*)"\nContent Title: "(.*)"\nDescription: "(.*)"')
+
+
+def answer(prompt: str) -> Dict:
+    """Verdict JSON for a validation prompt."""
+    from llm_filter import LLMContentValidator
+
+    heuristic = LLMContentValidator(use_local=False, use_cache=False)._heuristic_validate
+    batch = _BATCH_ITEM.findall(prompt)
+    if batch:
+        results = []
+        for index, query, title, description in batch:
+            verdict = heuristic(json.loads(query), json.loads(title), json.loads(description))
+            results.append({"id": int(index), "is_match": verdict["is_match"],
+                            "confidence": verdict["confidence"], "reason": verdict["reason"]})
+        return {"results": results}
+
+    single = _SINGLE_ITEM.search(prompt)
+    verdict = heuristic(*single.groups()) if single else {"is_match": True, "confidence": 0.5, "reason": "mock"}
+    return {key: verdict[key] for key in ("is_match", "confidence", "reason")}
+
+
+class MockOllamaServer(ThreadingHTTPServer):
+    """HTTP server with the latency model shared by its request handlers."""
+
+    daemon_threads = True
+
+    def __init__(self, address, latency: float = 0.5, per_item_latency: float = 0.0,
+                 token_latency: float = 0.0, parallel: Optional[int] = None, model: str = "llama3.2:latest"):
+        super().__init__(address, MockOllamaHandler)
+        self.latency = latency
+        self.per_item_latency = per_item_latency
+        self.token_latency = token_latency
+        self.model = model
+        # Like OLLAMA_NUM_PARALLEL: requests beyond this many wait their turn
+        self.slots = threading.Semaphore(parallel) if parallel else None
+        self.requests = 0
+        self.aborted = 0  # Streams the client hung up on before the end
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class MockOllamaHandler(BaseHTTPRequestHandler):
+    server: MockOllamaServer
+    protocol_version = "HTTP/1.1"  # Keep-alive and chunked streaming, as Ollama serves
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output clean
+
+    def _send_json(self, payload: Dict, status: int = 200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path == "/api/tags":
+            self._send_json({"models": [{"name": self.server.model}]})
+        else:
+            self._send_json({"error": "not found"}, 404)
+
+    def do_POST(self):
+        if self.path != "/api/generate":
+            self._send_json({"error": "not found"}, 404)
+            return
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        prompt = request.get("prompt", "")
+        with self.server._lock:
+            self.server.requests += 1
+
+        if self.server.slots:
+            with self.server.slots:
+                self._generate(request, prompt)
+        else:
+            self._generate(request, prompt)
+
+    def _generate(self, request: Dict, prompt: str):
+        model = request.get("model", self.server.model)
+        text = json.dumps(answer(prompt))
+        tokens = [text[i:i + TOKEN_CHARS] for i in range(0, len(text), TOKEN_CHARS)]
+        time.sleep(self.server.latency + self.server.per_item_latency * max(1, len(_BATCH_ITEM.findall(prompt))))
+
+        if not request.get("stream", True):
+            time.sleep(self.server.token_latency * len(tokens))
+            self._send_json({"model": model, "response": text, "done": True})
+            return
+
+        # Newline-delimited JSON, one chunk per token, like Ollama's stream
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for token in tokens:
+                time.sleep(self.server.token_latency)
+                self._send_chunk(json.dumps({"model": model, "response": token, "done": False}).encode() + b"\n")
+            self._send_chunk(json.dumps({"model": model, "response": "", "done": True}).encode() + b"\n")
+            self._send_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+            # The client stopped reading; a real server would cancel the generation here
+            with self.server._lock:
+                self.server.aborted += 1
+
+
+def serve_in_thread(host: str = "127.0.0.1", port: int = 0, **options) -> MockOllamaServer:
+    """
+    Start a mock server on a background thread.
+
+    Args:
+        port: 0 picks a free port; read it back from ``server.url``
+        options: MockOllamaServer latency/parallel/model options
+
+    Returns:
+        The running server; call ``shutdown()`` when done
+    """
+    server = MockOllamaServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05},
+                     name="mock-ollama", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock Ollama API server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=11434)
+    parser.add_argument('--latency', type=float, default=0.5, help='Seconds per request')
+    parser.add_argument('--per-item', type=float, default=0.0, help='Extra seconds per prompt item')
+    parser.add_argument('--token-latency', type=float, default=0.0, help='Seconds per generated token')
+    parser.add_argument('--parallel', type=int, default=None, help='Requests served at once (default unlimited)')
+    args = parser.parse_args()
+
+    server = MockOllamaServer((args.host, args.port), latency=args.latency,
+                              per_item_latency=args.per_item, token_latency=args.token_latency,
+                              parallel=args.parallel)
+    print(f"Mock Ollama listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Ollama Health Monitor - Shared, non-blocking availability state.
+One monitor per Ollama URL per process probes ``/api/tags`` on a
+background thread and caches whether the server is up and which models it
+has. Validators read that state without waiting. A failed model call marks
+the server down right away; probes then back off exponentially until one
+succeeds.
+"""
+import threading
+import time
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from config import config
+
+
+class OllamaHealthMonitor:
+    """Background prober for one Ollama server."""
+
+    def __init__(self, base_url: str, interval: Optional[float] = None, max_backoff: Optional[float] = None,
+                 probe_timeout: float = 2.0):
+        """
+        Args:
+            base_url: Ollama server URL
+            interval: Seconds between probes while the server is up
+                (defaults to OLLAMA_HEALTH_INTERVAL)
+            max_backoff: Longest wait between probes while it is down
+                (defaults to OLLAMA_HEALTH_MAX_BACKOFF)
+            probe_timeout: Timeout of one probe request
+        """
+        self.base_url = base_url.rstrip('/')
+        self.interval = interval or config.OLLAMA_HEALTH_INTERVAL
+        self.max_backoff = max_backoff or config.OLLAMA_HEALTH_MAX_BACKOFF
+        self.probe_timeout = probe_timeout
+        self.available = False  # Unknown counts as down until the first probe answers
+        self.models: List[str] = []
+        self.failures = 0  # Consecutive failed probes or calls
+        self.last_error: Optional[str] = None
+        self.last_probe_at: Optional[float] = None
+        self.next_probe_at = 0.0
+        self.probes = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def backoff(self) -> float:
+        """Seconds until the next probe after ``failures`` consecutive failures."""
+        if not self.failures:
+            return self.interval
+        return min(self.max_backoff, 2.0 ** (self.failures - 1))
+
+    def probe_now(self) -> bool:
+        """Probe synchronously, update the cached state and return availability."""
+        try:
+            import requests
+            response = requests.get(f'{self.base_url}/api/tags', timeout=self.probe_timeout)
+            response.raise_for_status()
+            models = [model.get('name', '') for model in response.json().get('models', [])]
+        except Exception as e:
+            self._set_down(f"probe failed: {e}")
+        else:
+            with self._lock:
+                if not self.available:
+                    logger.info(f"✓ Ollama detected at {self.base_url} - using local LLM for filtering")
+                self.available = True
+                self.models = models
+                self.failures = 0
+                self.last_error = None
+                self.next_probe_at = time.monotonic() + self.backoff()
+        with self._lock:
+            self.probes += 1
+            self.last_probe_at = time.time()
+        self._ready.set()
+        return self.available
+
+    def mark_failed(self, error) -> None:
+        """Record a failed model call: heuristics until a probe succeeds again."""
+        self._set_down(f"call failed: {error}")
+        self._wake.set()  # Reschedule the next probe from the new backoff
+
+    def _set_down(self, error: str):
+        with self._lock:
+            if self.available or not self.failures:
+                logger.warning(f"⚠ Ollama not available ({error}) - using heuristic filtering")
+            self.available = False
+            self.failures += 1
+            self.last_error = error
+            self.next_probe_at = time.monotonic() + self.backoff()
+
+    def has_model(self, name: str) -> bool:
+        return name in self.models
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the first probe has answered (for scripts and tests)."""
+        return self._ready.wait(timeout)
+
+    def start(self) -> "OllamaHealthMonitor":
+        """Start the background probe thread (idempotent)."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ollama-health", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            delay = self.next_probe_at - time.monotonic()
+            if delay > 0:
+                self._wake.wait(delay)
+                self._wake.clear()
+                continue  # Woken early: re-read the schedule
+            self.probe_now()
+
+    def status(self) -> Dict:
+        with self._lock:
+            return {
+                "url": self.base_url,
+                "available": self.available,
+                "models": list(self.models),
+                "failures": self.failures,
+                "last_error": self.last_error,
+                "last_probe_at": self.last_probe_at,
+                "next_probe_in": round(max(0.0, self.next_probe_at - time.monotonic()), 1),
+                "probes": self.probes
+            }
+
+
+_monitors: Dict[str, OllamaHealthMonitor] = {}
+_monitors_lock = threading.Lock()
+
+
+def get_health_monitor(base_url: Optional[str] = None) -> OllamaHealthMonitor:
+    """The process-wide, already started monitor for an Ollama URL."""
+    base_url = (base_url or config.OLLAMA_URL).rstrip('/')
+    with _monitors_lock:
+        monitor = _monitors.get(base_url)
+        if monitor is None:
+            monitor = _monitors[base_url] = OllamaHealthMonitor(base_url).start()
+    return monitor
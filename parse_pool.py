@@ -0,0 +1,144 @@
+"""
+Parse Pool - Runs CPU-bound page parsing on worker processes.
+Downloads stay on the crawler's threads; each downloaded page goes to the
+pool as raw bytes (which pickle as one buffer copy) and comes back as a
+batch of results. Fetching the next page therefore overlaps parsing of the
+previous ones, and parse throughput grows with the number of cores.
+
+Run as a script to measure parse throughput per process count:
+    python parse_pool.py --pages 400
+"""
+import argparse
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from loguru import logger
+
+from config import config
+
+
+def completed(value) -> Future:
+    """A future that already holds ``value``."""
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+
+class ParsePool:
+    """
+    Process pool for parse functions, with an in-process fallback.
+
+    With one process (or inside a daemonic worker process, which may not
+    start children) ``submit`` runs the function right away and returns a
+    finished future, so callers handle both modes the same way.
+    """
+
+    def __init__(self, processes: Optional[int] = None):
+        """
+        Args:
+            processes: Parser processes (defaults to REVERSE_PARSE_PROCESSES;
+                0 = one per core, 1 = parse in the calling thread)
+        """
+        processes = config.REVERSE_PARSE_PROCESSES if processes is None else processes
+        self.processes = processes or os.cpu_count() or 1
+        if multiprocessing.current_process().daemon:
+            self.processes = 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.inline = 0
+
+    @property
+    def parallel(self) -> bool:
+        return self.processes > 1
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Spawned workers do not inherit the crawler's threads and locks
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def submit(self, fn: Callable, *args) -> Future:
+        """
+        Run ``fn(*args)`` on a worker process.
+
+        ``fn`` must be a module-level function and its arguments picklable.
+        """
+        self.submitted += 1
+        if self.parallel:
+            try:
+                return self._pool().submit(fn, *args)
+            except (BrokenProcessPool, RuntimeError) as e:
+                logger.warning(f"Parse pool unavailable ({e}) - parsing in-process")
+                self.close()
+                self.processes = 1
+        self.inline += 1
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict:
+        return {"processes": self.processes, "submitted": self.submitted, "inline": self.inline}
+
+
+_pool: Optional[ParsePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> ParsePool:
+    """Process-wide parse pool shared by every crawler."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ParsePool()
+    return _pool
+
+
+def benchmark(pages: int, processes: int) -> float:
+    """Google fixture pages parsed per second with ``processes`` parser processes."""
+    from reverse_discovery import GOOGLE_PAGE, parse_page
+
+    body = (Path(__file__).parent / 'tests' / 'test_data' / 'google_serp.html').read_bytes()
+    pool = ParsePool(processes)
+    try:
+        pool.submit(parse_page, GOOGLE_PAGE, body, 1).result()  # Start the workers
+        started = time.perf_counter()
+        futures = [pool.submit(parse_page, GOOGLE_PAGE, body, page_num) for page_num in range(1, pages + 1)]
+        for future in futures:
+            future.result()
+        return pages / (time.perf_counter() - started)
+    finally:
+        pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure result page parse throughput per process count')
+    parser.add_argument('--pages', type=int, default=400)
+    parser.add_argument('--processes', type=int, nargs='*', help='Process counts (default: 1 up to one per core)')
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    for processes in args.processes or sorted({1, 2, cores // 2, cores} - {0}):
+        print(f"{processes:>3} processes: {benchmark(args.pages, processes):8.1f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Pattern Matcher - Multi-pattern substring search.
+Heuristic validation and spam filtering check every text against lists of
+phrases. Short lists are checked with plain ``in`` tests, which run in C and
+are hard to beat below about a hundred phrases. Longer lists are compiled into a
+single regular expression shaped like a trie of the phrases (common
+prefixes factored out), so one C-speed pass over the text finds all of them
+and the cost per text grows with its length rather than with the list.
+
+Run as a script to compare both against per-phrase ``in`` checks:
+    python pattern_matcher.py --texts 5000
+"""
+import argparse
+import random
+import re
+import string
+import time
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+
+def _trie_regex(patterns: Iterable[str]) -> str:
+    """
+    Alternation matching any of ``patterns``, longest first at each position.
+
+    The patterns are merged into a trie and written out as nested groups, so
+    alternatives that share a prefix share its test.
+    """
+    trie: Dict = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = {}  # End of a pattern
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # Greedy: a longer pattern through this node is preferred to ending here
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class PatternMatcher:
+    """
+    Finds every occurrence of a fixed set of substrings.
+
+    Matching is plain substring matching (like ``pattern in text``),
+    including overlapping matches. Patterns are lowercased when added and
+    texts are expected to be lowercase already, mirroring how the filters
+    compare. With more than ``SCAN_MAX_PATTERNS`` patterns a trie-shaped
+    regular expression is compiled (lazily, after ``add``).
+    """
+
+    SCAN_MAX_PATTERNS = 128  # Up to this, per-pattern ``in`` checks beat one regex pass (see main())
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self._patterns: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._regex: Optional[Pattern] = None
+        self._prefixes: Dict[str, Tuple[str, ...]] = {}
+        self._compiled = False
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern: str) -> int:
+        """Add a pattern (duplicates are ignored) and return its id."""
+        pattern = pattern.lower()
+        if not pattern:
+            raise ValueError("Empty patterns would match everywhere")
+        if pattern not in self._index:
+            self._index[pattern] = len(self._patterns)
+            self._patterns.append(pattern)
+            self._compiled = False
+        return self._index[pattern]
+
+    @property
+    def patterns(self) -> List[str]:
+        return list(self._patterns)
+
+    @property
+    def uses_regex(self) -> bool:
+        """Whether texts are scanned with the compiled expression rather than ``in`` checks."""
+        return len(self._patterns) > self.SCAN_MAX_PATTERNS
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __contains__(self, pattern: str) -> bool:
+        return pattern.lower() in self._index
+
+    def _compile(self):
+        """
+        Build the expression and each pattern's prefixes that are patterns too.
+
+        A scan reports only the longest pattern starting at each position;
+        every shorter pattern starting there is a prefix of it, so it is
+        recovered from ``_prefixes``.
+        """
+        self._compiled = True
+        if not self.uses_regex:
+            self._regex = None
+            self._prefixes = {}
+            return
+        self._regex = re.compile(_trie_regex(self._patterns))
+        known = self._index.keys()
+        self._prefixes = {
+            pattern: tuple(pattern[:end] for end in range(len(pattern), 0, -1) if pattern[:end] in known)
+            for pattern in self._patterns
+        }
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, str]]:
+        """
+        Yield (end_position, pattern) for every occurrence in ``text``.
+
+        ``end_position`` is the index just past the match; occurrences come
+        in order of where they end, longer patterns first.
+        """
+        if not self._compiled:
+            self._compile()
+        found = []
+        if self._regex is None:
+            for pattern in self._patterns:
+                start = text.find(pattern)
+                while start >= 0:
+                    found.append((start + len(pattern), pattern))
+                    start = text.find(pattern, start + 1)
+        else:
+            for match in self._longest_matches(text):
+                start = match.start()
+                found.extend((start + len(pattern), pattern) for pattern in self._prefixes[match.group()])
+        found.sort(key=lambda hit: (hit[0], -len(hit[1])))
+        return iter(found)
+
+    def _longest_matches(self, text: str) -> Iterable:
+        """
+        The longest match starting at every position that starts one.
+
+        Each search resumes one character after the previous match's start,
+        so overlapping matches are found, while the expression's own scan
+        (in C) skips the positions in between.
+        """
+        search = self._regex.search
+        match = search(text)
+        while match is not None:
+            yield match
+            match = search(text, match.start() + 1)
+
+    def matches(self, text: str) -> Set[str]:
+        """Distinct patterns occurring in ``text``."""
+        if not self._compiled:
+            self._compile()
+        if self._regex is None:
+            return {pattern for pattern in self._patterns if pattern in text}
+        found: Set[str] = set()
+        for match in self._longest_matches(text):
+            found.update(self._prefixes[match.group()])
+        return found
+
+    def search(self, text: str) -> bool:
+        """True if any pattern occurs in ``text`` (stops at the first one)."""
+        if not self._compiled:
+            self._compile()
+        if self._regex is None:
+            return any(pattern in text for pattern in self._patterns)
+        return self._regex.search(text) is not None
+
+    def matches_batch(self, texts: Iterable[str]) -> List[Set[str]]:
+        """``matches`` for many texts, compiling at most once."""
+        return [self.matches(text) for text in texts]
+
+
+def benchmark(texts: List[str], patterns: List[str], repeat: int = 3) -> Dict:
+    """
+    Seconds to find the patterns of every text, best of ``repeat`` runs.
+
+    Returns:
+        Timings of per-pattern ``in`` checks and of a PatternMatcher
+    """
+    matcher = PatternMatcher(patterns)
+    patterns = matcher.patterns
+
+    def best(find) -> float:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for text in texts:
+                find(text)
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    return {
+        "patterns": len(patterns),
+        "mode": "regex" if matcher.uses_regex else "scan",
+        "in_checks": best(lambda text: {pattern for pattern in patterns if pattern in text}),
+        "matcher": best(matcher.matches),
+    }
+
+
+def main():
+    from llm_filter import heuristic_rules
+
+    parser = argparse.ArgumentParser(description='Compare phrase matching against per-phrase in checks')
+    parser.add_argument('--texts', type=int, default=5000)
+    parser.add_argument('--sizes', type=int, nargs='*', default=[0, 50, 200, 1000],
+                        help='Extra random phrases added to the built-in rules')
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    builtin = heuristic_rules().content_matcher.patterns
+    words = builtin + "the stream gaming tutorial coding python minecraft recipe vlog day".split()
+    texts = [" ".join(rng.choice(words) for _ in range(rng.randint(8, 20))) for _ in range(args.texts)]
+
+    print(f"{'patterns':>8} {'mode':<6} {'in checks':>10} {'matcher':>10} {'speedup':>8}")
+    for extra in args.sizes:
+        patterns = builtin + ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+                              for _ in range(extra)]
+        row = benchmark(texts, patterns)
+        print(f"{row['patterns']:>8} {row['mode']:<6} {row['in_checks']:>9.4f}s {row['matcher']:>9.4f}s "
+              f"{row['in_checks'] / row['matcher']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
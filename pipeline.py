@@ -0,0 +1,201 @@
+"""
+Staged Streaming Pipeline
+Connects processing stages with bounded asyncio queues so each stage runs
+its own workers, slow stages apply backpressure instead of buffering
+everything, and every stage reports its throughput and queue depth.
+"""
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+_DONE = object()  # End-of-stream marker, one per downstream worker
+
+
+@dataclass
+class StageStats:
+    """Counters for one pipeline stage."""
+    name: str
+    workers: int
+    queue_size: int
+    processed: int = 0
+    emitted: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    queue_depth: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def throughput(self) -> float:
+        """Items consumed per second of wall time the stage was running."""
+        if not self.started_at:
+            return 0.0
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "emitted": self.emitted,
+            "errors": self.errors,
+            "throughput_per_second": round(self.throughput, 2),
+            "busy_seconds": round(self.busy_seconds, 3),
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "queue_size": self.queue_size
+        }
+
+
+class Stage:
+    """
+    One step of a pipeline.
+
+    The handler takes a single input item and returns an iterable of output
+    items (empty to drop it, several to fan out). Generators are consumed
+    lazily, so a fetch stage can hand each page downstream as soon as it
+    arrives. Blocking handlers run in worker threads so they never stall the
+    event loop; coroutine handlers are awaited directly.
+    """
+
+    def __init__(self, name: str, handler: Callable[[Any], Any], workers: int = 1,
+                 queue_size: int = 8, blocking: bool = False):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue_size = queue_size
+        self.blocking = blocking
+
+
+class Pipeline:
+    """Runs stages connected by bounded queues."""
+
+    def __init__(self, stages: List[Stage]):
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.stages = stages
+        self.stats: Dict[str, StageStats] = {}
+        self.timed_out = False
+
+    async def run(self, items: Iterable[Any], timeout: Optional[float] = None) -> List[Any]:
+        """
+        Feed ``items`` into the first stage and run until every stage drains.
+
+        Args:
+            items: Inputs for the first stage
+            timeout: Seconds to run before cancelling every stage; whatever the
+                last stage emitted by then is returned and ``timed_out`` is set
+
+        Returns:
+            Items emitted by the last stage
+        """
+        self.timed_out = False
+        self.stats = {
+            stage.name: StageStats(name=stage.name, workers=stage.workers, queue_size=stage.queue_size)
+            for stage in self.stages
+        }
+        queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        results: List[Any] = []
+
+        tasks = [asyncio.create_task(self._feed(items, queues[0], self.stages[0]))]
+        for index, stage in enumerate(self.stages):
+            downstream = queues[index + 1] if index + 1 < len(queues) else None
+            next_workers = self.stages[index + 1].workers if downstream else 0
+            tasks.append(asyncio.create_task(
+                self._run_stage(stage, queues[index], downstream, next_workers, results)
+            ))
+
+        try:
+            if timeout is None:
+                await asyncio.gather(*tasks)
+            else:
+                done, pending = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    task.result()  # Re-raise a stage failure
+                if pending:
+                    self.timed_out = True
+                    logger.warning(f"Pipeline cancelled after {timeout:.1f}s with {len(results)} results")
+        finally:
+            for task in tasks:
+                task.cancel()
+        return results
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-stage counters from the current or most recent run."""
+        return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+    async def _feed(self, items: Iterable[Any], queue: asyncio.Queue, first: Stage):
+        for item in items:
+            await self._put(queue, item, self.stats[first.name])
+        for _ in range(first.workers):
+            await queue.put(_DONE)
+
+    async def _put(self, queue: asyncio.Queue, item: Any, stats: StageStats):
+        await queue.put(item)  # Blocks while the downstream queue is full
+        stats.queue_depth = queue.qsize()
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+
+    async def _run_stage(self, stage: Stage, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue],
+                         next_workers: int, results: List[Any]):
+        stats = self.stats[stage.name]
+        stats.started_at = time.time()
+        await asyncio.gather(*(self._worker(stage, inbox, outbox, results) for _ in range(stage.workers)))
+        stats.finished_at = time.time()
+        if outbox is not None:
+            for _ in range(next_workers):
+                await outbox.put(_DONE)
+
+    async def _worker(self, stage: Stage, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue],
+                      results: List[Any]):
+        stats = self.stats[stage.name]
+        downstream = self.stats[self.stages[self.stages.index(stage) + 1].name] if outbox is not None else None
+
+        while True:
+            item = await inbox.get()
+            stats.queue_depth = inbox.qsize()
+            if item is _DONE:
+                return
+
+            started = time.perf_counter()
+            try:
+                async for output in self._outputs(stage, item):
+                    stats.emitted += 1
+                    if outbox is None:
+                        results.append(output)
+                    else:
+                        stats.busy_seconds += time.perf_counter() - started
+                        await self._put(outbox, output, downstream)
+                        started = time.perf_counter()
+            except Exception as e:
+                stats.errors += 1
+                logger.error(f"Pipeline stage '{stage.name}' failed on an item: {e}")
+            finally:
+                stats.processed += 1
+                stats.busy_seconds += time.perf_counter() - started
+
+    async def _outputs(self, stage: Stage, item: Any):
+        """Run the handler on one item and yield its outputs."""
+        if inspect.iscoroutinefunction(stage.handler):
+            produced = await stage.handler(item)
+        elif stage.blocking:
+            produced = await asyncio.to_thread(stage.handler, item)
+        else:
+            produced = stage.handler(item)
+
+        if produced is None:
+            return
+        if stage.blocking and inspect.isgenerator(produced):
+            # Step blocking generators in a thread so each output streams out
+            while True:
+                output = await asyncio.to_thread(next, produced, _DONE)
+                if output is _DONE:
+                    return
+                yield output
+        else:
+            for output in produced:
+                yield output
@@ -0,0 +1,111 @@
+"""
+Politeness - Per-host request pacing and per-query crawl budgets.
+Requests to the same host are spaced at least a minimum interval (plus
+random jitter) apart, while requests to different hosts go out
+concurrently. A crawl run therefore takes about as long as the busiest
+host's politeness limit, not the sum of every delay.
+"""
+import random
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from config import config
+
+
+class HostScheduler:
+    """
+    Hands out request slots per host.
+
+    ``wait`` reserves the host's next free slot under a lock and then
+    sleeps outside it, so threads waiting on one host never delay
+    requests to another.
+    """
+
+    def __init__(self, min_interval: float = 1.0, jitter: float = 2.0):
+        """
+        Args:
+            min_interval: Minimum seconds between requests to one host
+            jitter: Extra random seconds (0..jitter) added to each interval
+        """
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.waited = 0.0  # Total seconds spent waiting for slots
+
+    @classmethod
+    def from_range(cls, delay_range: Tuple[float, float]) -> "HostScheduler":
+        """Scheduler spacing requests per host by a (min, max) seconds range."""
+        low, high = delay_range
+        return cls(min_interval=low, jitter=max(0.0, high - low))
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def reserve(self, url: str) -> float:
+        """Reserve the host's next slot and return the seconds until it."""
+        host = self.host(url)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval + random.uniform(0, self.jitter)
+            delay = slot - now
+            self.waited += delay
+        return delay
+
+    def wait(self, url: str):
+        """Block until a request to ``url``'s host is allowed."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    def get_stats(self) -> Dict:
+        """Hosts paced so far and the seconds requests spent waiting for their slots."""
+        with self._lock:
+            return {"hosts": len(self._next_slot), "waited_seconds": round(self.waited, 3)}
+
+
+class CrawlBudget:
+    """Caps the number of requests spent on each query."""
+
+    def __init__(self, limit: Optional[int] = None):
+        """
+        Args:
+            limit: Requests allowed per query (defaults to
+                REVERSE_QUERY_BUDGET; 0 = unlimited)
+        """
+        self.limit = config.REVERSE_QUERY_BUDGET if limit is None else limit
+        self.spent: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str) -> bool:
+        """Spend one request for ``key``; False once its budget is used up."""
+        with self._lock:
+            spent = self.spent.get(key, 0)
+            if self.limit and spent >= self.limit:
+                return False
+            self.spent[key] = spent + 1
+            return True
+
+    def remaining(self, key: str) -> Optional[int]:
+        """Requests left for ``key`` (None when unlimited)."""
+        if not self.limit:
+            return None
+        with self._lock:
+            return max(0, self.limit - self.spent.get(key, 0))
+
+
+_scheduler: Optional[HostScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_host_scheduler() -> HostScheduler:
+    """Process-wide scheduler, so every crawler shares each host's pace."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = HostScheduler(config.REVERSE_MIN_INTERVAL, config.REVERSE_JITTER)
+    return _scheduler
@@ -10,6 +10,7 @@ import threading
 from pathlib import Path
 
 # Import existing working code (ZERO MODIFICATIONS)
+from config import config
 from simple_web_ui import SimpleWebUI
 from loguru import logger
 
@@ -55,7 +56,7 @@ def start_server():
         @app.get("/")
         async def root():
             """Serve the main feed page."""
-            html_file = Path("counter_exposure_feed.html")
+            html_file = Path(config.FEED_HTML_FILE)
             if html_file.exists():
                 return FileResponse(html_file)
             return HTMLResponse(
@@ -68,7 +69,7 @@ def start_server():
             """Health check for Railway."""
             return {
                 "status": "healthy",
-                "feed_exists": Path("counter_exposure_feed.html").exists()
+                "feed_exists": Path(config.FEED_HTML_FILE).exists()
             }
         
         logger.info(f"🚀 Starting web server on port {PORT}")
@@ -82,7 +83,7 @@ def start_server():
         
         @app.route("/")
         def root():
-            html_file = Path("counter_exposure_feed.html")
+            html_file = Path(config.FEED_HTML_FILE)
             if html_file.exists():
                 return send_file(html_file)
             return "<h1>🔍 Discovering content...</h1><p>Refresh in a moment!</p>"
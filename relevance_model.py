@@ -0,0 +1,148 @@
+"""
+Relevance Model - Cheap local query/content relevance classifier.
+A logistic regression over hashed features of a (query, title,
+description) triple: how similar the query and the content are
+(character trigram and word overlap) plus hashed query-word x
+content-word pairs, so it can learn that "tech" next to "texas" is a
+mismatch. It is trained on verdicts the LLM already gave (see
+VerdictCache.training_rows) and lets the validator settle confident
+items without a model call.
+"""
+import math
+import re
+import zlib
+from typing import List, Optional, Sequence, Tuple
+
+np = None  # numpy, imported on first fit/predict
+
+
+def _numpy():
+    """Import numpy on first use; returns None when it is not installed."""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+        np = numpy
+    return np
+
+
+_WORD = re.compile(r"\w+")
+
+# Dense features occupy the first columns; hashed features the rest
+_BIAS, _TRIGRAM_COSINE, _QUERY_COVERAGE, _NO_DESCRIPTION = range(4)
+_DENSE = 4
+
+
+def _trigrams(text: str) -> set:
+    text = f" {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class RelevanceModel:
+    """
+    Hashed-feature logistic regression, trained with Adagrad in NumPy.
+
+    Feature matrices are kept sparse as (row, column, value) arrays, and
+    margins and gradients are computed with ``np.bincount``, so training on
+    tens of thousands of verdicts needs no dense matrix.
+    """
+
+    def __init__(self, dim: int = 2 ** 18, l2: float = 1e-4):
+        self.dim = dim
+        self.l2 = l2
+        self.weights = None
+        self.samples = 0
+
+    @property
+    def trained(self) -> bool:
+        return self.weights is not None
+
+    def _hash(self, feature: str) -> int:
+        return _DENSE + zlib.crc32(feature.encode("utf-8")) % (self.dim - _DENSE)
+
+    def features(self, query: str, title: str, description: str = "") -> List[Tuple[int, float]]:
+        """(column, value) pairs for one triple."""
+        query = query.lower()
+        content = f"{title} {description or ''}".lower()
+        query_words = _WORD.findall(query)
+        content_words = set(_WORD.findall(content))
+
+        query_grams, content_grams = _trigrams(query), _trigrams(content)
+        overlap = len(query_grams & content_grams)
+        cosine = overlap / math.sqrt(len(query_grams) * len(content_grams)) if query_grams and content_grams else 0.0
+        coverage = sum(word in content_words for word in query_words) / len(query_words) if query_words else 0.0
+
+        pairs = [(_BIAS, 1.0), (_TRIGRAM_COSINE, cosine), (_QUERY_COVERAGE, coverage),
+                 (_NO_DESCRIPTION, 0.0 if description else 1.0)]
+        scale = 1.0 / math.sqrt(max(1, len(content_words)))
+        for word in content_words:
+            pairs.append((self._hash(f"w:{word}"), scale))
+            for query_word in query_words:
+                pairs.append((self._hash(f"x:{query_word}:{word}"), scale))
+        return pairs
+
+    def _matrix(self, items: Sequence[Tuple[str, str, str]]):
+        rows, cols, vals = [], [], []
+        for row, (query, title, description) in enumerate(items):
+            for col, val in self.features(query, title, description):
+                rows.append(row)
+                cols.append(col)
+                vals.append(val)
+        return np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64), np.asarray(vals)
+
+    def _margins(self, rows, cols, vals, count: int):
+        return np.bincount(rows, weights=self.weights[cols] * vals, minlength=count)
+
+    def fit(self, items: Sequence[Tuple[str, str, str]], labels: Sequence[bool],
+            epochs: int = 60, learning_rate: float = 0.5) -> "RelevanceModel":
+        """
+        Train on (query, title, description) triples and match labels.
+
+        Returns:
+            self
+        """
+        if _numpy() is None:
+            raise RuntimeError("numpy is required for the relevance model")
+        count = len(items)
+        rows, cols, vals = self._matrix(items)
+        targets = np.asarray(labels, dtype=np.float64)
+
+        weights = np.zeros(self.dim)
+        accumulated = np.full(self.dim, 1e-8)
+        self.weights = weights
+        for _ in range(epochs):
+            probabilities = 1.0 / (1.0 + np.exp(-self._margins(rows, cols, vals, count)))
+            gradient = np.bincount(cols, weights=(probabilities - targets)[rows] * vals, minlength=self.dim) / count
+            gradient += self.l2 * weights
+            accumulated += gradient * gradient
+            weights -= learning_rate * gradient / np.sqrt(accumulated)
+
+        self.samples = count
+        return self
+
+    def predict_proba(self, items: Sequence[Tuple[str, str, str]]) -> "np.ndarray":
+        """Probability that each triple is a match."""
+        if not self.trained:
+            raise RuntimeError("Relevance model has not been trained")
+        if not items:
+            return np.zeros(0)
+        rows, cols, vals = self._matrix(items)
+        return 1.0 / (1.0 + np.exp(-self._margins(rows, cols, vals, len(items))))
+
+
+def train_from_rows(rows: Sequence[Tuple[str, str, str, bool]], min_samples: int = 200) -> Optional[RelevanceModel]:
+    """
+    Fit a model on (query, title, description, is_match) rows.
+
+    Returns:
+        The trained model, or None when there are too few rows, only one
+        class, or numpy is missing
+    """
+    if len(rows) < min_samples or _numpy() is None:
+        return None
+    labels = [bool(row[3]) for row in rows]
+    if all(labels) or not any(labels):
+        return None
+    return RelevanceModel().fit([row[:3] for row in rows], labels)
@@ -2,13 +2,35 @@
 Reverse Discovery Module - Implements "jump to last page" strategy
 Discovers content by starting from the least exposed pages and working backwards.
 """
-import requests
+import json
+import re
+import threading
 import time
-import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urlencode, urlparse, parse_qs
 from loguru import logger
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+
+from config import config
+from crawl_frontier import CrawlFrontier
+from discovery_budget import Deadline
+from google_parser import parse_google_results
+from parse_pool import ParsePool, completed, get_parse_pool
+from pattern_matcher import PatternMatcher
+from politeness import CrawlBudget, HostScheduler, get_host_scheduler
+from youtube_parser import (
+    SEARCH_API_URL, YouTubePage, client_config, continuation_request, count_from_text, find_continuation,
+    initial_data, parse_tree
+)
+
+# Last result page per (query, site), shared by every instance: (page, found_at)
+_last_page_cache: Dict[Tuple[str, Optional[str]], Tuple[int, float]] = {}
+_last_page_lock = threading.Lock()
+
+# View counts in result snippets ("1.2K views", "3 visningar")
+_SNIPPET_VIEWS = re.compile(r'(\d[\d,.]*\s?\w?)\s*(?:views?|visningar)', re.IGNORECASE)
 
 @dataclass
 class SearchResult:
@@ -19,29 +41,137 @@ class SearchResult:
     source: str
     timestamp: Optional[float] = None
     rank: Optional[int] = None
+    channel: Optional[str] = None
+    view_count: Optional[int] = None
+    is_live: Optional[bool] = None
+
+GOOGLE_PAGE = "google"
+YOUTUBE_PAGE = "youtube"
+YOUTUBE_CONTINUATION = "youtube_continuation"
+
+
+def parse_page(kind: str, body: bytes, page_num: int = 1) -> List[SearchResult]:
+    """
+    Parse one downloaded result page; runs on the parse pool's processes.
+
+    Args:
+        kind: GOOGLE_PAGE, YOUTUBE_PAGE (HTML shell) or YOUTUBE_CONTINUATION
+            (search API response)
+        body: Raw response body
+        page_num: Page number, for ranks
+
+    Returns:
+        The page's results, ranked in page order
+    """
+    text = body.decode('utf-8', 'replace')
+    if kind == GOOGLE_PAGE:
+        return [
+            SearchResult(
+                title=hit.title,
+                url=hit.url,
+                snippet=hit.snippet,
+                source="google",
+                timestamp=time.time(),
+                rank=(page_num - 1) * 10 + i + 1
+            )
+            for i, hit in enumerate(parse_google_results(text))
+        ]
+    if kind == YOUTUBE_PAGE:
+        data = initial_data(text)
+    elif kind == YOUTUBE_CONTINUATION:
+        data = json.loads(text)
+    else:
+        raise ValueError(f"Unknown page kind: {kind}")
+    videos = parse_tree(data).videos if data is not None else []
+    return [
+        SearchResult(
+            title=video.title,
+            url=video.url,
+            snippet=f"Views: {video.view_text}" if video.view_text else "",
+            source="youtube_live",
+            timestamp=time.time(),
+            rank=(page_num - 1) * 20 + i + 1,
+            channel=video.channel,
+            view_count=video.view_count,
+            is_live=video.is_live
+        )
+        for i, video in enumerate(videos)
+    ]
+
 
 class ReverseSearchDiscovery:
     """Discovers underexposed content by reverse-paginating search results."""
 
-    def __init__(self, max_retries: int = 3, delay_range: Tuple[float, float] = (1.0, 3.0)):
+    def __init__(self, max_retries: int = 3, delay_range: Optional[Tuple[float, float]] = None,
+                 scheduler: Optional[HostScheduler] = None, budget: Optional[CrawlBudget] = None,
+                 workers: Optional[int] = None, parse_pool: Optional[ParsePool] = None,
+                 frontier: Optional[CrawlFrontier] = None, use_frontier: bool = True,
+                 deadline: Optional[Deadline] = None):
+        """
+        Args:
+            max_retries: Retries per request
+            delay_range: (min, max) seconds between requests to one host; by
+                default hosts are paced by the process-wide scheduler
+                (REVERSE_MIN_INTERVAL + up to REVERSE_JITTER seconds)
+            scheduler: Explicit per-host scheduler (overrides delay_range)
+            budget: Requests allowed per query (defaults to REVERSE_QUERY_BUDGET)
+            workers: Queries/platforms crawled concurrently (defaults to REVERSE_WORKERS)
+            parse_pool: Processes that parse downloaded pages (defaults to
+                the process-wide pool, see REVERSE_PARSE_PROCESSES)
+            frontier: Record of crawled pages (defaults to CRAWL_FRONTIER_DB)
+            use_frontier: Set False to fetch every page, without resuming or recording
+            deadline: Optional discovery deadline; no request starts after it
+                and requests in flight time out at it
+        """
         self.max_retries = max_retries
         self.delay_range = delay_range
+        self.deadline = deadline
+        if scheduler is None:
+            scheduler = HostScheduler.from_range(delay_range) if delay_range else get_host_scheduler()
+        self.scheduler = scheduler
+        self.budget = budget or CrawlBudget()
+        self.workers = max(1, workers or config.REVERSE_WORKERS)
+        self.parse_pool = parse_pool or get_parse_pool()
+        self.frontier = None
+        if use_frontier:
+            # An empty frontier is falsy (len 0), so test for None explicitly
+            self.frontier = frontier if frontier is not None else CrawlFrontier(
+                config.CRAWL_FRONTIER_DB, config.CRAWL_FRONTIER_TTL
+            )
+        import requests
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        self._pages: Dict[Tuple[str, Optional[str], int], bytes] = {}  # Google pages fetched by this instance
+        self.last_page_probes = 0
+
+    def _make_request(self, url: str, params: Dict = None, budget_key: Optional[str] = None,
+                      payload: Optional[Dict] = None) -> Optional["requests.Response"]:
+        """
+        Make HTTP request with retries and error handling.
 
-    def _random_delay(self):
-        """Add random delay to avoid being blocked."""
-        delay = random.uniform(*self.delay_range)
-        time.sleep(delay)
+        Every attempt waits for the host's politeness slot and, with a
+        ``budget_key``, spends one request of that query's crawl budget.
+        A ``payload`` is POSTed as JSON; otherwise the request is a GET.
+        """
+        import requests
 
-    def _make_request(self, url: str, params: Dict = None) -> Optional[requests.Response]:
-        """Make HTTP request with retries and error handling."""
         for attempt in range(self.max_retries + 1):
+            if budget_key is not None and not self.budget.take(budget_key):
+                logger.info(f"Crawl budget for '{budget_key}' used up")
+                return None
             try:
-                self._random_delay()
-                response = self.session.get(url, params=params, timeout=10)
+                self.scheduler.wait(url)
+                remaining = self.deadline.remaining() if self.deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    logger.info(f"Discovery deadline passed; not requesting {url}")
+                    return None
+                timeout = 10 if remaining is None else min(10, remaining)
+                if payload is not None:
+                    response = self.session.post(url, params=params, json=payload, timeout=timeout)
+                else:
+                    response = self.session.get(url, params=params, timeout=timeout)
                 response.raise_for_status()
                 return response
             except requests.RequestException as e:
@@ -51,176 +181,325 @@ class ReverseSearchDiscovery:
                 logger.warning(f"Request attempt {attempt + 1} failed: {e}")
         return None
 
-    def find_last_page_google(self, query: str, site: str = None) -> int:
-        """Find the last available page for a Google search."""
+    @staticmethod
+    def _google_params(query: str, site: Optional[str], page_num: int) -> Dict:
         search_params = {'q': query}
         if site:
             search_params['q'] += f' site:{site}'
+        search_params['start'] = (page_num - 1) * 10
+        return search_params
+
+    @staticmethod
+    def _page_bytes(response) -> bytes:
+        """Raw body of a response, as handed to the parse pool."""
+        content = getattr(response, 'content', None)
+        return content if isinstance(content, bytes) else response.text.encode('utf-8')
+
+    @staticmethod
+    def _google_source(site: Optional[str]) -> str:
+        return f"google:{site}" if site else "google"
+
+    def _resumed(self, query: str, source: str, page: int) -> Optional[Tuple[List[SearchResult], Dict]]:
+        """Results and state of a unit fetched within the frontier's TTL."""
+        if self.frontier is None:
+            return None
+        unit = self.frontier.get(query, source, page)
+        if unit is None:
+            return None
+        results, state = unit
+        return [SearchResult(**result) for result in results], state
+
+    def _log_progress(self, query: str, source: str):
+        """Log the pages of a query the frontier already holds, which will not be fetched again."""
+        if self.frontier is None:
+            return
+        done = self.frontier.progress(query, source)
+        if done:
+            logger.info(f"Resuming '{query}' on {source}: {len(done)} fresh pages in the frontier")
+
+    def get_stats(self) -> Dict:
+        """Parse pool, host pacing and crawl frontier counters."""
+        return {
+            "parse_pool": self.parse_pool.get_stats(),
+            "host_scheduler": self.scheduler.get_stats(),
+            "frontier": self.frontier.get_stats() if self.frontier is not None else None
+        }
 
-        # Try increasingly large page numbers to find the limit
-        test_pages = [100, 200, 500, 1000]
-        last_valid_page = 1
-
-        for page_num in test_pages:
-            search_params['start'] = (page_num - 1) * 10
+    def _record(self, future, query: str, source: str, page: int, state: Optional[Dict] = None):
+        """Record a unit in the frontier once its parse has succeeded."""
+        if self.frontier is None:
+            return
 
-            response = self._make_request('https://www.google.com/search', search_params)
+        def done(finished):
+            if finished.cancelled() or finished.exception() is not None:
+                return
+            try:
+                self.frontier.done(query, source, page, [asdict(result) for result in finished.result()], state)
+            except Exception as e:
+                logger.warning(f"Could not record {source} page {page} for '{query}': {e}")
+        future.add_done_callback(done)
+
+    def _fetch_google_page(self, query: str, site: Optional[str], page_num: int) -> Optional[bytes]:
+        """Raw HTML of one result page, reusing pages already fetched by this instance."""
+        key = (query, site, page_num)
+        if key not in self._pages:
+            response = self._make_request('https://www.google.com/search', self._google_params(query, site, page_num),
+                                          budget_key=query)
             if not response:
+                return None
+            self._pages[key] = self._page_bytes(response)
+        return self._pages[key]
+
+    def _probe_google_page(self, query: str, site: Optional[str], page_num: int) -> Optional[Tuple[bool, bool]]:
+        """
+        Check one result page.
+
+        Returns:
+            (has_results, has_next_page), or None if the request failed
+        """
+        page = self._fetch_google_page(query, site, page_num)
+        if page is None:
+            return None
+        self.last_page_probes += 1
+        if b'did not match any documents' in page or b'No results found' in page:
+            return False, False
+        return True, b'Next' in page or f'start={page_num * 10}'.encode() in page
+
+    def find_last_page_google(self, query: str, site: str = None, max_page: int = 1000) -> int:
+        """
+        Find the last available page for a Google search.
+
+        Gallops through pages 1, 2, 4, 8, ... until one is empty (or has no
+        "Next" link), then binary searches between the last page with
+        results and the first without, so the tail is found in O(log n)
+        requests. Results are cached per query and site for
+        LAST_PAGE_CACHE_TTL seconds; a search cut short by a failed request
+        returns its best lower bound and is not cached.
+
+        Args:
+            query: Search query
+            site: Optional site restriction
+            max_page: Highest page considered
+
+        Returns:
+            The last page with results (at least 1)
+        """
+        key = (query, site)
+        with _last_page_lock:
+            cached = _last_page_cache.get(key)
+        if cached and time.time() - cached[1] < config.LAST_PAGE_CACHE_TTL:
+            logger.debug(f"Last page for query '{query}' from cache: {cached[0]}")
+            return cached[0]
+        resumed = self._resumed(query, self._google_source(site), 0)
+        if resumed and resumed[1].get("last_page"):
+            last_page = resumed[1]["last_page"]
+            with _last_page_lock:
+                _last_page_cache[key] = (last_page, time.time())
+            logger.debug(f"Last page for query '{query}' from crawl frontier: {last_page}")
+            return last_page
+
+        low, high = 0, None  # Highest page known to have results, lowest known to be past the end
+        failed = False
+
+        # Gallop until the end is bracketed
+        page_num = 1
+        while high is None:
+            status = self._probe_google_page(query, site, page_num)
+            if status is None:
+                failed = True
                 break
-
-            # Check if page has results
-            if 'did not match any documents' in response.text or 'No results found' in response.text:
-                break
-
-            # Check for "Next" button or pagination indicators
-            if 'Next' in response.text or f'start={page_num * 10}' in response.text:
-                last_valid_page = page_num
+            has_results, has_next = status
+            if not has_results:
+                high = page_num
             else:
+                low = page_num
+                if not has_next:
+                    high = page_num + 1
+                elif page_num >= max_page:
+                    high = max_page + 1
+                else:
+                    page_num = min(page_num * 2, max_page)
+
+        # Binary search the bracket for the last page with results
+        while not failed and high - low > 1:
+            middle = (low + high) // 2
+            status = self._probe_google_page(query, site, middle)
+            if status is None:
+                failed = True
                 break
+            has_results, has_next = status
+            if has_results:
+                low = middle
+                if not has_next:
+                    high = middle + 1
+            else:
+                high = middle
 
-        logger.info(f"Found last page for query '{query}': {last_valid_page}")
+        last_valid_page = max(low, 1)
+        if not failed:
+            with _last_page_lock:
+                _last_page_cache[key] = (last_valid_page, time.time())
+            if self.frontier is not None:
+                self.frontier.done(query, self._google_source(site), 0, [], {"last_page": last_valid_page})
+
+        logger.info(f"Found last page for query '{query}': {last_valid_page}"
+                    f"{' (lower bound, search interrupted)' if failed else ''}")
         return last_valid_page
 
     def reverse_search_google(self, query: str, site: str = None, max_pages: int = 10) -> List[SearchResult]:
         """Search Google starting from the last page and working backwards."""
-        results = []
-
-        # Find the last available page
+        # Find the last available page; the least exposed results are there
         last_page = self.find_last_page_google(query, site)
-        start_page = min(last_page, max_pages)
-
-        logger.info(f"Starting reverse search from page {start_page}")
-
-        for page_num in range(start_page, 0, -1):
-            search_params = {'q': query}
-            if site:
-                search_params['q'] += f' site:{site}'
-            search_params['start'] = (page_num - 1) * 10
-
-            response = self._make_request('https://www.google.com/search', search_params)
-            if not response:
+        end_page = max(0, last_page - max_pages)
+
+        logger.info(f"Starting reverse search from page {last_page}")
+
+        # Parse each page on the pool while the next one downloads; pages
+        # crawled within the frontier's TTL are not fetched again
+        source = self._google_source(site)
+        self._log_progress(query, source)
+        parsing = []
+        for page_num in range(last_page, end_page, -1):
+            resumed = self._resumed(query, source, page_num)
+            if resumed is not None:
+                parsing.append((page_num, completed(resumed[0])))
                 continue
+            page = self._fetch_google_page(query, site, page_num)
+            if page is not None:
+                future = self.parse_pool.submit(parse_page, GOOGLE_PAGE, page, page_num)
+                self._record(future, query, source, page_num)
+                parsing.append((page_num, future))
 
-            # Parse results from this page
-            page_results = self._parse_google_results(response.text, page_num)
+        results = []
+        for page_num, future in parsing:
+            page_results = self._parsed(future, f"Google page {page_num}")
             results.extend(page_results)
-
             logger.info(f"Extracted {len(page_results)} results from page {page_num}")
-
         return results
 
-    def _parse_google_results(self, html: str, page_num: int) -> List[SearchResult]:
-        """Parse search results from Google HTML (basic extraction)."""
-        results = []
-
-        # This is a simplified parser - in production you'd want something more robust
-        # like BeautifulSoup or a proper HTML parser
-
-        # Look for result divs (this is fragile and may need updates)
-        import re
-
-        # Pattern to match Google result blocks
-        result_pattern = r'<h3[^>]*>.*?<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>.*?</h3>.*?<span[^>]*>(.*?)</span>'
-        matches = re.findall(result_pattern, html, re.DOTALL | re.IGNORECASE)
-
-        for i, (url, title, snippet) in enumerate(matches):
-            # Clean up extracted text
-            title = re.sub(r'<[^>]+>', '', title).strip()
-            snippet = re.sub(r'<[^>]+>', '', snippet).strip()
-
-            # Skip Google's own URLs
-            if 'google.com' in url:
-                continue
-
-            results.append(SearchResult(
-                title=title,
-                url=url,
-                snippet=snippet,
-                source="google",
-                timestamp=time.time(),
-                rank=(page_num - 1) * 10 + i + 1
-            ))
+    @staticmethod
+    def _parsed(future, label: str) -> List[SearchResult]:
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f"Could not parse {label}: {e}")
+            return []
 
-        return results
+    def _parse_google_results(self, html: str, page_num: int) -> List[SearchResult]:
+        """Parse organic results from a Google result page."""
+        return parse_page(GOOGLE_PAGE, html.encode('utf-8'), page_num)
 
     def reverse_search_youtube_live(self, query: str = "", max_pages: int = 5) -> List[SearchResult]:
-        """Search for live YouTube streams starting from less popular results."""
-        results = []
-
-        # YouTube search with live filter
-        base_url = "https://www.youtube.com/results"
-
-        for page in range(max_pages, 0, -1):
-            params = {
-                'search_query': query,
-                'sp': 'EgJAAQ%253D%253D',  # Live filter
-                'p': page
-            }
-
-            response = self._make_request(base_url, params)
-            if not response:
+        """
+        Search for live YouTube streams, less popular results first.
+
+        The HTML shell is fetched once; deeper pages come from its
+        continuation tokens through the search API. Only the token is read
+        on this thread, so each page parses on the pool while the next one
+        downloads. Pages in the crawl frontier are resumed from their stored
+        results and continuation state. Results are returned deepest page
+        first.
+        """
+        self._log_progress(query, "youtube_live")
+        parsing = []
+        page = None  # Continuation state of the last page
+        for page_num in range(1, max_pages + 1):
+            if page_num > 1 and continuation_request(page) is None:
+                break
+            resumed = self._resumed(query, "youtube_live", page_num)
+            if resumed is not None:
+                results, state = resumed
+                parsing.append(completed(results))
+                page = YouTubePage([], state.get("continuation"), state.get("api_key"), state.get("context"))
                 continue
 
-            # Parse YouTube results (simplified)
-            page_results = self._parse_youtube_results(response.text, page)
-            results.extend(page_results)
-
-            logger.info(f"Extracted {len(page_results)} YouTube live results from page {page}")
-
-        return results
+            if page_num == 1:
+                response = self._make_request(
+                    "https://www.youtube.com/results",
+                    {'search_query': query, 'sp': 'EgJAAQ=='},  # Live filter
+                    budget_key=query
+                )
+                if not response:
+                    break
+                body = self._page_bytes(response)
+                html = body.decode('utf-8', 'replace')
+                settings = client_config(html)
+                page = YouTubePage([], find_continuation(html), settings.get('INNERTUBE_API_KEY'),
+                                   settings.get('INNERTUBE_CONTEXT'))
+                future = self.parse_pool.submit(parse_page, YOUTUBE_PAGE, body)
+            else:
+                request = continuation_request(page)
+                response = self._make_request(SEARCH_API_URL, request["params"], budget_key=query,
+                                              payload=request["payload"])
+                if not response:
+                    break
+                body = self._page_bytes(response)
+                page = page._replace(continuation=find_continuation(body.decode('utf-8', 'replace')))
+                future = self.parse_pool.submit(parse_page, YOUTUBE_CONTINUATION, body)
+
+            state = {"continuation": page.continuation, "api_key": page.api_key, "context": page.context}
+            self._record(future, query, "youtube_live", page_num, state)
+            parsing.append(future)
+
+        pages = []
+        rank = 0
+        seen = set()
+        for page_num, future in enumerate(parsing, 1):
+            # Continuations may repeat videos already listed on earlier pages
+            page_results = [result for result in self._parsed(future, f"YouTube page {page_num}")
+                            if result.url not in seen]
+            for result in page_results:
+                seen.add(result.url)
+                rank += 1
+                result.rank = rank
+            pages.append(page_results)
+            logger.info(f"Extracted {len(page_results)} YouTube live results from page {page_num}")
+        return [result for page_results in reversed(pages) for result in page_results]
 
     def _parse_youtube_results(self, html: str, page_num: int) -> List[SearchResult]:
-        """Parse YouTube search results (basic extraction)."""
-        results = []
-
-        # This would need a more sophisticated parser in production
-        import re
-
-        # Look for video data in YouTube's JSON
-        video_pattern = r'"videoId":"([^"]*)".*?"title":{"runs":\[{"text":"([^"]*)"}.*?"viewCountText":{"simpleText":"([^"]*)"}'
-        matches = re.findall(video_pattern, html, re.DOTALL)
-
-        for i, (video_id, title, view_count) in enumerate(matches):
-            url = f"https://www.youtube.com/watch?v={video_id}"
-
-            results.append(SearchResult(
-                title=title,
-                url=url,
-                snippet=f"Views: {view_count}",
-                source="youtube_live",
-                timestamp=time.time(),
-                rank=(page_num - 1) * 20 + i + 1
-            ))
-
-        return results
+        """Parse the videos of a YouTube results page."""
+        return parse_page(YOUTUBE_PAGE, html.encode('utf-8'), page_num)
 
     def discover_underexposed_content(self, queries: List[str], platforms: List[str] = None) -> List[SearchResult]:
         """Discover underexposed content across multiple queries and platforms."""
         if platforms is None:
             platforms = ["google", "youtube_live"]
 
-        all_results = []
+        if self.frontier is not None:
+            self.frontier.prune()
 
+        # One task per query and platform; the scheduler keeps each host's pace,
+        # so tasks for different hosts and queries overlap instead of queueing
+        tasks = []
         for query in queries:
-            logger.info(f"Processing query: '{query}'")
-
             if "google" in platforms:
-                google_results = self.reverse_search_google(query, max_pages=5)
-                all_results.extend(google_results)
-
+                tasks.append((query, partial(self.reverse_search_google, query, max_pages=5)))
             if "youtube_live" in platforms:
-                youtube_results = self.reverse_search_youtube_live(query, max_pages=3)
-                all_results.extend(youtube_results)
+                tasks.append((query, partial(self.reverse_search_youtube_live, query, max_pages=3)))
+
+        all_results = []
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="reverse") as executor:
+            futures = []
+            for query, task in tasks:
+                logger.info(f"Processing query: '{query}'")
+                futures.append(executor.submit(task))
+            for future in futures:
+                try:
+                    all_results.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Reverse discovery task failed: {e}")
 
         # Sort by rank (higher rank = less exposed, but filter out popular content first)
         # Remove results that are clearly popular (based on view count in snippet)
         filtered_results = []
         for result in all_results:
-            # Extract view count from snippet if available
-            import re
-            view_match = re.search(r'(\d+(?:,\d+)*)\s*(?:views?|visningar)', result.snippet, re.IGNORECASE)
-            if view_match:
-                view_count = int(view_match.group(1).replace(',', ''))
+            # Extract view count from snippet if the source did not report one
+            view_count = result.view_count
+            if view_count is None:
+                view_match = _SNIPPET_VIEWS.search(result.snippet)
+                if view_match:
+                    view_count = count_from_text(view_match.group(1))
+            if view_count is not None:
                 # Only keep truly underexposed content (< 10,000 views)
                 if view_count < 10000:
                     filtered_results.append(result)
@@ -232,6 +511,7 @@ class ReverseSearchDiscovery:
         filtered_results.sort(key=lambda x: x.rank or 0, reverse=True)
 
         logger.info(f"Total underexposed content discovered: {len(filtered_results)} (filtered from {len(all_results)} total)")
+        logger.info(f"Reverse discovery stats: {self.get_stats()}")
         return filtered_results
 
 
@@ -246,24 +526,41 @@ class ContentFilter:
             'click here', 'free money', 'you won', 'congratulations',
             'limited time', 'act now', 'exclusive offer'
         }
+        self.spam_keywords.update(
+            keyword.strip().lower() for keyword in config.SPAM_KEYWORDS.split(',') if keyword.strip()
+        )
+        self._spam_matcher = None
+        self._spam_matcher_keywords = frozenset()
+
+    @property
+    def spam_matcher(self) -> PatternMatcher:
+        """Automaton over ``spam_keywords``, recompiled if the set changed."""
+        if self._spam_matcher is None or self._spam_matcher_keywords != self.spam_keywords:
+            self._spam_matcher_keywords = frozenset(self.spam_keywords)
+            self._spam_matcher = PatternMatcher(self.spam_keywords)
+        return self._spam_matcher
 
     def is_spam(self, result: SearchResult) -> bool:
         """Check if a result appears to be spam."""
-        # Check domain
-        try:
-            domain = urlparse(result.url).netloc.lower()
-            if domain in self.spam_domains:
-                return True
-        except:
-            pass
+        return self.spam_flags([result])[0]
 
-        # Check title and snippet for spam keywords
-        text = (result.title + " " + result.snippet).lower()
-        for keyword in self.spam_keywords:
-            if keyword in text:
-                return True
+    def spam_flags(self, results: List[SearchResult]) -> List[bool]:
+        """``is_spam`` for many results, one pass over each text."""
+        matcher = self.spam_matcher
+        flags = []
+        for result in results:
+            # Check domain
+            try:
+                domain = urlparse(result.url).netloc.lower()
+                if domain in self.spam_domains:
+                    flags.append(True)
+                    continue
+            except:
+                pass
 
-        return False
+            # Check title and snippet for spam keywords
+            flags.append(matcher.search((result.title + " " + result.snippet).lower()))
+        return flags
 
     def is_substantial(self, result: SearchResult) -> bool:
         """Check if a result has substantial content."""
@@ -285,8 +582,8 @@ class ContentFilter:
         """Filter results to remove spam and low-quality content."""
         filtered = []
 
-        for result in results:
-            if self.is_spam(result):
+        for result, spam in zip(results, self.spam_flags(results)):
+            if spam:
                 logger.debug(f"Filtered spam: {result.title}")
                 continue
 
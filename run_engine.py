@@ -6,6 +6,7 @@ Main entry point for running the complete counter-exposure system.
 import os
 import sys
 import json
+import time
 import argparse
 from pathlib import Path
 
@@ -13,6 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from exposure_engine import CounterExposureEngine
+from discovery_daemon import DiscoveryDaemon
 from reverse_discovery import ReverseSearchDiscovery, ContentFilter
 from config import config
 from loguru import logger
@@ -126,16 +128,43 @@ def run_combined_discovery(stream_count: int = 10, content_count: int = 10, quer
         'total_discovered': len(streams) + len(content)
     }
 
+def run_daemon(count: int = 20):
+    """Run the resident discovery daemon in the foreground."""
+    daemon = DiscoveryDaemon(feed_count=count).start()
+    logger.info("🛰️  Discovery daemon running - press Ctrl+C to stop")
+    
+    try:
+        last_cycle = 0
+        while True:
+            time.sleep(1)
+            feed = daemon.latest_feed()
+            if feed.cycle != last_cycle:
+                last_cycle = feed.cycle
+                print(f"\n🎯 Cycle {feed.cycle}: {len(feed.items)} streams in {feed.duration_seconds:.1f}s")
+                for item in feed.items:
+                    print(f"   📺 {item['platform'].upper()}: {item['title'][:60]} ({item['viewer_count']} viewers)")
+    except KeyboardInterrupt:
+        daemon.stop()
+
+def run_workers(workers: int):
+    """Run one discovery cycle fanned out to local worker processes."""
+    from discovery_workers import DiscoveryCoordinator
+    
+    logger.info(f"🧵 Running discovery across {workers} worker processes")
+    return DiscoveryCoordinator().run_cycle(workers=workers)
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description='Counter-Exposure Engine')
-    parser.add_argument('--mode', choices=['streams', 'reverse', 'combined'], 
+    parser.add_argument('--mode', choices=['streams', 'reverse', 'combined', 'daemon', 'workers'], 
                        default='combined', help='Discovery mode')
     parser.add_argument('--count', type=int, default=10, 
                        help='Number of results to return')
     parser.add_argument('--queries', nargs='+', 
                        default=["new indie game", "small streamer", "unknown artist"],
                        help='Search queries for reverse discovery')
+    parser.add_argument('--workers', type=int, default=4,
+                       help='Worker processes for --mode workers')
     parser.add_argument('--output', type=str, help='Output file for results (JSON)')
     parser.add_argument('--setup', action='store_true', 
                        help='Setup environment and exit')
@@ -161,6 +190,11 @@ def main():
         results = {'content': run_reverse_discovery(args.queries, args.count)}
     elif args.mode == 'combined':
         results = run_combined_discovery(args.count, args.count, args.queries)
+    elif args.mode == 'daemon':
+        run_daemon(args.count)
+        return
+    elif args.mode == 'workers':
+        results = {'content': run_workers(args.workers)}
     
     # Save results if output file specified
     if args.output and results:
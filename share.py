@@ -6,6 +6,8 @@ import json
 import os
 from pathlib import Path
 
+from config import config
+
 try:
     import requests
 except ImportError:
@@ -17,7 +19,7 @@ def upload_to_gist():
     """Upload counter_exposure_feed.html to GitHub Gist."""
     
     # Read the HTML file
-    html_file = Path("counter_exposure_feed.html")
+    html_file = Path(config.FEED_HTML_FILE)
     if not html_file.exists():
         print("❌ counter_exposure_feed.html not found!")
         print("Run 'python simple_web_ui.py' first to generate the feed.")
@@ -74,7 +76,7 @@ def main():
     print("=" * 50)
     
     # Check if feed exists, if not, generate it
-    if not Path("counter_exposure_feed.html").exists():
+    if not Path(config.FEED_HTML_FILE).exists():
         print("📊 Feed not found. Generating...")
         os.system("python simple_web_ui.py")
     
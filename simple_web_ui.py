@@ -6,8 +6,9 @@ No server needed - just open the HTML file in your browser!
 """
 import os
 import sys
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 
@@ -17,236 +18,377 @@ sys.path.insert(0, str(Path(__file__).parent))
 from youtube_client import YouTubeDiscovery
 from reverse_discovery import ReverseSearchDiscovery, ContentFilter
 from llm_filter import LLMContentValidator
+from validation_pool import ValidationPool
+from feed_snapshot import get_snapshot_manager
+from discovery_budget import (
+    CANCELLED, COMPLETE, FAILED, PENDING, RUNNING, SKIPPED, Deadline, SourceProgress, YieldEstimator, summarize
+)
+from config import config
 from loguru import logger
 
+# Expanded search terms for deep discovery
+SEARCH_TERMS = [
+    # Entertainment
+    "gaming", "music", "art", "animation", "comedy", "podcast", "vlog",
+    "stream", "speedrun", "playthrough", "walkthrough", "lets play",
+
+    # Educational
+    "tutorial", "how to", "guide", "lesson", "course", "lecture",
+    "explained", "documentary", "science", "history", "math",
+
+    # Creative
+    "drawing", "painting", "digital art", "3d modeling", "photography",
+    "filmmaking", "editing", "music production", "beatmaking", "mixing",
+
+    # Tech & Dev
+    "programming", "coding", "web dev", "app dev", "gamedev",
+    "tech review", "unboxing", "hardware", "software", "linux",
+
+    # Lifestyle
+    "cooking", "baking", "recipe", "fitness", "workout", "yoga",
+    "travel", "vlogging", "daily vlog", "asmr", "meditation",
+
+    # Hobbies
+    "crafts", "diy", "woodworking", "electronics", "robotics",
+    "gardening", "fishing", "camping", "hiking", "cycling",
+
+    # Performance
+    "singing", "dancing", "instrument", "guitar", "piano", "drums",
+    "beat boxing", "acapella", "cover song", "original song",
+
+    # Business
+    "entrepreneur", "startup", "business tips", "marketing",
+    "freelance", "side hustle", "investing", "crypto",
+
+    # Innovation & Science
+    "invention", "innovation", "prototype", "experiment",
+    "chemistry experiment", "physics demo", "science project",
+    "engineering", "robotics project", "maker", "arduino",
+    "3d printing", "cnc", "laser cutting", "soldering",
+
+    # Underground/Alternative
+    "independent film", "short film", "student film",
+    "underground music", "bedroom producer", "lo-fi beats",
+    "experimental art", "avant garde", "abstract",
+    "zine", "indie comic", "webcomic",
+
+    # Deep Learning Niches
+    "restoration", "repair", "fix", "refurbish",
+    "thrifting", "vintage", "antique", "collecting",
+    "urban exploration", "abandoned", "history exploration",
+    "foraging", "wildcrafting", "homesteading", "off grid",
+
+    # Skill Mastery
+    "practice session", "skill building", "progress video",
+    "study with me", "time lapse", "process video",
+    "behind the scenes", "making of", "studio tour",
+
+    # Micro-Niches (goldmine territory)
+    "mechanical keyboard", "fountain pen", "watch repair",
+    "miniatures", "diorama", "scale model", "terrarium",
+    "lockpicking", "puzzle solving", "rubiks cube",
+    "whistling", "juggling", "poi spinning", "kendama",
+
+    # Language/Cultural
+    "language learning", "polyglot", "speaking practice",
+    "cultural vlog", "expat life", "living abroad",
+    "traditional music", "folk song", "indigenous",
+    "dialect", "regional cuisine", "local history",
+
+    # Underrated Formats
+    "unedited", "raw footage", "no commentary",
+    "ambient", "soundscape", "field recording",
+    "slideshow", "photo essay", "visual poem",
+    "voice over", "narration", "storytelling",
+
+    # Problem-Solving Content
+    "debugging", "troubleshooting", "problem solving",
+    "case study", "analysis", "breakdown", "explained",
+    "comparison", "versus", "before and after",
+
+    # Niche Communities
+    "retro gaming", "indie game", "pixel art", "chiptune",
+    "speedcubing", "card tricks", "origami", "calligraphy",
+
+    # Languages (underexposed in English-speaking markets)
+    "music spanish", "tutorial arabic", "vlog japanese",
+    "gaming portuguese", "cooking italian", "tech german"
+]
+
+# Queries for reverse (last-page) web discovery
+REVERSE_QUERIES = ["new indie game", "small creator", "unknown artist", "underrated"]
+
 class SimpleWebUI:
     """Creates a local web interface without needing a server."""
     
     def __init__(self):
-        self.output_file = Path("counter_exposure_feed.html")
-        self.data_file = Path("feed_data.json")
         self.validator = LLMContentValidator()  # Initialize LLM validator
-        
-    def discover_content(self):
-        """Discover content from all available sources."""
-        all_content = []
-        
-        # Get API key
+        self.snapshots = get_snapshot_manager()  # Shared with the web server
+        self.yields = YieldEstimator(path=config.SOURCE_YIELD_FILE)  # Items/second per source, across runs
+        self.last_report = {}  # Per-source completeness of the last discovery
+        self.validation_stats = {}  # ValidationPool counters of the last discovery
+        self.reverse_stats = {}  # Parse pool, host pacing and frontier counters of the last reverse crawl
+    
+    def get_api_key(self, interactive: bool = True):
+        """YouTube API key from the environment, prompting for it if allowed."""
         api_key = os.getenv('YOUTUBE_API_KEY')
         if not api_key or api_key == 'your_youtube_api_key_here':
+            if not interactive:
+                return None
             print("Enter your YouTube API key:")
             api_key = input("API Key: ").strip()
+        return api_key
+    
+    def discover_youtube_term(self, yt_client, api_key, term):
+        """
+        Find underexposed YouTube videos for one search term.
+        
+        Args:
+            yt_client: YouTubeDiscovery client used for the API calls
+            api_key: YouTube API key
+            term: Search term
+            
+        Returns:
+            Feed items for videos that passed the view and validation filters
+        """
+        candidates = self.collect_youtube_candidates(yt_client, api_key, term)
+        # Validate content matches search intent, all of the term's candidates in one batch
+        validations = self.validator.validate_batch(self.validation_items(term, candidates))
+        return self.youtube_items(term, candidates, validations)
+    
+    def collect_youtube_candidates(self, yt_client, api_key, term, deadline=None):
+        """
+        Search one term and fetch view counts, keeping low-view videos.
+        
+        Args:
+            deadline: Optional Deadline; requests time out at it, so a
+                search abandoned at the budget does not keep its thread busy
+        
+        Returns:
+            (snippet, video_id, view_count, is_live) tuples, not yet validated
+        """
+        # Search for regular videos (not just live)
+        response = yt_client._make_request(
+            "https://www.googleapis.com/youtube/v3/search",
+            params={
+                'key': api_key,
+                'part': 'snippet',
+                'type': 'video',
+                'maxResults': 10,
+                'q': term,
+                'order': 'date',  # Get newest first
+                'publishedAfter': (datetime.now().replace(hour=0, minute=0, second=0)).isoformat() + 'Z'
+            },
+            deadline=deadline
+        )
+        
+        if not (response and response.get('items')):
+            return []
+        
+        candidates = []
+        for item in response['items']:
+            snippet = item['snippet']
+            video_id = item['id']['videoId']
+            
+            # Get video statistics
+            stats_response = yt_client._make_request(
+                "https://www.googleapis.com/youtube/v3/videos",
+                params={
+                    'key': api_key,
+                    'part': 'statistics,liveStreamingDetails',
+                    'id': video_id
+                },
+                deadline=deadline
+            )
+            
+            view_count = 0
+            is_live = False
+            if stats_response and stats_response.get('items'):
+                stats = stats_response['items'][0].get('statistics', {})
+                view_count = int(stats.get('viewCount', 0))
+                is_live = 'liveStreamingDetails' in stats_response['items'][0]
+            
+            # Focus on TRULY underexposed content (very low views)
+            if view_count <= 500:  # Much stricter underexposed threshold
+                candidates.append((snippet, video_id, view_count, is_live))
+        return candidates
+    
+    @staticmethod
+    def validation_items(term, candidates):
+        """(query, title, description) triples for a term's candidates."""
+        return [(term, snippet['title'], snippet['description']) for snippet, _, _, _ in candidates]
+    
+    def youtube_items(self, term, candidates, validations):
+        """Feed items for the candidates whose validation matched."""
+        found = []
+        for (snippet, video_id, view_count, is_live), validation in zip(candidates, validations):
+            if validation['is_match']:
+                found.append({
+                    'title': snippet['title'],
+                    'channel': snippet['channelTitle'],
+                    'url': f"https://www.youtube.com/watch?v={video_id}",
+                    'thumbnail': snippet['thumbnails'].get('medium', {}).get('url', ''),
+                    'description': snippet['description'][:200] + '...',
+                    'view_count': view_count,
+                    'published': snippet['publishedAt'],
+                    'platform': 'YouTube',
+                    'is_live': is_live,
+                    'category': term,
+                    'underexposure_score': max(0, 1000 - view_count) / 1000,
+                    'validation_confidence': validation['confidence']
+                })
+            else:
+                logger.debug(f"Filtered out '{snippet['title']}': {validation['reason']}")
+        
+        print(f"   Found {len(found)} underexposed videos for '{term}'")
+        if found:
+            print("   📺 Sample discoveries:")
+            for item in found[-3:]:  # Show last 3
+                print(f"      • {item['title'][:50]}... ({item['view_count']} views)")
+                print(f"        🔗 {item['url']}")
+            print()
+        return found
+    
+    def discover_reverse(self, queries, deadline=None):
+        """
+        Run reverse discovery for a set of queries.
+        
+        Args:
+            queries: Search queries
+            deadline: Optional Deadline bounding the crawl's requests
+        
+        Returns:
+            Feed items for the top filtered web results
+        """
+        reverse_discovery = ReverseSearchDiscovery(deadline=deadline)
+        content_filter = ContentFilter()
+        
+        reverse_results = reverse_discovery.discover_underexposed_content(queries)
+        self.reverse_stats = reverse_discovery.get_stats()
+        filtered_results = content_filter.filter_results(reverse_results)
+        
+        found = []
+        for result in filtered_results[:20]:  # Limit to top 20
+            found.append({
+                'title': result.title,
+                'channel': 'Unknown',
+                'url': result.url,
+                'thumbnail': '',
+                'description': result.snippet,
+                'view_count': 0,
+                'published': datetime.now().isoformat(),
+                'platform': 'Web Search',
+                'is_live': False,
+                'category': 'reverse_discovery',
+                'underexposure_score': (result.rank or 0) / 1000
+            })
+        
+        print(f"   Found {len(filtered_results)} items via reverse discovery")
+        if len(filtered_results) > 0:
+            print("   🔍 Sample reverse discoveries:")
+            for result in filtered_results[:3]:  # Show first 3
+                print(f"      • {result.title[:50]}...")
+                print(f"        🔗 {result.url}")
+            print()
+        return found
+        
+    def discover_content(self, budget_seconds=None):
+        """
+        Discover content from all available sources.
+        
+        Args:
+            budget_seconds: Optional time budget. Sources run best expected
+                yield first; the one still running at the deadline is
+                abandoned and the rest are skipped. ``last_report`` records
+                how complete each source got.
+        
+        YouTube candidates are validated on a bounded ValidationPool while
+        the next terms are being fetched; the pool shares the time budget.
+        """
+        deadline = Deadline(budget_seconds)
+        pool = ValidationPool(self.validator, budget_seconds=deadline.remaining())
+        pending = {}  # Source name -> (term, candidates, future verdicts)
+        all_content = []
+        
+        # Get API key
+        api_key = self.get_api_key()
         
-        # YouTube Discovery
+        # One unit of work per YouTube search term, plus reverse discovery
+        units = {}
         if api_key:
             print("🔍 Discovering YouTube content...")
             try:
                 yt_client = YouTubeDiscovery(api_key=api_key)
-                
-                # Expanded search terms for deep discovery
-                search_terms = [
-                    # Entertainment
-                    "gaming", "music", "art", "animation", "comedy", "podcast", "vlog",
-                    "stream", "speedrun", "playthrough", "walkthrough", "lets play",
-                    
-                    # Educational
-                    "tutorial", "how to", "guide", "lesson", "course", "lecture",
-                    "explained", "documentary", "science", "history", "math",
-                    
-                    # Creative
-                    "drawing", "painting", "digital art", "3d modeling", "photography",
-                    "filmmaking", "editing", "music production", "beatmaking", "mixing",
-                    
-                    # Tech & Dev
-                    "programming", "coding", "web dev", "app dev", "gamedev",
-                    "tech review", "unboxing", "hardware", "software", "linux",
-                    
-                    # Lifestyle
-                    "cooking", "baking", "recipe", "fitness", "workout", "yoga",
-                    "travel", "vlogging", "daily vlog", "asmr", "meditation",
-                    
-                    # Hobbies
-                    "crafts", "diy", "woodworking", "electronics", "robotics",
-                    "gardening", "fishing", "camping", "hiking", "cycling",
-                    
-                    # Performance
-                    "singing", "dancing", "instrument", "guitar", "piano", "drums",
-                    "beat boxing", "acapella", "cover song", "original song",
-                    
-                    # Business
-                    "entrepreneur", "startup", "business tips", "marketing",
-                    "freelance", "side hustle", "investing", "crypto",
-                    
-                    # Innovation & Science
-                    "invention", "innovation", "prototype", "experiment",
-                    "chemistry experiment", "physics demo", "science project",
-                    "engineering", "robotics project", "maker", "arduino",
-                    "3d printing", "cnc", "laser cutting", "soldering",
-                    
-                    # Underground/Alternative
-                    "independent film", "short film", "student film",
-                    "underground music", "bedroom producer", "lo-fi beats",
-                    "experimental art", "avant garde", "abstract",
-                    "zine", "indie comic", "webcomic",
-                    
-                    # Deep Learning Niches
-                    "restoration", "repair", "fix", "refurbish",
-                    "thrifting", "vintage", "antique", "collecting",
-                    "urban exploration", "abandoned", "history exploration",
-                    "foraging", "wildcrafting", "homesteading", "off grid",
-                    
-                    # Skill Mastery
-                    "practice session", "skill building", "progress video",
-                    "study with me", "time lapse", "process video",
-                    "behind the scenes", "making of", "studio tour",
-                    
-                    # Micro-Niches (goldmine territory)
-                    "mechanical keyboard", "fountain pen", "watch repair",
-                    "miniatures", "diorama", "scale model", "terrarium",
-                    "lockpicking", "puzzle solving", "rubiks cube",
-                    "whistling", "juggling", "poi spinning", "kendama",
-                    
-                    # Language/Cultural
-                    "language learning", "polyglot", "speaking practice",
-                    "cultural vlog", "expat life", "living abroad",
-                    "traditional music", "folk song", "indigenous",
-                    "dialect", "regional cuisine", "local history",
-                    
-                    # Underrated Formats
-                    "unedited", "raw footage", "no commentary",
-                    "ambient", "soundscape", "field recording",
-                    "slideshow", "photo essay", "visual poem",
-                    "voice over", "narration", "storytelling",
-                    
-                    # Problem-Solving Content
-                    "debugging", "troubleshooting", "problem solving",
-                    "case study", "analysis", "breakdown", "explained",
-                    "comparison", "versus", "before and after",
-                    
-                    # Niche Communities
-                    "retro gaming", "indie game", "pixel art", "chiptune",
-                    "speedcubing", "card tricks", "origami", "calligraphy",
-                    
-                    # Languages (underexposed in English-speaking markets)
-                    "music spanish", "tutorial arabic", "vlog japanese",
-                    "gaming portuguese", "cooking italian", "tech german"
-                ]
-                
-                for term in search_terms:
-                    try:
-                        # Search for regular videos (not just live)
-                        response = yt_client._make_request(
-                            "https://www.googleapis.com/youtube/v3/search",
-                            params={
-                                'key': api_key,
-                                'part': 'snippet',
-                                'type': 'video',
-                                'maxResults': 10,
-                                'q': term,
-                                'order': 'date',  # Get newest first
-                                'publishedAfter': (datetime.now().replace(hour=0, minute=0, second=0)).isoformat() + 'Z'
-                            }
-                        )
-                        
-                        if response and response.get('items'):
-                            for item in response['items']:
-                                snippet = item['snippet']
-                                video_id = item['id']['videoId']
-                                
-                                # Get video statistics
-                                stats_response = yt_client._make_request(
-                                    "https://www.googleapis.com/youtube/v3/videos",
-                                    params={
-                                        'key': api_key,
-                                        'part': 'statistics,liveStreamingDetails',
-                                        'id': video_id
-                                    }
-                                )
-                                
-                                view_count = 0
-                                is_live = False
-                                if stats_response and stats_response.get('items'):
-                                    stats = stats_response['items'][0].get('statistics', {})
-                                    view_count = int(stats.get('viewCount', 0))
-                                    is_live = 'liveStreamingDetails' in stats_response['items'][0]
-                                
-                                # Focus on TRULY underexposed content (very low views)
-                                if view_count <= 500:  # Much stricter underexposed threshold
-                                    # Validate content matches search intent
-                                    validation = self.validator.validate_search_match(
-                                        term,
-                                        snippet['title'],
-                                        snippet['description']
-                                    )
-                                    
-                                    if validation['is_match']:
-                                        all_content.append({
-                                            'title': snippet['title'],
-                                            'channel': snippet['channelTitle'],
-                                            'url': f"https://www.youtube.com/watch?v={video_id}",
-                                            'thumbnail': snippet['thumbnails'].get('medium', {}).get('url', ''),
-                                            'description': snippet['description'][:200] + '...',
-                                            'view_count': view_count,
-                                            'published': snippet['publishedAt'],
-                                            'platform': 'YouTube',
-                                            'is_live': is_live,
-                                            'category': term,
-                                            'underexposure_score': max(0, 1000 - view_count) / 1000,
-                                            'validation_confidence': validation['confidence']
-                                        })
-                                    else:
-                                        logger.debug(f"Filtered out '{snippet['title']}': {validation['reason']}")
-                            
-                            found_count = len([c for c in all_content if c['category'] == term])
-                            print(f"   Found {found_count} underexposed videos for '{term}'")
-                            if found_count > 0:
-                                print("   📺 Sample discoveries:")
-                                for item in [c for c in all_content if c['category'] == term][-3:]:  # Show last 3
-                                    print(f"      • {item['title'][:50]}... ({item['view_count']} views)")
-                                    print(f"        🔗 {item['url']}")
-                                print()
-                    except Exception as e:
-                        print(f"   Error searching for '{term}': {e}")
-                        
+                for term in SEARCH_TERMS:
+                    units[f"youtube:{term}"] = partial(self.collect_youtube_candidates, yt_client, api_key, term, deadline)
             except Exception as e:
                 print(f"❌ YouTube discovery failed: {e}")
-        
-        # Reverse Discovery
-        print("🔍 Running reverse discovery...")
-        try:
-            reverse_discovery = ReverseSearchDiscovery()
-            content_filter = ContentFilter()
+        units["reverse"] = partial(self.discover_reverse, REVERSE_QUERIES, deadline)
+        
+        progress = {name: SourceProgress(name) for name in self.yields.order(units)}
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="discovery")
+        for name, entry in progress.items():
+            if deadline.expired():
+                break
+            if name == "reverse":
+                print("🔍 Running reverse discovery...")
             
-            queries = ["new indie game", "small creator", "unknown artist", "underrated"]
-            reverse_results = reverse_discovery.discover_underexposed_content(queries)
-            filtered_results = content_filter.filter_results(reverse_results)
-            
-            for result in filtered_results[:20]:  # Limit to top 20
-                all_content.append({
-                    'title': result.title,
-                    'channel': 'Unknown',
-                    'url': result.url,
-                    'thumbnail': '',
-                    'description': result.snippet,
-                    'view_count': 0,
-                    'published': datetime.now().isoformat(),
-                    'platform': 'Web Search',
-                    'is_live': False,
-                    'category': 'reverse_discovery',
-                    'underexposure_score': (result.rank or 0) / 1000
-                })
-            
-            print(f"   Found {len(filtered_results)} items via reverse discovery")
-            if len(filtered_results) > 0:
-                print("   🔍 Sample reverse discoveries:")
-                for result in filtered_results[:3]:  # Show first 3
-                    print(f"      • {result.title[:50]}...")
-                    print(f"        🔗 {result.url}")
-                print()
+            entry.status = RUNNING
+            started = time.monotonic()
+            future = executor.submit(units[name])
+            try:
+                found = future.result(timeout=deadline.remaining())
+            except FutureTimeout:
+                # Leave the straggler behind (its requests time out at the
+                # deadline); its results are discarded
+                entry.status = CANCELLED
+                entry.seconds = time.monotonic() - started
+                print(f"⏱️  Time budget reached during '{name}'")
+                break
+            except Exception as e:
+                entry.status = FAILED
+                entry.error = str(e)
+                found = []
+                if name == "reverse":
+                    print(f"❌ Reverse discovery failed: {e}")
+                else:
+                    print(f"   Error searching for '{name.split(':', 1)[1]}': {e}")
+            else:
+                entry.status = COMPLETE
+                if name.startswith("youtube:"):
+                    term = name.split(':', 1)[1]
+                    pending[name] = (term, found, pool.submit(self.validation_items(term, found)))
+                    entry.seconds = time.monotonic() - started
+                    continue
+                all_content.extend(found)
             
-        except Exception as e:
-            print(f"❌ Reverse discovery failed: {e}")
-        
+            entry.items = len(found)
+            entry.seconds = time.monotonic() - started
+            self.yields.record(name, entry.items, entry.seconds)
+        
+        executor.shutdown(wait=False, cancel_futures=True)
+        
+        # The pool falls back to heuristics at the deadline, so these all resolve by then
+        for name, (term, candidates, verdicts) in pending.items():
+            found = self.youtube_items(term, candidates, verdicts.result())
+            all_content.extend(found)
+            progress[name].items = len(found)
+            self.yields.record(name, len(found), progress[name].seconds)
+        self.validation_stats = pool.get_stats()
+        pool.close()
+        for entry in progress.values():
+            if entry.status == PENDING:
+                entry.status = SKIPPED
+        self.last_report = summarize(progress.values())
+        self.yields.save()
+        
+        if not self.last_report["complete"]:
+            print(f"⏱️  Partial discovery: {self.last_report['status_counts']}")
+        
+        return self.finalize(all_content)
+    
+    def finalize(self, all_content):
+        """Rank discovered content and print a summary of it."""
         # Sort by underexposure score
         all_content.sort(key=lambda x: x['underexposure_score'], reverse=True)
         
@@ -634,23 +776,34 @@ class SimpleWebUI:
 """
         return html
     
-    def run(self):
-        """Run the discovery and generate the web interface."""
+    def publish(self, content, meta=None):
+        """Build the next feed in memory, then publish JSON + HTML atomically."""
+        return self.snapshots.publish(content, self.generate_html(content), meta)
+    
+    def run(self, budget_seconds=None):
+        """
+        Run the discovery and generate the web interface.
+        
+        Args:
+            budget_seconds: Time budget for discovery; defaults to
+                ``DISCOVERY_BUDGET_SECONDS`` (0 means unbounded)
+        """
         print("🚀 Counter-Exposure Engine - Simple Web UI")
         print("=" * 50)
         
-        # Discover content
-        content = self.discover_content()
-        
-        # Save data as JSON
-        self.data_file.write_text(json.dumps(content, indent=2, default=str), encoding='utf-8')
-        
-        # Generate HTML
-        html = self.generate_html(content)
-        self.output_file.write_text(html, encoding='utf-8')
+        if budget_seconds is None:
+            budget_seconds = config.DISCOVERY_BUDGET_SECONDS or None
         
-        print(f"\n✅ Web interface generated: {self.output_file.absolute()}")
-        print(f"📊 Data saved to: {self.data_file.absolute()}")
+        # Discover content
+        content = self.discover_content(budget_seconds)
+        snapshot = self.publish(content, {
+            "discovery": self.last_report,
+            "validation": {**self.validator.get_stats(), "pool": self.validation_stats},
+            "reverse_discovery": self.reverse_stats
+        })
+        
+        print(f"\n✅ Web interface generated: {self.snapshots.html_path.absolute()} (v{snapshot.version})")
+        print(f"📊 Data saved to: {self.snapshots.data_path.absolute()}")
         print("\n🌐 Open the HTML file in your browser to view the feed!")
         print("💡 The page will auto-refresh every 10 minutes.")
         
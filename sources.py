@@ -0,0 +1,129 @@
+"""
+Discovery Source Registry
+Maps source names to the client classes that implement them. A client's
+module is only imported, and the client only constructed, when the source
+is enabled and first used. Third-party sources can register through the
+``counter_exposure.sources`` entry-point group.
+"""
+import importlib
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from config import config
+
+
+@dataclass
+class SourceSpec:
+    """How to build one discovery source."""
+    name: str
+    target: str  # "module:attribute" of a client class or factory
+    enabled: Callable[[], bool] = lambda: True
+    fetch_kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+class SourceRegistry:
+    """Lazily imported, lazily constructed discovery clients."""
+
+    ENTRY_POINT_GROUP = "counter_exposure.sources"
+
+    def __init__(self, specs: Optional[List[SourceSpec]] = None, load_entry_points: bool = True):
+        self._specs: Dict[str, SourceSpec] = {}
+        self._clients: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._entry_points_pending = load_entry_points
+        for spec in specs or []:
+            self.register(spec)
+
+    def register(self, spec: SourceSpec):
+        """Add or replace a source definition."""
+        self._specs[spec.name] = spec
+        self._clients.pop(spec.name, None)
+
+    def set(self, name: str, client: Any):
+        """Use an already built client for a source; ``None`` disables it."""
+        if name not in self._specs:
+            self._specs[name] = SourceSpec(name=name, target="")
+        self._clients[name] = client
+
+    def names(self) -> List[str]:
+        """Names of all registered sources, in registration order."""
+        self._load_entry_points()
+        return list(self._specs)
+
+    def is_enabled(self, name: str) -> bool:
+        """Whether a source would be used, without importing it."""
+        if name in self._clients:
+            return self._clients[name] is not None
+        spec = self._specs.get(name)
+        return bool(spec and spec.enabled())
+
+    def enabled_names(self) -> List[str]:
+        return [name for name in self.names() if self.is_enabled(name)]
+
+    def loaded_names(self) -> List[str]:
+        """Sources whose clients have actually been constructed."""
+        return [name for name, client in self._clients.items() if client is not None]
+
+    def get(self, name: str) -> Optional[Any]:
+        """Client for a source, importing and constructing it on first use."""
+        if name in self._clients:
+            return self._clients[name]
+        if not self.is_enabled(name):
+            return None
+
+        with self._lock:
+            if name not in self._clients:
+                self._clients[name] = self._build(self._specs[name])
+        return self._clients[name]
+
+    def clients(self) -> List[Tuple[str, Any, Dict[str, Any]]]:
+        """(name, client, fetch kwargs) for every enabled source."""
+        result = []
+        for name in self.enabled_names():
+            client = self.get(name)
+            if client is not None:
+                result.append((name, client, self._specs[name].fetch_kwargs))
+        return result
+
+    def _build(self, spec: SourceSpec) -> Optional[Any]:
+        module_name, _, attribute = spec.target.partition(":")
+        try:
+            factory = getattr(importlib.import_module(module_name), attribute)
+            client = factory()
+        except Exception as e:
+            logger.error(f"Could not load discovery source '{spec.name}' ({spec.target}): {e}")
+            return None
+        logger.info(f"Loaded discovery source '{spec.name}'")
+        return client
+
+    def _load_entry_points(self):
+        """Register sources advertised by installed packages (once)."""
+        if not self._entry_points_pending:
+            return
+        self._entry_points_pending = False
+
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=self.ENTRY_POINT_GROUP):
+            if entry_point.name not in self._specs:
+                self.register(SourceSpec(name=entry_point.name, target=entry_point.value))
+
+
+def default_registry() -> SourceRegistry:
+    """Registry with the built-in YouTube and Twitch sources."""
+    return SourceRegistry([
+        SourceSpec(
+            name="youtube",
+            target="youtube_client:YouTubeDiscovery",
+            enabled=lambda: bool(config.YOUTUBE_API_KEY),
+            fetch_kwargs={"query": ""}
+        ),
+        SourceSpec(
+            name="twitch",
+            target="twitch_client:TwitchDiscovery",
+            enabled=lambda: all([config.TWITCH_CLIENT_ID, config.TWITCH_OAUTH_TOKEN])
+        ),
+    ])
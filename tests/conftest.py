@@ -10,6 +10,9 @@ from unittest.mock import MagicMock, patch
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import reverse_discovery
+from config import Config
+
 # Test configuration
 TEST_DATA_DIR = Path(__file__).parent / 'test_data'
 os.environ['LOG_LEVEL'] = 'DEBUG'
@@ -32,6 +35,29 @@ def setup_test_environment():
     # Cleanup if needed
     pass
 
+# State files that default to the project directory
+STATE_FILES = {
+    'CRAWL_FRONTIER_DB': 'crawl_frontier.db',
+    'EXPOSURE_TRACKER_DB': 'exposure_tracker.db',
+    'FEED_HTML_FILE': 'counter_exposure_feed.html',
+    'FEED_DATA_FILE': 'feed_data.json',
+    'FEED_SNAPSHOT_FILE': 'feed_snapshot.json',
+    'SOURCE_YIELD_FILE': 'source_yield.json',
+    'VALIDATION_CACHE_DB': 'validation_cache.db',
+    'JOB_QUEUE_DB': 'discovery_jobs.db',
+}
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    """Keep the default state files out of the project directory."""
+    for name, filename in STATE_FILES.items():
+        monkeypatch.setitem(Config._values, name, str(tmp_path / filename))
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    """Start every test without last pages cached by earlier ones."""
+    monkeypatch.setattr(reverse_discovery, '_last_page_cache', {})
+
 @pytest.fixture
 def mock_requests():
     """
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 import time
 
 from base_client import BaseDiscoveryClient, Stream
+from discovery_budget import Deadline, DeadlineExpired
 
 class TestBaseDiscoveryClient:
     """Test cases for BaseDiscoveryClient."""
@@ -94,6 +95,35 @@ class TestBaseDiscoveryClient:
         # Verify retries
         assert mock_get.call_count == 3  # Initial + 2 retries
     
+    @patch('requests.get')
+    def test_deadline_bounds_request_timeout(self, mock_get, client):
+        """Requests are given at most the time left, and none start after the deadline."""
+        import requests
+        
+        mock_get.return_value.json.return_value = {}
+        client._make_request("http://example.com/api", deadline=Deadline(0.5))
+        assert mock_get.call_args.kwargs["timeout"] <= 0.5
+        
+        expired = Deadline(0.001)
+        time.sleep(0.01)
+        with pytest.raises(requests.exceptions.Timeout):
+            client._make_request("http://example.com/api", deadline=expired)
+        assert mock_get.call_count == 1
+    
+    def test_iter_raw_pages_stops_at_the_deadline(self):
+        """No page is requested once the deadline has passed."""
+        class SlowClient(BaseDiscoveryClient):
+            def fetch_raw_page(self, page_token=None, deadline=None, **kwargs):
+                time.sleep(0.05)
+                return ["item"], str(int(page_token or 0) + 1)
+        
+        pages = []
+        with pytest.raises(DeadlineExpired):
+            for page in SlowClient(max_pages=10).iter_raw_pages(deadline=Deadline(0.12)):
+                pages.append(page)
+        
+        assert 2 <= len(pages) <= 3
+    
     def test_enforce_rate_limit(self, client):
         """Test rate limiting between requests."""
         client.calls_per_minute = 60  # 1 call per second
@@ -0,0 +1,90 @@
+"""
+Tests for the candidate pool.
+"""
+import pytest
+
+from candidate_pool import CandidatePool
+from tests.test_exposure_engine import make_stream
+
+
+class TestCandidatePool:
+    """Test cases for CandidatePool."""
+
+    @pytest.fixture
+    def pool(self):
+        """Create an empty pool."""
+        return CandidatePool(freshness_window_minutes=30)
+
+    def test_upsert_replaces_existing_entry(self, pool):
+        """Upserting the same key refreshes the stream and score."""
+        assert pool.upsert(make_stream("1", viewer_count=1), 0.4, expires_at=100, now=0)
+        assert not pool.upsert(make_stream("1", viewer_count=3), 0.9, expires_at=100, now=0)
+
+        assert len(pool) == 1
+        stream, score = pool.top_k(1, now=0)[0]
+        assert stream.viewer_count == 3
+        assert score == 0.9
+
+    def test_default_expiry_follows_freshness_window(self, pool):
+        """Streams leave the pool when they age out of the freshness window."""
+        pool.upsert(make_stream("1", started_at=1000.0), 0.5, now=1000.0)
+
+        assert pool.get("twitch:1").expires_at == 1000.0 + 30 * 60
+        assert pool.expire(now=1000.0 + 30 * 60 - 1) == 0
+        assert pool.expire(now=1000.0 + 30 * 60) == 1
+        assert "twitch:1" not in pool
+
+    def test_top_k_is_ordered_and_non_destructive(self, pool):
+        """top_k returns the best scores and leaves the pool intact."""
+        for i, score in enumerate([0.2, 0.9, 0.5, 0.7]):
+            pool.upsert(make_stream(str(i)), score, expires_at=100, now=0)
+        pool.remove("twitch:1")
+
+        first = [score for _, score in pool.top_k(2, now=0)]
+        second = [score for _, score in pool.top_k(3, now=0)]
+
+        assert first == [0.7, 0.5]
+        assert second == [0.7, 0.5, 0.2]
+
+    def test_top_k_skips_excluded_and_expired(self, pool):
+        """Excluded candidates are skipped and expired ones are dropped."""
+        pool.upsert(make_stream("old"), 0.99, expires_at=10, now=0)
+        pool.upsert(make_stream("seen"), 0.8, expires_at=100, now=0)
+        pool.upsert(make_stream("fresh"), 0.6, expires_at=100, now=0)
+
+        picked = pool.top_k(5, now=50, exclude=lambda s: s.stream_id == "seen")
+
+        assert [s.stream_id for s, _ in picked] == ["fresh"]
+        assert "twitch:seen" in pool
+        assert "twitch:old" not in pool
+
+    def test_heaps_are_rebuilt_when_stale(self, pool):
+        """Repeated upserts of the same key do not grow the heaps unbounded."""
+        for i in range(1000):
+            pool.upsert(make_stream("1"), i / 1000, expires_at=100, now=0)
+
+        assert len(pool._by_score) <= 2 * len(pool) + 65
+        assert pool.top_k(1, now=0)[0][1] == 0.999
+
+    def test_priority_key_orders_the_heap(self):
+        """With a priority key, top_k ranks by the key rather than the stored score."""
+        pool = CandidatePool(freshness_window_minutes=30, priority=lambda s: s.started_at)
+        pool.upsert(make_stream("old", started_at=100.0), 1.0, expires_at=5000, now=100.0)
+        pool.upsert(make_stream("new", started_at=900.0), 0.9, expires_at=5000, now=900.0)
+
+        assert [s.stream_id for s, _ in pool.top_k(2, now=1000.0)] == ["new", "old"]
+
+    def test_top_k_per_group(self):
+        """per_group returns the best k of every group, best first overall."""
+        pool = CandidatePool(freshness_window_minutes=30, group=lambda s: s.platform)
+        for i, score in enumerate([0.9, 0.8, 0.7]):
+            pool.upsert(make_stream(f"tw{i}"), score, expires_at=100, now=0)
+        for i, score in enumerate([0.3, 0.2]):
+            pool.upsert(make_stream(f"yt{i}", platform="youtube"), score, expires_at=100, now=0)
+
+        picked = pool.top_k(2, now=0, per_group=True, exclude=lambda s: s.stream_id == "tw0")
+
+        assert [s.stream_id for s, _ in picked] == ["tw1", "tw2", "yt0", "yt1"]
+        assert len(pool.top_k(10, now=0)) == 5
+        with pytest.raises(ValueError):
+            CandidatePool().top_k(1, per_group=True)
@@ -0,0 +1,142 @@
+"""
+Tests for the crawl frontier and resumable reverse discovery.
+"""
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import reverse_discovery
+from config import PROJECT_DIR, Config, _project_path
+from crawl_frontier import CrawlFrontier
+from reverse_discovery import ReverseSearchDiscovery
+from tests.conftest import STATE_FILES
+from tests.test_reverse_discovery import FakeGoogle
+
+DATA = Path(__file__).parent / "test_data"
+
+
+@pytest.fixture
+def frontier(tmp_path):
+    return CrawlFrontier(str(tmp_path / "frontier.db"), ttl_seconds=3600)
+
+
+def crawler(frontier, request):
+    discovery = ReverseSearchDiscovery(max_retries=0, delay_range=(0, 0), frontier=frontier)
+    discovery._make_request = request
+    return discovery
+
+
+class TestCrawlFrontier:
+    """Test cases for CrawlFrontier."""
+
+    def test_round_trip(self, frontier):
+        frontier.done("indie", "google", 3, [{"url": "https://a.example"}], {"last_page": 9}, now=100)
+
+        assert frontier.get("indie", "google", 3, now=200) == ([{"url": "https://a.example"}], {"last_page": 9})
+        assert frontier.get("indie", "youtube_live", 3, now=200) is None
+        assert frontier.progress("indie", "google", now=200) == [3]
+
+    def test_stale_units_expire(self, frontier):
+        frontier.done("indie", "google", 1, [], now=100)
+
+        assert frontier.get("indie", "google", 1, now=100 + 3600) is None
+        assert frontier.prune(now=100 + 3600) == 1
+        assert len(frontier) == 0
+
+    def test_refetch_replaces_unit(self, frontier):
+        frontier.done("indie", "google", 1, [{"url": "old"}], now=100)
+        frontier.done("indie", "google", 1, [{"url": "new"}], now=200)
+
+        assert frontier.get("indie", "google", 1, now=300)[0] == [{"url": "new"}]
+        assert frontier.get_stats()["size"] == 1
+
+
+class TestResume:
+    """ReverseSearchDiscovery resumes from the frontier."""
+
+    def test_google_pages_are_not_fetched_again(self, frontier, monkeypatch):
+        first = crawler(frontier, FakeGoogle(37))
+        expected = [r.url for r in first.reverse_search_google("indie game", max_pages=3)]
+        monkeypatch.setattr(reverse_discovery, "_last_page_cache", {})  # A new process
+
+        google = FakeGoogle(37)
+        results = crawler(frontier, google).reverse_search_google("indie game", max_pages=3)
+
+        assert [r.url for r in results] == expected
+        assert google.requested == []  # Last page and result pages both resumed
+
+    def test_stats_cover_pool_pacing_and_frontier(self, frontier):
+        discovery = crawler(frontier, FakeGoogle(37))
+        submitted = discovery.parse_pool.get_stats()["submitted"]  # The pool is shared by every crawler
+        discovery.reverse_search_google("indie game", max_pages=3)
+
+        stats = discovery.get_stats()
+        assert stats["parse_pool"]["submitted"] - submitted == 3
+        assert set(stats["host_scheduler"]) == {"hosts", "waited_seconds"}
+        assert stats["frontier"]["writes"] == 4 and stats["frontier"]["size"] == 4
+
+    def test_interrupted_run_fetches_only_missing_pages(self, frontier):
+        first = crawler(frontier, FakeGoogle(37))
+        first.find_last_page_google("indie game")
+        first._make_request = FakeGoogle(37, fail_on={35})  # Blocked partway through
+        first.reverse_search_google("indie game", max_pages=3)
+        assert frontier.progress("indie game", "google") == [0, 36, 37]
+
+        google = FakeGoogle(37)
+        results = crawler(frontier, google).reverse_search_google("indie game", max_pages=3)
+
+        assert google.requested == [35]
+        assert [r.rank for r in results] == [361, 351, 341]
+
+    def test_stale_pages_are_fetched_again(self, tmp_path):
+        frontier = CrawlFrontier(str(tmp_path / "stale.db"), ttl_seconds=0)
+        crawler(frontier, FakeGoogle(4)).reverse_search_google("indie game", max_pages=2)
+        assert len(frontier) == 3
+
+        google = FakeGoogle(4)
+        crawler(frontier, google).reverse_search_google("indie game", max_pages=2)
+
+        assert google.requested == [4, 3]  # The last page is still cached in-process
+
+    def test_youtube_resumes_from_stored_continuation(self, frontier):
+        shell = (DATA / "youtube_results.html").read_text(encoding="utf-8")
+        continuation = (DATA / "youtube_continuation.json").read_bytes()
+        calls = []
+
+        def fake_request(url, params=None, budget_key=None, payload=None):
+            calls.append(payload and payload["continuation"])
+            return SimpleNamespace(text=shell) if payload is None else SimpleNamespace(content=continuation)
+
+        first = crawler(frontier, fake_request).reverse_search_youtube_live("indie games", max_pages=2)
+        assert len(calls) == 2
+        calls.clear()
+
+        results = crawler(frontier, fake_request).reverse_search_youtube_live("indie games", max_pages=3)
+
+        assert calls == [json.loads(continuation)["onResponseReceivedCommands"][0]
+                         ["appendContinuationItemsAction"]["continuationItems"][1]
+                         ["continuationItemRenderer"]["continuationEndpoint"]["continuationCommand"]["token"]]
+        assert [r.url for r in results[-len(first):]] == [r.url for r in first]
+        assert results[-1].is_live and results[-1].channel == "Nadia Kos"
+
+    def test_default_frontier_path_comes_from_config(self, tmp_path):
+        """Relative frontier paths resolve against the project, not the working directory."""
+        assert ReverseSearchDiscovery().frontier.db_path == str(tmp_path / "crawl_frontier.db")
+        assert _project_path("crawl_frontier.db") == str(PROJECT_DIR / "crawl_frontier.db")
+        assert _project_path(str(tmp_path / "other.db")) == str(tmp_path / "other.db")
+
+    def test_every_state_file_resolves_against_the_project(self):
+        """No state file depends on the directory a process was started from."""
+        for name, filename in STATE_FILES.items():
+            setting = vars(Config)[name]
+            assert setting.cast(setting.default) == str(PROJECT_DIR / filename)
+
+    def test_frontier_can_be_disabled(self, tmp_path):
+        discovery = ReverseSearchDiscovery(max_retries=0, delay_range=(0, 0), use_frontier=False)
+        discovery._make_request = FakeGoogle(3)
+
+        discovery.reverse_search_google("indie game", max_pages=1)
+
+        assert discovery.frontier is None and not (tmp_path / "crawl_frontier.db").exists()
@@ -0,0 +1,55 @@
+"""
+Tests for discovery deadlines, progress reports and yield estimates.
+"""
+import time
+
+from discovery_budget import COMPLETE, SKIPPED, Deadline, SourceProgress, YieldEstimator, summarize
+
+
+class TestDeadline:
+    """Test cases for Deadline."""
+
+    def test_unbounded(self):
+        deadline = Deadline(None)
+        assert deadline.remaining() is None
+        assert not deadline.expired()
+
+    def test_expires(self):
+        deadline = Deadline(0.01)
+        assert 0 < deadline.remaining() <= 0.01
+        time.sleep(0.02)
+        assert deadline.expired()
+        assert deadline.remaining() == 0.0
+
+
+class TestYieldEstimator:
+    """Test cases for YieldEstimator."""
+
+    def test_order_prefers_unmeasured_then_best_yield(self):
+        """Unmeasured sources are tried first, then by items per second."""
+        yields = YieldEstimator(alpha=0.5)
+        yields.record("slow", items=1, seconds=10)
+        yields.record("fast", items=50, seconds=1)
+
+        assert yields.order(["slow", "new", "fast"]) == ["new", "fast", "slow"]
+
+        yields.record("fast", items=0, seconds=1)  # Degraded: 50 -> 25 items/s
+        assert yields.expected("fast") == 25.0
+
+    def test_estimates_persist(self, tmp_path):
+        path = tmp_path / "yield.json"
+        yields = YieldEstimator(path=path)
+        yields.record("a", items=10, seconds=2)
+        yields.save()
+
+        assert YieldEstimator(path=path).expected("a") == 5.0
+
+
+def test_summarize_reports_completeness():
+    """The report says whether every source completed and how far each got."""
+    report = summarize([SourceProgress("a", status=COMPLETE, items=3, pages=1, seconds=0.12345),
+                        SourceProgress("b", status=SKIPPED)])
+
+    assert not report["complete"]
+    assert report["status_counts"] == {COMPLETE: 1, SKIPPED: 1}
+    assert report["sources"]["a"] == {"status": COMPLETE, "items": 3, "pages": 1, "seconds": 0.123, "error": None}
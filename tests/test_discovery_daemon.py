@@ -0,0 +1,67 @@
+"""
+Tests for the resident discovery daemon.
+"""
+import time
+
+import pytest
+
+from discovery_daemon import DiscoveryDaemon
+from exposure_engine import CounterExposureEngine
+from tests.test_exposure_engine import FakeClient, make_stream
+
+
+class TestDiscoveryDaemon:
+    """Test cases for DiscoveryDaemon."""
+
+    @pytest.fixture
+    def daemon(self, tmp_path, monkeypatch):
+        """Create a daemon around an engine with canned discovery results."""
+        monkeypatch.chdir(tmp_path)
+        engine = CounterExposureEngine()
+        self.discover_calls = 0
+
+        class CountingClient(FakeClient):
+            def fetch_raw_page(client, page_token=None, **kwargs):
+                self.discover_calls += 1
+                now = time.time()
+                return [make_stream(f"{self.discover_calls}-{i}", started_at=now - 60) for i in range(3)], None
+
+        engine.youtube_client = None
+        engine.twitch_client = CountingClient()
+        daemon = DiscoveryDaemon(engine=engine, interval_seconds=3600, feed_count=2)
+        yield daemon
+        daemon.stop()
+
+    def test_latest_feed_before_start_is_empty(self, daemon):
+        """Readers get an empty snapshot until the first cycle completes."""
+        feed = daemon.latest_feed()
+        assert feed.cycle == 0
+        assert feed.items == ()
+
+    def test_cycles_publish_snapshots_on_one_loop(self, daemon):
+        """Scheduled and triggered cycles reuse the same engine and loop."""
+        daemon.start()
+        deadline = time.time() + 5
+        while daemon.latest_feed().cycle < 1 and time.time() < deadline:
+            time.sleep(0.01)
+
+        first = daemon.latest_feed()
+        assert first.cycle == 1
+        assert len(first.items) == 2
+
+        second = daemon.trigger().result(timeout=5)
+        assert second.cycle == 2
+        assert daemon.latest_feed() is second
+        assert self.discover_calls == 2
+        # Unselected candidate from cycle 1 is still pooled in the same engine
+        assert daemon.get_stats()["candidate_pool"]["size"] == 2
+        assert daemon.get_stats()["daemon"]["running"]
+
+    def test_stats_are_live_while_stopped(self, daemon):
+        """Without the loop running, stats reflect exposures recorded since the daemon was built."""
+        daemon.engine.tracker.record_exposure(make_stream("elsewhere"), 0.5)
+
+        stats = daemon.get_stats()
+
+        assert stats["exposure_stats"]["twitch"]["count"] == 1
+        assert not stats["daemon"]["running"]
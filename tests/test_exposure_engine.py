@@ -0,0 +1,575 @@
+"""
+Tests for the exposure engine: tracking, scheduling and selection.
+"""
+import asyncio
+import gzip
+import json
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from base_client import BaseDiscoveryClient, Stream
+from exposure_engine import CounterExposureEngine, ExposureTracker, FairnessAllocator, FairnessScheduler
+from feed_profiles import FeedProfile
+
+
+def make_stream(stream_id="1", platform="twitch", viewer_count=1, started_at=None, language="en"):
+    """Build a Stream with sensible defaults for tests."""
+    return Stream(
+        platform=platform,
+        stream_id=stream_id,
+        title=f"Stream {stream_id}",
+        url=f"http://example.com/{stream_id}",
+        channel_name=f"Channel {stream_id}",
+        viewer_count=viewer_count,
+        started_at=started_at,
+        language=language
+    )
+
+
+class FakeClient(BaseDiscoveryClient):
+    """Discovery client that serves canned pages of streams."""
+
+    PLATFORM = "twitch"
+
+    def __init__(self, pages=None):
+        super().__init__()
+        self.pages = pages or []
+        self.calls = 0
+
+    def fetch_raw_page(self, page_token=None, **kwargs):
+        self.calls += 1
+        if not self.pages:
+            return [], None
+        index = int(page_token or 0)
+        next_token = str(index + 1) if index + 1 < len(self.pages) else None
+        return self.pages[index], next_token
+
+
+class TestExposureTracker:
+    """Test cases for ExposureTracker partitioning and retention."""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        """Create a tracker backed by a temporary database."""
+        return ExposureTracker(db_path=str(tmp_path / "tracker.db"), hot_days=2)
+
+    def _insert_old_exposure(self, tracker, days_ago, stream_id="old", platform="youtube", score=0.5, viewers=2):
+        """Write an exposure directly into a past day's partition."""
+        exposed_at = time.time() - days_ago * 24 * 3600
+        partition = tracker.partition_for(exposed_at)
+        conn = sqlite3.connect(tracker.db_path)
+        tracker._ensure_partition(conn, partition)
+        conn.execute(
+            f"INSERT INTO {partition} (stream_id, platform, channel_name, exposed_at, score, viewer_count) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (stream_id, platform, "Old Channel", exposed_at, score, viewers)
+        )
+        conn.commit()
+        conn.close()
+        return partition
+
+    def test_record_exposure_writes_today_partition(self, tracker):
+        """Exposures land in today's partition and the in-memory set."""
+        stream = make_stream()
+        tracker.record_exposure(stream, 0.8)
+
+        assert tracker.is_exposed_today(stream)
+        today = tracker.partition_for(time.time())
+        conn = sqlite3.connect(tracker.db_path)
+        assert conn.execute(f"SELECT COUNT(*) FROM {today}").fetchone()[0] == 1
+        conn.close()
+
+        reloaded = ExposureTracker(db_path=tracker.db_path, hot_days=2)
+        assert reloaded.is_exposed_today(stream)
+
+    def test_legacy_table_is_migrated(self, tmp_path):
+        """Rows from the unpartitioned table move into daily partitions."""
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE exposures (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                stream_id TEXT NOT NULL, platform TEXT NOT NULL, channel_name TEXT NOT NULL,
+                exposed_at REAL NOT NULL, score REAL NOT NULL, viewer_count INTEGER NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute(
+            "INSERT INTO exposures (stream_id, platform, channel_name, exposed_at, score, viewer_count) "
+            "VALUES ('abc', 'twitch', 'Legacy', ?, 0.4, 3)",
+            (time.time(),)
+        )
+        conn.commit()
+        conn.close()
+
+        tracker = ExposureTracker(db_path=db_path)
+        assert tracker.is_exposed_today(make_stream("abc"))
+        conn = sqlite3.connect(db_path)
+        tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        conn.close()
+        assert "exposures" not in tables
+
+    def test_old_partitions_are_compacted_and_still_counted(self, tracker):
+        """Partitions past the hot window move to archives but stay queryable."""
+        partition = self._insert_old_exposure(tracker, days_ago=5)
+        tracker.record_exposure(make_stream("new", platform="youtube", viewer_count=4), 1.0)
+
+        compacted = tracker.compact_partitions()
+
+        assert compacted == [partition]
+        assert partition not in tracker._partitions
+        archive = tracker._archive_path(partition)
+        with gzip.open(archive, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        assert payload["columns"]["stream_id"] == ["old"]
+
+        assert tracker.get_exposure_stats(days=7)["youtube"] == {
+            "count": 2, "avg_score": 0.75, "avg_viewers": 3.0
+        }
+        assert tracker.get_exposure_stats(days=1)["youtube"]["count"] == 1
+
+    def test_stats_span_more_partitions_than_one_compound_select(self, tmp_path):
+        """Stats over more than 500 live partitions are aggregated in chunks."""
+        tracker = ExposureTracker(db_path=str(tmp_path / "tracker.db"), hot_days=1000)
+        for days_ago in range(600):
+            self._insert_old_exposure(tracker, days_ago=days_ago, viewers=days_ago % 2)
+
+        stats = tracker.get_exposure_stats(days=1000)
+
+        assert stats["youtube"] == {"count": 600, "avg_score": 0.5, "avg_viewers": 0.5}
+
+    def test_partitions_created_by_other_processes_are_seen(self, tmp_path):
+        """A tracker picks up partitions that another tracker on the same database created."""
+        db_path = str(tmp_path / "tracker.db")
+        tracker = ExposureTracker(db_path=db_path, hot_days=2)
+        other = ExposureTracker(db_path=db_path, hot_days=2)
+        stream = make_stream("shared", platform="youtube")
+        other.record_exposure(stream, 0.5)
+
+        assert tracker.get_exposure_stats()["youtube"]["count"] == 1
+        tracker._today_end = time.time() - 1
+        assert tracker.is_exposed_today(stream)
+
+    def test_tables_that_only_look_like_partitions_are_ignored(self, tmp_path):
+        """Names such as ``exposures_1`` or an impossible date are not read as days."""
+        db_path = str(tmp_path / "tracker.db")
+        conn = sqlite3.connect(db_path)
+        for name in ("exposures_1", "exposures_20241399", "exposures_2024010x"):
+            conn.execute(f"CREATE TABLE {name} (stream_id TEXT)")
+        conn.commit()
+        conn.close()
+        (tmp_path / "exposure_archive").mkdir()
+        (tmp_path / "exposure_archive" / "exposures_backup.json.gz").write_bytes(b"")
+
+        tracker = ExposureTracker(db_path=db_path, hot_days=2)
+        tracker.record_exposure(make_stream(), 0.5)
+
+        assert tracker._partitions == {tracker.partition_for(time.time())}
+        assert tracker._archived_partitions() == []
+        assert tracker.get_exposure_stats()["twitch"]["count"] == 1
+
+    def test_archive_retention_deletes_expired_archives(self, tmp_path):
+        """Archives older than the retention window are removed."""
+        tracker = ExposureTracker(db_path=str(tmp_path / "tracker.db"), hot_days=1, archive_retention_days=10)
+        recent = self._insert_old_exposure(tracker, days_ago=3)
+        expired = self._insert_old_exposure(tracker, days_ago=30)
+
+        tracker.compact_partitions()
+
+        assert tracker._archived_partitions() == [recent]
+        assert not tracker._archive_path(expired).exists()
+
+    def test_day_rollover_switches_partition(self, tracker):
+        """After midnight the in-memory set only reflects the new day."""
+        stream = make_stream()
+        tracker.record_exposure(stream, 0.5)
+        tracker._today_end = time.time() - 1
+
+        tomorrow = datetime.now() + timedelta(days=1)
+        assert tracker.partition_for(tomorrow.timestamp()) != tracker._today_partition
+        assert tracker.is_exposed_today(stream)  # same real day, reload keeps it
+        assert tracker._today_end > time.time()
+
+
+class TestFairnessScheduler:
+    """Test cases for FairnessScheduler scoring and selection."""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        """Create a tracker backed by a temporary database."""
+        return ExposureTracker(db_path=str(tmp_path / "tracker.db"))
+
+    @pytest.fixture
+    def scheduler(self):
+        """Create a scheduler with default thresholds."""
+        return FairnessScheduler()
+
+    def _random_streams(self, count, now, seed=7):
+        """Generate a mix of eligible and ineligible streams."""
+        rng = random.Random(seed)
+        platforms = ["youtube", "twitch", "kick"]
+        streams = []
+        for i in range(count):
+            started_at = rng.choice([None, 0.0, now - rng.uniform(0, 3600), now + rng.uniform(0, 60)])
+            streams.append(make_stream(
+                stream_id=str(i),
+                platform=rng.choice(platforms),
+                viewer_count=rng.randint(0, 8),
+                started_at=started_at,
+                language=rng.choice(["en", "es", None])
+            ))
+        return streams
+
+    def test_batch_scoring_matches_scalar_path(self, scheduler, tracker):
+        """Vectorized eligibility and scores are identical to the scalar path."""
+        now = time.time()
+        streams = self._random_streams(500, now)
+        for stream in streams[:20]:
+            tracker.record_exposure(stream, 0.5)
+
+        batch = scheduler.filter_eligible_streams(streams, tracker, now=now)
+        scalar = scheduler._filter_eligible_scalar(streams, tracker, now)
+
+        assert batch
+        assert [(s.stream_id, score) for s, score in batch] == [(s.stream_id, score) for s, score in scalar]
+
+    def test_score_batch_columnar_inputs(self, scheduler):
+        """The batch API accepts plain columns and platform codes."""
+        now = 1_000_000.0
+        codes = scheduler.encode_platforms(["youtube", "twitch", "twitch"])
+        mask, scores = scheduler.score_batch(
+            viewer_counts=[0, 10, 2],
+            started_at=[now - 60, now - 60, float("nan")],
+            platform_codes=codes,
+            now=now
+        )
+
+        expected = scheduler.calculate_underexposure_score(make_stream(platform="youtube", viewer_count=0, started_at=now - 60), now)
+        assert scores[0] == expected
+        assert list(mask) == [True, False, False]
+        assert scores[2] == 0.0
+
+    @staticmethod
+    def _reference_select(scored_streams, count):
+        """The original sort-and-pop round-robin selection."""
+        groups = {}
+        for stream, score in scored_streams:
+            groups.setdefault(f"{stream.platform}:{stream.language or 'unknown'}", []).append((stream, score))
+        for key in groups:
+            groups[key].sort(key=lambda x: x[1], reverse=True)
+        selected = []
+        group_keys = list(groups.keys())
+        random.shuffle(group_keys)
+        while len(selected) < count and any(groups.values()):
+            for key in group_keys:
+                if groups[key] and len(selected) < count:
+                    selected.append(groups[key].pop(0))
+        return selected
+
+    def test_select_diverse_matches_round_robin(self, scheduler):
+        """Heap-based selection keeps the original round-robin semantics."""
+        rng = random.Random(3)
+        scored = [
+            (make_stream(str(i), platform=rng.choice(["youtube", "twitch"]), language=rng.choice(["en", "es", "de", None])),
+             rng.choice([0.2, 0.5, 0.9, rng.random()]))
+            for i in range(300)
+        ]
+
+        for count in (1, 7, 50, 400):
+            random.seed(count)
+            expected = self._reference_select(scored, count)
+            random.seed(count)
+            assert scheduler.select_diverse_streams(scored, count) == expected
+
+    def test_select_diverse_weighted_quotas(self, scheduler):
+        """Group weights scale each group's share of the slots."""
+        scored = [(make_stream(f"a{i}", language="en"), 0.5) for i in range(10)]
+        scored += [(make_stream(f"b{i}", language="es"), 0.9) for i in range(10)]
+        scored += [(make_stream(f"c{i}", language="de"), 0.9) for i in range(10)]
+
+        selected = scheduler.select_diverse_streams(
+            scored, count=9, weights={"twitch:en": 2.0, "twitch:es": 1.0, "twitch:de": 0}
+        )
+
+        languages = [stream.language for stream, _ in selected]
+        assert languages.count("en") == 6
+        assert languages.count("es") == 3
+        assert "de" not in languages
+
+    def test_eligible_until_matches_score_threshold(self, scheduler, tracker):
+        """A stream is eligible right before eligible_until and not after."""
+        started = 1_000_000.0
+        for viewers, platform in [(5, "youtube"), (4, "youtube"), (0, "twitch"), (5, "twitch")]:
+            stream = make_stream(platform=platform, viewer_count=viewers, started_at=started)
+            until = scheduler.eligible_until(stream)
+
+            assert scheduler._filter_eligible_scalar([stream], tracker, until - 1)
+            assert not scheduler._filter_eligible_scalar([stream], tracker, until + 1)
+
+
+class TestFairnessAllocator:
+    """Test cases for persisted deficit round-robin allocation."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Path of a temporary tracker database."""
+        return str(tmp_path / "tracker.db")
+
+    def test_long_run_exposure_is_proportional(self, db_path):
+        """Groups receive equal slots over many cycles even when one slot is short."""
+        served = {"a": 0, "b": 0, "c": 0}
+        for _ in range(30):
+            allocator = FairnessAllocator(db_path)  # fresh instance: state comes from the database
+            for key, slots in allocator.allocate({"a": 5, "b": 5, "c": 5}, count=2).items():
+                served[key] += slots
+
+        assert sum(served.values()) == 60
+        assert all(19 <= slots <= 21 for slots in served.values())
+
+    def test_weights_and_short_groups(self, db_path):
+        """Weights scale quotas and a group never gets more slots than candidates."""
+        allocator = FairnessAllocator(db_path)
+        totals = {"big": 0, "small": 0}
+        for _ in range(20):
+            for key, slots in allocator.allocate({"big": 10, "small": 10}, count=3, weights={"big": 2.0}).items():
+                totals[key] += slots
+
+        assert totals == {"big": 40, "small": 20}
+        assert allocator.allocate({"big": 10, "small": 1}, count=5)["small"] == 1
+
+    def test_scheduler_uses_allocator_quotas(self, db_path):
+        """select_diverse_streams respects the allocator's per-group quotas."""
+        scheduler = FairnessScheduler(allocator=FairnessAllocator(db_path))
+        scored = [(make_stream(f"en{i}", language="en"), 0.5) for i in range(5)]
+        scored += [(make_stream(f"es{i}", language="es"), 0.5) for i in range(5)]
+
+        picks = []
+        for _ in range(4):
+            picks += [stream.language for stream, _ in scheduler.select_diverse_streams(scored, count=1)]
+
+        assert picks.count("en") == 2
+        assert picks.count("es") == 2
+
+    def test_namespaces_keep_separate_deficits(self, db_path):
+        """Allocators sharing a database only load their own namespace's counters."""
+        FairnessAllocator(db_path, namespace="tiny").allocate({"a": 5, "b": 5}, count=3)
+
+        assert FairnessAllocator(db_path).get_stats() == {"groups": 0, "total_served": 0}
+        assert FairnessAllocator(db_path, namespace="tiny").get_stats() == {"groups": 2, "total_served": 3}
+
+
+class TestCounterExposureEngine:
+    """Test cases for CounterExposureEngine feed generation."""
+
+    @pytest.fixture
+    def engine(self, tmp_path, monkeypatch):
+        """Create an engine whose tracker lives in a temporary directory."""
+        monkeypatch.chdir(tmp_path)
+        engine = CounterExposureEngine()
+        engine.youtube_client = None
+        engine.twitch_client = FakeClient()
+        return engine
+
+    def test_tracker_database_comes_from_config(self, engine, tmp_path):
+        assert engine.tracker.db_path == str(tmp_path / "exposure_tracker.db")
+        assert engine.scheduler.allocator.db_path == engine.tracker.db_path
+
+    def test_unselected_candidates_carry_over(self, engine):
+        """Candidates not selected in one cycle stay pooled for the next."""
+        now = time.time()
+        streams = [make_stream(str(i), viewer_count=i % 3, started_at=now - 60) for i in range(6)]
+
+        engine.twitch_client.pages = [streams[:4], streams[4:]]
+        first = engine.generate_exposure_feed(count=2)
+
+        assert len(first) == 2
+        assert len(engine.pool) == 4
+
+        engine.twitch_client.pages = []
+        second = engine.generate_exposure_feed(count=10)
+        assert {item["stream_id"] for item in second} == {s.stream_id for s in streams} - {i["stream_id"] for i in first}
+        assert len(engine.pool) == 0
+
+    def test_feed_from_pool_uses_best_candidates(self, engine):
+        """feed_from_pool serves the top-scored pooled streams without discovery."""
+        now = time.time()
+        for i in range(5):
+            stream = make_stream(str(i), viewer_count=i, started_at=now - 60)
+            engine.pool.upsert(stream, engine.scheduler.calculate_underexposure_score(stream, now),
+                               engine.scheduler.eligible_until(stream), now)
+
+        feed = engine.feed_from_pool(count=2)
+
+        assert [item["stream_id"] for item in feed] == ["0", "1"]
+        assert engine.tracker.is_exposed_today(make_stream("0"))
+        assert len(engine.pool) == 3
+
+    def test_feed_from_pool_keeps_groups_diverse(self, engine):
+        """Pooled feeds go through diversity selection, not just the top scores."""
+        now = time.time()
+        streams = [make_stream(f"tw{i}", viewer_count=0, started_at=now - 60) for i in range(4)]
+        streams += [make_stream(f"yt{i}", platform="youtube", viewer_count=3, started_at=now - 60) for i in range(2)]
+        for stream in streams:
+            engine.pool.upsert(stream, engine.scheduler.calculate_underexposure_score(stream, now),
+                               engine.scheduler.eligible_until(stream), now)
+
+        feed = engine.feed_from_pool(count=4)
+
+        assert sorted(item["stream_id"] for item in feed) == ["tw0", "tw1", "yt0", "yt1"]
+
+    def test_generated_feed_is_selected_like_a_pooled_one(self, engine, monkeypatch):
+        """After discovery the feed comes from feed_from_pool, without scanning the whole pool."""
+        now = time.time()
+        engine.twitch_client.pages = [[make_stream(str(i), started_at=now - 60) for i in range(3)]]
+        calls = []
+        feed_from_pool = engine.feed_from_pool
+        monkeypatch.setattr(engine, "feed_from_pool", lambda count, now: calls.append(count) or feed_from_pool(count, now))
+        monkeypatch.setattr(engine.pool, "candidates", lambda now=None: pytest.fail("scanned the pool"))
+
+        feed = engine.generate_exposure_feed(count=2)
+
+        assert calls == [2]
+        assert len(feed) == 2 and len(engine.pool) == 1
+
+    def test_pooled_scores_are_compared_at_selection_time(self, engine):
+        """A stream pooled while fresh does not outrank a fresher one found later."""
+        now = time.time()
+        old = make_stream("old", viewer_count=0, started_at=now - 1500)
+        fresh = make_stream("fresh", viewer_count=0, started_at=now - 60)
+        for stream, scored_at in ((old, old.started_at), (fresh, now)):
+            engine.pool.upsert(stream, engine.scheduler.calculate_underexposure_score(stream, scored_at),
+                               engine.scheduler.eligible_until(stream), scored_at)
+        
+        feed = engine.feed_from_pool(count=1)
+        
+        assert [item["stream_id"] for item in feed] == ["fresh"]
+    
+    def test_pipeline_dedupes_validates_and_reports_stats(self, engine):
+        """Each stage runs, duplicates and exposed streams are dropped, and stats are kept."""
+        now = time.time()
+        streams = [make_stream(str(i), started_at=now - 60) for i in range(4)]
+        engine.tracker.record_exposure(streams[0], 0.5)
+        engine.twitch_client.pages = [streams[:3], streams[1:], [make_stream("crowded", viewer_count=50, started_at=now)]]
+        engine.stream_validators.append(lambda batch: [s for s in batch if s.stream_id != "3"])
+
+        discovered = asyncio.run(engine.discover_streams())
+        assert sorted(s.stream_id for s in discovered) == ["0", "1", "2", "3", "crowded"]
+
+        engine.generate_exposure_feed(count=0)
+        stats = engine.get_stats()["pipeline"]
+        assert list(stats) == ["fetch", "decode", "dedupe", "validate", "score", "pool"]
+        assert stats["fetch"]["emitted"] == 3
+        assert stats["dedupe"]["emitted"] == 3
+        assert {s.stream_id for s, _ in engine.pool.candidates()} == {"1", "2"}
+        assert all(stage["errors"] == 0 for stage in stats.values())
+
+    def test_profiles_share_one_discovery_pass(self, engine):
+        """Every profile is selected from one fetch; shared streams are recorded once."""
+        now = time.time()
+        engine.twitch_client.pages = [[
+            make_stream("quiet", viewer_count=1, started_at=now - 60),
+            make_stream("busy", viewer_count=40, started_at=now - 60),
+            make_stream("spanish", viewer_count=2, started_at=now - 60, language="es"),
+        ]]
+        profiles = [
+            FeedProfile(name="tiny", max_viewers=5),
+            FeedProfile(name="mid", max_viewers=100),
+            FeedProfile(name="es", max_viewers=5, languages=["es"]),
+        ]
+
+        feeds = engine.generate_profile_feeds(profiles)
+
+        assert engine.twitch_client.calls == 1
+        assert list(feeds) == ["tiny", "mid", "es"]
+        assert {item["stream_id"] for item in feeds["tiny"]} == {"quiet", "spanish"}
+        assert {item["stream_id"] for item in feeds["mid"]} == {"quiet", "spanish", "busy"}
+        assert [item["stream_id"] for item in feeds["es"]] == ["spanish"]
+        assert engine.tracker.get_exposure_stats()["twitch"]["count"] == 3
+
+    def test_profile_feeds_select_from_the_pool(self, engine):
+        """Streams no profile selects stay pooled, and profiles draw on earlier finds."""
+        now = time.time()
+        streams = [make_stream(str(i), viewer_count=i % 3, started_at=now - 60) for i in range(4)]
+        busy = make_stream("busy", viewer_count=40, started_at=now - 60)
+        profiles = [FeedProfile(name="tiny", count=1), FeedProfile(name="mid", count=1, max_viewers=100)]
+
+        engine.twitch_client.pages = [streams + [busy]]
+        first = engine.generate_profile_feeds(profiles)
+
+        exposed = {item["stream_id"] for feed in first.values() for item in feed}
+        assert 1 <= len(exposed) <= 2
+        assert len(engine.pool) == 5 - len(exposed)
+        assert all(scheduler.allocator for scheduler in map(engine.profile_scheduler, profiles))
+
+        engine.twitch_client.pages = []
+        second = engine.generate_profile_feeds([FeedProfile(name="mid", count=10, max_viewers=100)])
+        assert {item["stream_id"] for item in second["mid"]} == {"0", "1", "2", "3", "busy"} - exposed
+        assert len(engine.pool) == 0
+
+    def test_profile_batch_selection_matches_scalar(self, engine):
+        """The shared vectorized columns give the same eligibility as per-stream scoring."""
+        now = time.time()
+        rng = random.Random(7)
+        streams = [
+            make_stream(str(i), platform=rng.choice(["twitch", "youtube"]), viewer_count=rng.randint(0, 30),
+                        started_at=now - rng.randint(0, 3600), language=rng.choice(["en", "es"]))
+            for i in range(200)
+        ]
+        profiles = [FeedProfile(name="a", max_viewers=5, count=500),
+                    FeedProfile(name="b", max_viewers=25, freshness_window_minutes=45, count=500,
+                                platforms=["twitch"])]
+
+        batch = engine.select_profiles(streams, profiles, now)
+        for profile in profiles:
+            scalar = engine.profile_scheduler(profile)._filter_eligible_scalar(
+                [s for s in streams if profile.matches(s)], engine.tracker, now
+            )
+            assert sorted((s.stream_id, score) for s, score in batch[profile.name]) == \
+                sorted((s.stream_id, score) for s, score in scalar)
+
+    def test_budget_builds_feed_from_what_arrived(self, engine):
+        """At the deadline the slow source is cancelled and pooled streams still make the feed."""
+        now = time.time()
+
+        class SlowClient(FakeClient):
+            def fetch_raw_page(self, page_token=None, **kwargs):
+                if page_token:
+                    time.sleep(1.0)  # Degraded API: every page after the first hangs
+                return super().fetch_raw_page(page_token, **kwargs)
+
+        engine.twitch_client = SlowClient([[make_stream("early", started_at=now - 60)],
+                                           [make_stream("late", started_at=now - 60)]])
+
+        started = time.perf_counter()
+        feed = engine.generate_exposure_feed(count=5, budget_seconds=0.3)
+
+        assert time.perf_counter() - started < 1.0
+        assert [item["stream_id"] for item in feed] == ["early"]
+        sources = engine.get_stats()["sources"]
+        assert not sources["complete"]
+        assert sources["sources"]["twitch"]["status"] == "cancelled"
+        assert sources["sources"]["twitch"]["pages"] == 1
+
+    def test_failing_source_is_reported_failed(self, engine):
+        """An API error marks the source failed and leaves its yield estimate alone."""
+        now = time.time()
+
+        class BrokenClient(FakeClient):
+            def fetch_raw_page(self, page_token=None, **kwargs):
+                if page_token:
+                    raise RuntimeError("503 Service Unavailable")
+                return super().fetch_raw_page(page_token, **kwargs)
+
+        engine.twitch_client = BrokenClient([[make_stream("early", started_at=now - 60)],
+                                             [make_stream("late", started_at=now - 60)]])
+
+        feed = engine.generate_exposure_feed(count=5)
+
+        assert [item["stream_id"] for item in feed] == ["early"]
+        twitch = engine.get_stats()["sources"]["sources"]["twitch"]
+        assert twitch["status"] == "failed" and "503" in twitch["error"]
+        assert engine.yields.expected("twitch") is None
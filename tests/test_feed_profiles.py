@@ -0,0 +1,45 @@
+"""
+Tests for feed profile configuration.
+"""
+import json
+
+import pytest
+
+from feed_profiles import FeedProfile, load_profiles
+from tests.test_exposure_engine import make_stream
+
+
+class TestFeedProfiles:
+    """Test cases for FeedProfile and load_profiles."""
+
+    def test_load_from_json_and_file(self, tmp_path):
+        """Profiles load from inline JSON or from a file path."""
+        spec = [{"name": "tiny", "max_viewers": 2}, {"name": "es", "languages": ["es"], "count": 5}]
+        path = tmp_path / "profiles.json"
+        path.write_text(json.dumps(spec))
+
+        for source in (json.dumps(spec), str(path)):
+            profiles = load_profiles(source)
+            assert [p.name for p in profiles] == ["tiny", "es"]
+            assert profiles[0].max_viewers == 2 and profiles[1].count == 5
+
+        assert load_profiles("") == []
+
+    def test_invalid_profiles_are_rejected(self):
+        """Unknown fields, missing names and duplicate names raise."""
+        with pytest.raises(ValueError):
+            load_profiles('[{"name": "a", "max_veiwers": 3}]')
+        with pytest.raises(ValueError):
+            load_profiles('[{"count": 3}]')
+        with pytest.raises(ValueError):
+            load_profiles('[{"name": "a"}, {"name": "a"}]')
+
+    def test_filters(self):
+        """Platform and language filters; None accepts everything."""
+        profile = FeedProfile(name="p", platforms=["twitch"], languages=["es", "unknown"])
+
+        assert profile.matches(make_stream(language="es"))
+        assert profile.matches(make_stream(language=None))
+        assert not profile.matches(make_stream(language="en"))
+        assert not profile.matches(make_stream(platform="youtube", language="es"))
+        assert FeedProfile(name="all").matches(make_stream(platform="youtube", language="en"))
@@ -0,0 +1,113 @@
+"""
+Tests for double-buffered feed snapshots.
+"""
+import json
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from feed_snapshot import SnapshotManager
+
+
+def publish_many(paths, count, versions):
+    """Publisher process body: publish ``count`` feeds and report their versions."""
+    manager = SnapshotManager(*paths, check_interval=0)
+    for n in range(count):
+        snapshot = manager.publish([{"n": n}], str(n))
+        versions.put(snapshot.version)
+
+
+class TestSnapshotManager:
+    """Test cases for SnapshotManager."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Snapshot manager writing into a temporary directory."""
+        return SnapshotManager(
+            html_path=tmp_path / "feed.html",
+            data_path=tmp_path / "feed.json",
+            manifest_path=tmp_path / "snapshot.json"
+        )
+
+    def test_no_snapshot_before_first_publish(self, manager):
+        """Nothing is served until a feed has been published."""
+        assert manager.current() is None
+
+    def test_publish_swaps_memory_and_disk(self, manager):
+        """A published snapshot is current in memory and written to disk."""
+        snapshot = manager.publish([{"title": "a"}], "<p>a</p>")
+
+        assert manager.current() is snapshot
+        assert snapshot.version == 1
+        assert json.loads(manager.data_path.read_text()) == [{"title": "a"}]
+        assert manager.html_path.read_bytes() == b"<p>a</p>"
+        assert not list(manager.html_path.parent.glob("*.tmp"))
+
+    def test_versions_increase_and_survive_restart(self, manager):
+        """Versions are monotonic, including across a new manager instance."""
+        manager.publish([], "v1")
+        manager.publish([{"title": "b"}], "v2")
+
+        reloaded = SnapshotManager(manager.html_path, manager.data_path, manager.manifest_path)
+        assert reloaded.current().version == 2
+        assert reloaded.current().items == ({"title": "b"},)
+        assert reloaded.publish([], "v3").version == 3
+
+    def test_sees_feeds_published_by_other_processes(self, manager):
+        """A loaded manager picks up snapshots another manager published to the same files."""
+        manager.publish([], "v1")
+        reader = SnapshotManager(manager.html_path, manager.data_path, manager.manifest_path, check_interval=0)
+        assert reader.current().version == 1
+
+        manager.publish([{"title": "b"}], "v2")
+
+        assert reader.current().version == 2
+        assert reader.current().html == b"v2"
+        assert reader.publish([], "v3").version == 3
+
+    def test_readers_never_see_torn_snapshots(self, manager):
+        """Concurrent readers only ever observe complete, matching snapshots."""
+        manager.publish([{"n": 0}], "0")
+        stop = threading.Event()
+        problems = []
+
+        def read():
+            last_version = 0
+            while not stop.is_set():
+                snapshot = manager.current()
+                items = json.loads(snapshot.feed_json)
+                if snapshot.html.decode() != str(items[0]["n"]) or snapshot.version < last_version:
+                    problems.append(snapshot.version)
+                last_version = snapshot.version
+                time.sleep(0)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for n in range(1, 10):
+            manager.publish([{"n": n}], str(n))
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+        assert problems == []
+        assert manager.current().version == 10
+
+    def test_processes_publish_unique_versions(self, manager):
+        """Publishers in separate processes never hand out the same version."""
+        paths = (manager.html_path, manager.data_path, manager.manifest_path)
+        versions = multiprocessing.Queue()
+        publishers = [multiprocessing.Process(target=publish_many, args=(paths, 10, versions)) for _ in range(4)]
+        for publisher in publishers:
+            publisher.start()
+        for publisher in publishers:
+            publisher.join(timeout=60)
+
+        published = sorted(versions.get(timeout=5) for _ in range(40))
+        assert published == list(range(1, 41))
+        latest = SnapshotManager(*paths).current()
+        assert latest.version == 40
+        assert latest.html.decode() == str(latest.items[0]["n"])
+        assert len(list(manager.versions_dir.iterdir())) == SnapshotManager.KEEP_VERSIONS
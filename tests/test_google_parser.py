@@ -0,0 +1,88 @@
+"""
+Tests for the Google result page parser.
+"""
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from google_parser import GoogleHit, benchmark, parse_google_results, result_url
+
+DATA = Path(__file__).parent / "test_data"
+
+
+@pytest.fixture(params=["lxml", "html.parser"])
+def backend(request):
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    return request.param
+
+
+class TestParseGoogleResults:
+    """Test cases for parse_google_results."""
+
+    def test_saved_page_recall(self, backend):
+        html = (DATA / "google_serp.html").read_text(encoding="utf-8")
+        expected = json.loads((DATA / "google_serp.expected.json").read_text())
+
+        hits = parse_google_results(html, backend)
+
+        assert [hit.url for hit in hits] == expected
+        assert hits[0] == GoogleHit(
+            "https://www.indiedb.com/games/lantern-keeper", "Lantern Keeper - Indie DB",
+            "A cozy puzzle adventure about a lighthouse keeper. Developed by a two-person team in Porto.")
+
+    def test_classic_layout_and_plain_snippet(self, backend):
+        html = ('<h3><a href="https://a.example/x">First <b>result</b></a></h3><span>Snippet   one</span>'
+                '<a href="/search?start=10">Next</a>')
+
+        assert parse_google_results(html, backend) == [
+            GoogleHit("https://a.example/x", "First result", "Snippet one")]
+
+    def test_scripts_ads_and_internal_links_are_ignored(self, backend):
+        html = ('<script>var s = "<h3><a href=\'https://evil.example\'>x</a></h3>";</script>'
+                '<a href="https://www.googleadservices.com/pagead/aclk?sa=L"><h3>Ad</h3></a>'
+                '<a href="/search?q=related"><h3>Related search</h3></a>'
+                '<a href="https://b.example"><h3>Kept</h3><cite>b.example</cite></a><div>Text</div>')
+
+        assert parse_google_results(html, backend) == [GoogleHit("https://b.example", "Kept", "Text")]
+
+    def test_linear_on_large_pages(self, backend):
+        # Titles with no snippet spans made the old DOTALL regex rescan the tail
+        html = ''.join(f'<h3><a href="https://c.example/{i}">Result {i}</a></h3><div>filler</div>'
+                       for i in range(20000))
+
+        started = time.perf_counter()
+        hits = parse_google_results(html, backend)
+
+        assert len(hits) == 20000
+        assert time.perf_counter() - started < 5
+
+    def test_empty_and_unknown_backend(self):
+        assert parse_google_results("") == []
+        with pytest.raises(ValueError):
+            parse_google_results("<p></p>", "regex")
+
+
+class TestResultUrl:
+    """Test cases for result_url."""
+
+    @pytest.mark.parametrize("href, url", [
+        ("/url?q=https://d.example/page%3Fid%3D1&sa=U", "https://d.example/page?id=1"),
+        ("https://www.google.com/url?url=https://e.example/&sa=t", "https://e.example/"),
+        ("https://maps.google.com/maps?q=x", None),
+        ("/search?q=x", None),
+        ("javascript:void(0)", None),
+        (None, None),
+    ])
+    def test_unwraps_and_filters(self, href, url):
+        assert result_url(href) == url
+
+
+def test_benchmark_reports_recall():
+    rows = benchmark(DATA / "google_serp.html", repeat=1, backends=["html.parser", "regex"])
+
+    recall = {row["backend"]: row["recall"] for row in rows}
+    assert recall["html.parser"] == 1.0
+    assert recall["regex"] < 1.0
@@ -0,0 +1,189 @@
+"""
+Tests for the leased job queue and the discovery workers built on it.
+"""
+import multiprocessing
+import sqlite3
+import time
+
+import pytest
+
+import simple_web_ui
+from discovery_workers import DiscoveryCoordinator, DiscoveryWorker
+from exposure_engine import FairnessScheduler
+from job_queue import JobQueue
+from tests.test_exposure_engine import make_stream
+
+
+def claim_all(db_path, owner, claimed):
+    """Worker process body: claim jobs until none are visible."""
+    queue = JobQueue(db_path)
+    while (job := queue.claim(owner)) is not None:
+        claimed.put(job.id)
+        queue.complete(job, owner, [job.id])
+
+
+class TestJobQueue:
+    """Test cases for JobQueue."""
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        """Queue with a short visibility timeout."""
+        return JobQueue(str(tmp_path / "jobs.db"), visibility_timeout=10, max_attempts=2)
+
+    def test_claim_complete_and_results(self, queue):
+        """Claimed jobs are hidden from others and their results are kept."""
+        queue.enqueue("b1", [("echo", {"n": 1}), ("echo", {"n": 2})])
+
+        first = queue.claim("w1", now=100)
+        second = queue.claim("w2", now=100)
+        assert (first.payload, second.payload) == ({"n": 1}, {"n": 2})
+        assert queue.claim("w3", now=100) is None
+
+        assert queue.complete(first, "w1", ["a"])
+        assert not queue.is_finished("b1")
+        assert queue.complete(second, "w2", ["b"])
+        assert queue.is_finished("b1")
+        assert queue.results("b1") == [["a"], ["b"]]
+
+    def test_expired_lease_is_reclaimed(self, queue):
+        """A job comes back after its lease expires, and the old owner loses it."""
+        queue.enqueue("b1", [("echo", {})])
+        stale = queue.claim("w1", now=100)
+
+        assert queue.claim("w2", now=105) is None
+        retry = queue.claim("w2", now=111)
+        assert retry.id == stale.id and retry.attempts == 2
+
+        assert not queue.complete(stale, "w1", ["late"])
+        assert queue.complete(retry, "w2", ["ok"])
+        assert queue.results("b1") == [["ok"]]
+
+    def test_failures_retry_until_max_attempts(self, queue):
+        """Failed jobs are retried, then marked failed."""
+        queue.enqueue("b1", [("echo", {})])
+
+        queue.fail(queue.claim("w1", now=100), "w1", "boom")
+        assert queue.batch_status("b1")["pending"] == 1
+        queue.fail(queue.claim("w1", now=100), "w1", "boom")
+
+        assert queue.batch_status("b1")["failed"] == 1
+        assert queue.claim("w1", now=100) is None
+        assert queue.is_finished("b1")
+
+    def test_rollback_journal_by_default(self, tmp_path):
+        """The default journal works on shared storage; WAL is opt-in and unknown modes are rejected."""
+        def journal_mode(queue):
+            conn = sqlite3.connect(queue.db_path)
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            conn.close()
+            return mode
+
+        assert journal_mode(JobQueue(str(tmp_path / "shared.db"))) == "delete"
+        assert journal_mode(JobQueue(str(tmp_path / "local.db"), journal_mode="wal")) == "wal"
+        with pytest.raises(ValueError):
+            JobQueue(str(tmp_path / "bad.db"), journal_mode="OFF; DROP TABLE jobs")
+
+    def test_processes_never_share_a_job(self, queue):
+        """Concurrent worker processes each claim distinct jobs."""
+        queue.enqueue("b1", [("echo", {"n": n}) for n in range(60)])
+        claimed = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=claim_all, args=(queue.db_path, f"w{i}", claimed))
+            for i in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+
+        ids = [claimed.get(timeout=5) for _ in range(60)]
+        assert len(set(ids)) == 60
+        assert queue.batch_status("b1")["done"] == 60
+
+
+class TestDiscoveryWorkers:
+    """Test cases for DiscoveryWorker and DiscoveryCoordinator."""
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        return JobQueue(str(tmp_path / "jobs.db"))
+
+    def test_worker_drains_batch_and_coordinator_merges(self, queue):
+        """Results from all jobs merge into one feed, deduplicated by URL."""
+        queue.enqueue("b1", [("fake", {"url": "a", "score": 0.2}),
+                             ("fake", {"url": "a", "score": 0.9}),
+                             ("fake", {"url": "b", "score": 0.5})])
+        worker = DiscoveryWorker(queue, owner="w1")
+        worker.handlers = {"fake": lambda p: [{"url": p["url"], "underexposure_score": p["score"]}]}
+
+        assert worker.run(batch="b1", poll_interval=0) == 3
+
+        merged = DiscoveryCoordinator(queue).merge("b1")
+        assert sorted((item["url"], item["underexposure_score"]) for item in merged) == [("a", 0.9), ("b", 0.5)]
+
+    def test_handler_errors_release_the_job(self, queue):
+        """A failing handler records the error instead of losing the job."""
+        queue.enqueue("b1", [("fake", {})])
+        worker = DiscoveryWorker(queue, owner="w1")
+        worker.handlers = {"fake": lambda p: 1 / 0}
+
+        assert not worker.run_job(queue.claim("w1"))
+        assert queue.batch_status("b1")["pending"] == 1
+
+    def test_twitch_partitions_use_the_engine_scorer(self, queue, tmp_path, monkeypatch):
+        """Twitch items carry the engine's score, and the catch-all partition skips listed languages."""
+        monkeypatch.chdir(tmp_path)
+        now = time.time()
+        streams = [make_stream("en", language="en", viewer_count=2, started_at=now - 60),
+                   make_stream("fi", language="fi", viewer_count=0, started_at=now - 60),
+                   make_stream("busy", language="fi", viewer_count=50, started_at=now - 60)]
+
+        class FakeTwitch:
+            def fetch_live_streams(self, language=None, page_token=None):
+                return [s for s in streams if language in (None, s.language)], None
+
+        worker = DiscoveryWorker(queue, owner="w1")
+        worker._twitch = FakeTwitch()
+
+        items = worker._twitch_partition({"language": None, "exclude": ["en"]})
+
+        assert [item["url"] for item in items] == [streams[1].url]
+        expected = FairnessScheduler().calculate_underexposure_score(streams[1])
+        assert items[0]["underexposure_score"] == pytest.approx(expected, abs=1e-3)
+        assert [item["url"] for item in worker._twitch_partition({"language": "en"})] == [streams[0].url]
+
+    def test_local_workers_may_start_parse_processes(self, queue, monkeypatch):
+        """Coordinator-started workers are not daemonic, so their ParsePool can use processes."""
+        started = []
+
+        class FakeProcess:
+            def __init__(self, target, args=(), daemon=None):
+                self.daemon = bool(daemon)
+                self.joined = False
+                started.append(self)
+
+            def start(self):
+                pass
+
+            def terminate(self):
+                pass
+
+            def join(self):
+                self.joined = True
+
+        class FakeUI:
+            def finalize(self, items):
+                return items
+
+            def publish(self, content):
+                pass
+
+        monkeypatch.setattr(multiprocessing, "Process", FakeProcess)
+        monkeypatch.setattr(simple_web_ui, "SimpleWebUI", FakeUI)
+        coordinator = DiscoveryCoordinator(queue)
+        monkeypatch.setattr(coordinator, "plan_jobs", lambda: [])
+
+        assert coordinator.run_cycle(workers=2, timeout=0) == []
+        assert len(started) == 2
+        assert not any(process.daemon for process in started)
+        assert all(process.joined for process in started)
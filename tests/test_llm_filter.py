@@ -0,0 +1,327 @@
+"""
+Tests for LLM-based content validation.
+"""
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config import Config
+from llm_filter import HEURISTIC_VERSION, PROMPT_VERSION, LLMContentValidator, early_batch_verdicts, early_verdict
+from mock_ollama import TOKEN_CHARS, answer, serve_in_thread
+from verdict_cache import VerdictCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep the default verdict cache database out of the working tree."""
+    monkeypatch.chdir(tmp_path)
+
+
+class TestBatchValidation:
+    """Test cases for LLMContentValidator.validate_batch."""
+
+    @pytest.fixture
+    def validator(self):
+        """Validator that believes Ollama is up, with model calls recorded."""
+        validator = LLMContentValidator(use_local=False, batch_size=3)
+        validator.ollama_available = True
+        validator.prompts = []
+        return validator
+
+    @staticmethod
+    def items(n):
+        return [("gaming", f"Video {i}", "") for i in range(n)]
+
+    def answer_all(self, validator, monkeypatch):
+        """Model stub that answers every item in the prompt, matching even ids."""
+        def generate(prompt, timeout, until=None):
+            validator.prompts.append(prompt)
+            count = prompt.count("Search Query:")
+            return json.dumps({"results": [
+                {"id": i, "is_match": i % 2 == 0, "confidence": 0.8, "reason": f"item {i}"}
+                for i in reversed(range(count))
+            ]})
+        monkeypatch.setattr(validator, "_generate", generate)
+
+    def test_packs_items_into_few_calls(self, validator, monkeypatch):
+        """Seven items at batch size three take three model calls, results in order."""
+        self.answer_all(validator, monkeypatch)
+
+        results = validator.validate_batch(self.items(7))
+
+        assert len(validator.prompts) == 3
+        assert [r["is_match"] for r in results] == [True, False, True, True, False, True, True]
+        assert all(r["method"] == "llm" for r in results)
+
+    def test_truncated_answer_is_salvaged(self, validator, monkeypatch):
+        """Complete objects in a broken answer are used; the rest fall back to heuristics."""
+        truncated = '{"results": [{"id": 0, "is_match": false, "confidence": 0.9, "reason": "a"}, {"id": 1, "is_m'
+        monkeypatch.setattr(validator, "_generate", lambda prompt, timeout, until=None: truncated)
+
+        results = validator.validate_batch(self.items(3))
+
+        assert results[0] == {"is_match": False, "confidence": 0.9, "reason": "a", "method": "llm"}
+        assert [r["method"] for r in results[1:]] == ["heuristic", "heuristic"]
+
+    def test_bare_array_and_bad_entries(self):
+        """Bare arrays parse; out-of-range, duplicate and malformed entries are ignored."""
+        text = json.dumps([
+            {"id": "1", "is_match": "true", "confidence": 3},
+            {"id": 1, "is_match": False},
+            {"id": 7, "is_match": True},
+            {"is_match": True},
+        ])
+
+        verdicts = LLMContentValidator._parse_batch_response(text, 2)
+
+        assert list(verdicts) == [1]
+        assert verdicts[1]["is_match"] is True and verdicts[1]["confidence"] == 1.0
+
+    def test_model_failure_falls_back_to_heuristics(self, validator, monkeypatch):
+        def fail(prompt, timeout, until=None):
+            raise ConnectionError("down")
+        monkeypatch.setattr(validator, "_generate", fail)
+
+        results = validator.validate_batch([("gaming", "Minecraft Survival", ""), ("gaming", "Lets Play", "")])
+
+        assert [r["method"] for r in results] == ["heuristic", "heuristic"]
+        assert validator.get_stats()["tiers"]["fallback"] == 2
+
+    def test_without_ollama_uses_heuristics(self):
+        validator = LLMContentValidator(use_local=False)
+
+        results = validator.validate_batch([("tech tutorial", "Texas Tech LIVE", ""), ("gaming", "Minecraft", "")])
+
+        assert [r["is_match"] for r in results] == [False, True]
+
+
+class TestVerdictCache:
+    """Test cases for cached validation verdicts."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return VerdictCache(str(tmp_path / "verdicts.db"), ttl_seconds=100, max_entries=3)
+
+    @pytest.fixture
+    def validator(self, cache, monkeypatch):
+        """Validator on a private cache, counting the items sent to the model."""
+        validator = LLMContentValidator(use_local=False, batch_size=8, cache=cache)
+        validator.ollama_available = True
+        validator.sent = 0
+
+        def generate(prompt, timeout, until=None):
+            count = prompt.count("Search Query:")
+            validator.sent += count
+            return json.dumps({"results": [
+                {"id": i, "is_match": True, "confidence": 0.7, "reason": "ok"} for i in range(count)
+            ]})
+        monkeypatch.setattr(validator, "_generate", generate)
+        return validator
+
+    def test_only_misses_reach_the_model(self, validator):
+        items = [("gaming", f"Video {i}", "") for i in range(3)]
+        first = validator.validate_batch(items[:2])
+        second = validator.validate_batch(items)
+
+        assert validator.sent == 3
+        assert second[:2] == first
+        stats = validator.get_stats()["cache"]
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (2, 3, 0.4)
+
+    def test_key_covers_model_and_prompt_inputs(self, validator):
+        validator.validate_search_match("gaming", "Video", "")
+        validator.validate_search_match("gaming", "Video", "with description")
+        validator.model = "other-model"
+        validator.validate_search_match("gaming", "Video", "")
+
+        assert validator.sent == 3
+
+    def test_heuristic_fallbacks_are_not_cached(self, validator, cache, monkeypatch):
+        def fail(prompt, timeout, until=None):
+            raise ConnectionError("down")
+        monkeypatch.setattr(validator, "_generate", fail)
+
+        assert validator.validate_search_match("gaming", "Minecraft", "")["method"] == "heuristic"
+        assert len(cache) == 0
+
+    def test_entries_expire_after_ttl(self, cache):
+        cache.put_many({"a": {"is_match": True}}, now=1000)
+
+        assert cache.get_many(["a"], now=1050) == {"a": {"is_match": True}}
+        assert cache.get_many(["a"], now=1101) == {}
+
+    def test_size_is_bounded(self, cache):
+        for i in range(5):
+            cache.put_many({f"k{i}": {"i": i}}, now=1000 + i)
+
+        assert len(cache) == 3
+        assert set(cache.get_many([f"k{i}" for i in range(5)], now=1005)) == {"k2", "k3", "k4"}
+
+
+class TestCascade:
+    """Test cases for the heuristic -> relevance model -> LLM cascade."""
+
+    GOOD = ["python", "coding", "javascript", "rust", "compiler", "debugging", "course", "beginners"]
+    BAD = ["football", "score", "touchdown", "highlights", "stadium", "quarterback", "season", "kickoff"]
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Verdict cache holding 300 past LLM verdicts for 'tech tutorial'."""
+        cache = VerdictCache(str(tmp_path / "verdicts.db"))
+        rng = random.Random(0)
+        verdicts, inputs = {}, {}
+        for i in range(300):
+            match = i % 2 == 0
+            item = ("tech tutorial", " ".join(rng.sample(self.GOOD if match else self.BAD, 3)) + f" #{i}", "")
+            key = VerdictCache.key(*item, "llama3.2:latest", PROMPT_VERSION)
+            verdicts[key] = {"is_match": match, "confidence": 0.9, "reason": "", "method": "llm"}
+            inputs[key] = item
+        cache.put_many(verdicts, inputs=inputs)
+        return cache
+
+    @pytest.fixture
+    def validator(self, cache, monkeypatch):
+        validator = LLMContentValidator(use_local=False, model="llama3.2:latest", batch_size=8, cache=cache)
+        validator.ollama_available = True
+        validator.sent = []
+
+        def generate(prompt, timeout, until=None):
+            validator.sent.append(prompt)
+            return json.dumps({"is_match": True, "confidence": 0.6, "reason": "asked"})
+        monkeypatch.setattr(validator, "_generate", generate)
+        return validator
+
+    def test_each_tier_resolves_its_share(self, validator):
+        results = validator.validate_batch([
+            ("tech tutorial", "Texas Tech LIVE", ""),  # Heuristic mismatch
+            ("tech tutorial", "rust compiler debugging", ""),  # Confident model match
+            ("tech tutorial", "stadium kickoff highlights", ""),  # Confident model mismatch
+            ("tech tutorial", "knitting patterns", ""),  # Unknown words: ambiguous
+        ])
+
+        assert [r["method"] for r in results] == ["heuristic", "model", "model", "llm"]
+        assert [r["is_match"] for r in results] == [False, True, False, True]
+        assert len(validator.sent) == 1 and "knitting" in validator.sent[0]
+
+        stats = validator.get_stats()
+        assert stats["tiers"] == {"cache": 0, "heuristic": 1, "model": 2, "llm": 1, "fallback": 0}
+        assert stats["tier_fractions"]["model"] == 0.5
+        assert stats["relevance_model_samples"] == 300
+
+    def test_every_tier_is_cached_under_its_own_key(self, validator, cache, monkeypatch):
+        items = [("tech tutorial", "Texas Tech LIVE", ""), ("tech tutorial", "rust compiler debugging", ""),
+                 ("tech tutorial", "knitting patterns", "")]
+        first = validator.validate_batch(items)
+        second = validator.validate_batch(items)
+
+        assert second == first
+        assert validator.get_stats()["tiers"]["cache"] == 3
+        assert len(validator.sent) == 1
+        assert cache.get_first([(VerdictCache.key(*items[0], "heuristic", HEURISTIC_VERSION),)])[0]["is_match"] is False
+
+        monkeypatch.setattr("llm_filter.HEURISTIC_VERSION", "2")
+        validator.validate_batch(items[:1])
+        assert validator.get_stats()["tiers"]["heuristic"] == 2
+
+    def test_too_few_verdicts_to_train(self, tmp_path, monkeypatch):
+        validator = LLMContentValidator(use_local=False, cache=VerdictCache(str(tmp_path / "empty.db")))
+
+        assert validator.relevance_model() is None
+        assert validator.validate_search_match("tech tutorial", "rust compiler")["method"] == "heuristic"
+
+    def test_model_is_retrained_as_verdicts_accumulate(self, tmp_path, cache, monkeypatch):
+        """A long-lived validator gets a model once enough verdicts are cached, after the retrain interval."""
+        empty = VerdictCache(str(tmp_path / "growing.db"))
+        validator = LLMContentValidator(use_local=False, cache=empty)
+        assert validator.relevance_model() is None
+
+        rows = cache.training_rows()
+        empty.put_many(
+            {VerdictCache.key(q, t, d, "llm", PROMPT_VERSION): {"is_match": m, "method": "llm"} for q, t, d, m in rows},
+            inputs={VerdictCache.key(q, t, d, "llm", PROMPT_VERSION): (q, t, d) for q, t, d, _ in rows}
+        )
+        assert validator.relevance_model() is None  # Until the retrain interval has passed
+
+        monkeypatch.setitem(Config._values, "RELEVANCE_RETRAIN_INTERVAL", 0.0)
+        assert validator.relevance_model().samples == 300
+
+    def test_concurrent_first_use_trains_once(self, cache, monkeypatch):
+        validator = LLMContentValidator(use_local=False, cache=cache)
+        trainings = []
+        train = validator.train_relevance_model
+
+        def counting_train():
+            trainings.append(1)
+            time.sleep(0.05)
+            return train()
+        monkeypatch.setattr(validator, "train_relevance_model", counting_train)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            models = list(executor.map(lambda _: validator.relevance_model(), range(8)))
+
+        assert len(trainings) == 1
+        assert all(model is not None and model is models[0] for model in models)
+
+    def test_llm_verdicts_are_stored_for_training(self, validator, cache):
+        validator.validate_search_match("tech tutorial", "knitting patterns", "yarn")
+
+        assert ("tech tutorial", "knitting patterns", "yarn", True) in cache.training_rows()
+
+
+class TestStreaming:
+    """Test cases for streamed validation with early termination."""
+
+    @pytest.fixture
+    def server(self):
+        server = serve_in_thread(latency=0, token_latency=0.02)
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def validator(self, server):
+        validator = LLMContentValidator(use_local=False, base_url=server.url, use_cache=False)
+        validator.ollama_available = True
+        return validator
+
+    def test_partial_answers(self):
+        assert early_verdict('{"is_match": true, "confidence": 0.') is None
+        assert early_verdict('{"is_match": "False", "confidence": 0.85,') == {
+            "is_match": False, "confidence": 0.85, "reason": "", "method": "llm"
+        }
+        partial = '{"results": [{"id": 1, "is_match": true, "confidence": 1}, {"id": 0, "is_match": false, "conf'
+        assert list(early_batch_verdicts(partial, 2)) == [1]
+
+    def test_single_item_stops_after_confidence(self, validator, server):
+        started = time.monotonic()
+        result = validator.validate_search_match("gaming", "Minecraft Let's Play")
+        elapsed = time.monotonic() - started
+
+        assert result == {"is_match": True, "confidence": 0.7, "reason": "", "method": "llm"}
+        assert validator.early_stops == 1
+        full = len(json.dumps(answer(_single_prompt()))) / TOKEN_CHARS * 0.02
+        assert elapsed < full * 0.75
+
+    def test_batch_stops_once_every_item_is_known(self, validator, server):
+        items = [("gaming", "Minecraft", ""), ("cooking", "Bread", "")]
+
+        results = validator._llm_validate_batch(items)
+
+        assert [r["is_match"] for r in results] == [True, True]
+        assert all(r["method"] == "llm" for r in results)
+        assert validator.early_stops == 1
+
+    def test_streaming_can_be_disabled(self, validator, monkeypatch):
+        monkeypatch.setitem(Config._values, "LLM_STREAMING", False)
+
+        result = validator.validate_search_match("gaming", "Minecraft Let's Play")
+
+        assert result["reason"] == "No obvious mismatches detected"
+        assert validator.early_stops == 0
+
+
+def _single_prompt():
+    return 'Search Query: "gaming"\nContent Title: "Minecraft Let\'s Play"\nDescription: ""'
@@ -0,0 +1,97 @@
+"""
+Tests for the shared Ollama health monitor.
+"""
+import socket
+import time
+
+import pytest
+
+from llm_filter import LLMContentValidator
+from mock_ollama import serve_in_thread
+from ollama_health import OllamaHealthMonitor, get_health_monitor
+
+
+@pytest.fixture
+def server():
+    server = serve_in_thread(latency=0)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def dead_url():
+    """URL of a local port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+class TestOllamaHealthMonitor:
+    """Test cases for OllamaHealthMonitor."""
+
+    def test_probe_caches_availability_and_models(self, server):
+        monitor = OllamaHealthMonitor(server.url, interval=30)
+
+        assert monitor.available is False  # Unknown until the first probe
+        assert monitor.probe_now() is True
+        assert monitor.has_model("llama3.2:latest")
+        assert 29 < monitor.status()["next_probe_in"] <= 30
+
+    def test_failures_back_off_exponentially(self, dead_url):
+        monitor = OllamaHealthMonitor(dead_url, interval=30, max_backoff=5, probe_timeout=0.5)
+
+        delays = []
+        for _ in range(5):
+            assert monitor.probe_now() is False
+            delays.append(monitor.backoff())
+
+        assert delays == [1, 2, 4, 5, 5]
+        assert "probe failed" in monitor.status()["last_error"]
+
+    def test_failed_call_trips_until_next_good_probe(self, server):
+        monitor = OllamaHealthMonitor(server.url, interval=30)
+        monitor.probe_now()
+
+        monitor.mark_failed(ConnectionError("reset"))
+        assert monitor.available is False
+
+        assert monitor.probe_now() is True
+        assert monitor.failures == 0
+
+    def test_background_thread_probes_without_blocking(self, server):
+        started = time.monotonic()
+        monitor = get_health_monitor(server.url)
+        assert time.monotonic() - started < 0.1
+
+        assert monitor.wait_ready(5) and monitor.available
+        assert get_health_monitor(server.url + "/") is monitor
+        monitor.stop()
+
+
+class TestValidatorHealth:
+    """Validators follow the shared monitor."""
+
+    def test_connection_error_switches_to_heuristics(self, server, monkeypatch):
+        validator = LLMContentValidator(base_url=server.url, use_cache=False)
+        validator.health.wait_ready(5)
+        assert validator.ollama_available
+
+        def refuse(prompt, timeout, until=None):
+            raise ConnectionError("refused")
+        monkeypatch.setattr(validator, "_generate", refuse)
+
+        validator.validate_search_match("gaming", "Minecraft")
+        assert not validator.ollama_available
+
+        validator.health.probe_now()
+        assert validator.ollama_available
+
+    def test_unparseable_answer_does_not_trip(self, server, monkeypatch):
+        validator = LLMContentValidator(base_url=server.url, use_cache=False)
+        validator.health.wait_ready(5)
+        monkeypatch.setattr(validator, "_generate", lambda prompt, timeout, until=None: "not json")
+
+        assert validator.validate_search_match("gaming", "Minecraft")["method"] == "heuristic"
+        assert validator.ollama_available
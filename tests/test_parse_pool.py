@@ -0,0 +1,57 @@
+"""
+Tests for the parse process pool.
+"""
+from pathlib import Path
+
+import pytest
+
+from parse_pool import ParsePool
+from reverse_discovery import GOOGLE_PAGE, YOUTUBE_PAGE, ReverseSearchDiscovery, parse_page
+from tests.test_reverse_discovery import FakeGoogle
+
+DATA = Path(__file__).parent / "test_data"
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    pool = ParsePool(processes=2)
+    yield pool
+    pool.close()
+
+
+class TestParsePool:
+    """Test cases for ParsePool."""
+
+    def test_inline_pool_returns_finished_futures(self):
+        pool = ParsePool(processes=1)
+
+        future = pool.submit(parse_page, GOOGLE_PAGE, (DATA / "google_serp.html").read_bytes(), 2)
+
+        assert future.done() and len(future.result()) == 10
+        assert future.result()[0].rank == 11
+        assert pool.get_stats() == {"processes": 1, "submitted": 1, "inline": 1}
+
+    def test_inline_errors_surface_on_result(self):
+        future = ParsePool(processes=1).submit(parse_page, "unknown", b"")
+
+        with pytest.raises(ValueError):
+            future.result()
+
+    def test_worker_processes_match_inline(self, process_pool):
+        pages = [(GOOGLE_PAGE, (DATA / "google_serp.html").read_bytes()),
+                 (YOUTUBE_PAGE, (DATA / "youtube_results.html").read_bytes())]
+
+        futures = [process_pool.submit(parse_page, kind, body, 1) for kind, body in pages]
+
+        for (kind, body), future in zip(pages, futures):
+            parsed = [(r.url, r.title, r.rank) for r in future.result(timeout=60)]
+            assert parsed == [(r.url, r.title, r.rank) for r in parse_page(kind, body, 1)]
+        assert process_pool.inline == 0
+
+    def test_reverse_search_on_processes(self, process_pool, monkeypatch):
+        discovery = ReverseSearchDiscovery(max_retries=0, delay_range=(0, 0), parse_pool=process_pool)
+        monkeypatch.setattr(discovery, "_make_request", FakeGoogle(37))
+
+        results = discovery.reverse_search_google("indie game", max_pages=3)
+
+        assert [r.url for r in results] == [f"https://example.com/{page}" for page in (37, 36, 35)]
@@ -0,0 +1,96 @@
+"""
+Tests for the Aho-Corasick pattern matcher and the filters built on it.
+"""
+import random
+
+import pytest
+
+from llm_filter import HeuristicRules, MISMATCHES
+from pattern_matcher import PatternMatcher
+from reverse_discovery import ContentFilter, SearchResult
+
+
+class TestPatternMatcher:
+    """Test cases for PatternMatcher."""
+
+    @pytest.fixture(params=["scan", "regex"])
+    def mode(self, request, monkeypatch):
+        """Run a test with per-pattern checks and with the compiled expression."""
+        if request.param == "regex":
+            monkeypatch.setattr(PatternMatcher, "SCAN_MAX_PATTERNS", 0)
+        return request.param
+
+    def test_overlapping_and_nested_matches(self, mode):
+        matcher = PatternMatcher(["he", "she", "his", "hers"])
+
+        assert matcher.uses_regex == (mode == "regex")
+        assert list(matcher.iter_matches("ushers")) == [(4, "she"), (4, "he"), (6, "hers")]
+        assert matcher.matches("ushers") == {"she", "he", "hers"}
+        assert matcher.search("ahishers") and not matcher.search("xyz")
+
+    def test_agrees_with_substring_checks(self, mode):
+        rng = random.Random(7)
+        for _ in range(500):
+            patterns = {"".join(rng.choice("ab.") for _ in range(rng.randint(1, 4))) for _ in range(6)}
+            text = "".join(rng.choice("ab.") for _ in range(rng.randint(0, 25)))
+            matcher = PatternMatcher(patterns)
+
+            assert matcher.matches(text) == {p for p in patterns if p in text}
+            assert matcher.search(text) == any(p in text for p in patterns)
+            assert sorted(matcher.iter_matches(text)) == sorted(
+                (start + len(p), p) for p in patterns for start in range(len(text)) if text.startswith(p, start)
+            )
+
+    def test_large_lists_use_one_expression(self):
+        patterns = [f"phrase {i}" for i in range(200)]
+        matcher = PatternMatcher(patterns)
+
+        assert matcher.uses_regex
+        assert matcher.matches("a phrase 42 and phrase 7") == {"phrase 4", "phrase 42", "phrase 7"}
+
+    def test_patterns_are_lowercased_and_recompiled_after_add(self, mode):
+        matcher = PatternMatcher(["Live Stream"])
+        assert matcher.matches_batch(["a live stream", "casino"]) == [{"live stream"}, set()]
+
+        matcher.add("casino")
+        assert matcher.matches("casino night") == {"casino"}
+        assert len(matcher) == 2 and "CASINO" in matcher
+
+    def test_empty_pattern_is_rejected(self):
+        with pytest.raises(ValueError):
+            PatternMatcher([""])
+
+
+class TestCompiledFilters:
+    """Rules compiled into matchers keep their original precedence."""
+
+    def test_first_rule_in_declaration_order_wins(self):
+        rules = HeuristicRules(MISMATCHES)
+
+        verdict = rules.validate("gaming tech", "Casino night at Texas Tech", "")
+
+        assert verdict["reason"] == "'texas tech' detected - likely mismatch for 'tech' search"
+
+    def test_extra_mismatch_rules(self):
+        rules = HeuristicRules({**MISMATCHES, "cooking": ["mukbang"]})
+
+        verdicts = rules.validate_batch([("cooking", "MUKBANG marathon", None), ("cooking", "Bread", "")])
+
+        assert [v["is_match"] for v in verdicts] == [False, True]
+
+    def test_live_coding_exception(self):
+        rules = HeuristicRules(MISMATCHES)
+
+        assert rules.validate("how to code", "Live coding session", "live event")["is_match"] is True
+        assert rules.validate("how to code", "Coding session", "live event")["is_match"] is False
+
+    def test_spam_keywords(self):
+        content_filter = ContentFilter()
+        results = [
+            SearchResult(title="You WON a prize", url="https://a.example", snippet="", source="t"),
+            SearchResult(title="Garden diary", url="https://b.example", snippet="tomatoes", source="t"),
+        ]
+        assert content_filter.spam_flags(results) == [True, False]
+
+        content_filter.spam_keywords.add("tomatoes")
+        assert content_filter.is_spam(results[1])
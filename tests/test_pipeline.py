@@ -0,0 +1,72 @@
+"""
+Tests for the staged streaming pipeline.
+"""
+import asyncio
+import time
+
+from pipeline import Pipeline, Stage
+
+
+class TestPipeline:
+    """Test cases for Pipeline."""
+
+    def test_fan_out_filter_and_collect(self):
+        """Stages can fan out, drop items, and the last stage's outputs are returned."""
+        pipeline = Pipeline([
+            Stage("split", lambda n: range(n), workers=2),
+            Stage("odd", lambda n: [n] if n % 2 else []),
+            Stage("square", lambda n: [n * n], workers=3, blocking=True),
+        ])
+
+        results = asyncio.run(pipeline.run([3, 4, 5]))
+
+        assert sorted(results) == [1, 1, 1, 9, 9]
+        stats = pipeline.get_stats()
+        assert stats["split"]["processed"] == 3
+        assert stats["split"]["emitted"] == 12
+        assert stats["square"]["processed"] == 5
+
+    def test_backpressure_bounds_queue_depth(self):
+        """A slow stage never lets its inbound queue grow past its size."""
+        def slow(item):
+            time.sleep(0.002)
+            return [item]
+
+        pipeline = Pipeline([
+            Stage("produce", lambda n: range(n)),
+            Stage("slow", slow, queue_size=2, blocking=True),
+        ])
+
+        results = asyncio.run(pipeline.run([50]))
+
+        assert len(results) == 50
+        assert pipeline.get_stats()["slow"]["max_queue_depth"] <= 2
+
+    def test_handler_errors_are_counted(self):
+        """A failing item is counted and does not stop the stage."""
+        pipeline = Pipeline([Stage("invert", lambda n: [1 / n])])
+
+        results = asyncio.run(pipeline.run([1, 0, 2]))
+
+        assert results == [1.0, 0.5]
+        assert pipeline.get_stats()["invert"]["errors"] == 1
+
+    def test_timeout_returns_partial_results(self):
+        """At the timeout every stage is cancelled and earlier outputs are kept."""
+        def pages(n):
+            for page in range(n):
+                if page:
+                    time.sleep(0.5)
+                yield page
+
+        pipeline = Pipeline([
+            Stage("fetch", pages, blocking=True),
+            Stage("collect", lambda page: [page]),
+        ])
+
+        started = time.perf_counter()
+        results = asyncio.run(pipeline.run([10], timeout=0.2))
+
+        assert results == [0]
+        assert pipeline.timed_out
+        assert time.perf_counter() - started < 1.0
@@ -0,0 +1,100 @@
+"""
+Tests for per-host pacing and crawl budgets.
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from politeness import CrawlBudget, HostScheduler
+from reverse_discovery import ReverseSearchDiscovery
+
+
+class TestHostScheduler:
+    """Test cases for HostScheduler."""
+
+    def test_same_host_requests_are_spaced(self):
+        scheduler = HostScheduler(min_interval=0.05, jitter=0)
+        stamps = []
+
+        def fetch():
+            scheduler.wait("https://www.google.com/search?q=a")
+            stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=fetch) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stamps.sort()
+        assert all(b - a >= 0.045 for a, b in zip(stamps, stamps[1:]))
+
+    def test_hosts_are_paced_independently(self):
+        scheduler = HostScheduler(min_interval=10, jitter=0)
+
+        assert scheduler.reserve("https://www.google.com/search") == 0
+        assert scheduler.reserve("https://WWW.YouTube.com/results") == 0
+        assert 9.9 < scheduler.reserve("https://www.google.com/search?start=10") <= 10
+        stats = scheduler.get_stats()
+        assert stats["hosts"] == 2 and 9.9 < stats["waited_seconds"] <= 10
+
+    def test_from_range(self):
+        scheduler = HostScheduler.from_range((1.0, 3.0))
+
+        assert (scheduler.min_interval, scheduler.jitter) == (1.0, 2.0)
+
+
+class TestCrawlBudget:
+    """Test cases for CrawlBudget."""
+
+    def test_limit_per_key(self):
+        budget = CrawlBudget(limit=2)
+
+        assert [budget.take("a") for _ in range(3)] == [True, True, False]
+        assert budget.take("b") and budget.remaining("b") == 1
+
+    def test_zero_is_unlimited(self):
+        budget = CrawlBudget(limit=0)
+
+        assert all(budget.take("a") for _ in range(100))
+        assert budget.remaining("a") is None
+
+
+class TestConcurrentDiscovery:
+    """ReverseSearchDiscovery crawls hosts concurrently within their budgets."""
+
+    @pytest.fixture
+    def fake_get(self, monkeypatch):
+        calls = []
+
+        def get(self, url, params=None, timeout=None):
+            calls.append((url, params.get('q') or params.get('search_query')))
+            return SimpleNamespace(text="", raise_for_status=lambda: None)
+
+        requests = pytest.importorskip("requests")
+        monkeypatch.setattr(requests.Session, "get", get)
+        return calls
+
+    def test_budget_caps_requests_per_query(self, fake_get):
+        discovery = ReverseSearchDiscovery(max_retries=0, delay_range=(0, 0), budget=CrawlBudget(limit=1))
+
+        discovery.reverse_search_youtube_live("indie game", max_pages=3)
+        discovery.reverse_search_youtube_live("pixel art", max_pages=3)
+
+        assert [query for _, query in fake_get] == ["indie game", "pixel art"]
+        assert discovery.budget.remaining("indie game") == 0
+
+    def test_platforms_overlap_instead_of_queueing(self, fake_get):
+        scheduler = HostScheduler(min_interval=0.1, jitter=0)
+        discovery = ReverseSearchDiscovery(max_retries=0, scheduler=scheduler, budget=CrawlBudget(limit=3),
+                                           workers=4)
+
+        started = time.monotonic()
+        discovery.discover_underexposed_content(["a", "b"], platforms=["youtube_live", "google"])
+        elapsed = time.monotonic() - started
+
+        # Sequentially the slots would take at least scheduler.waited seconds
+        assert len(fake_get) >= 4
+        assert elapsed < scheduler.waited
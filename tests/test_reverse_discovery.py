@@ -0,0 +1,105 @@
+"""
+Tests for reverse discovery.
+"""
+import math
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import reverse_discovery
+from discovery_budget import Deadline
+from reverse_discovery import ReverseSearchDiscovery
+
+
+class FakeGoogle:
+    """Stands in for Google: pages 1..last have results, later pages do not."""
+
+    def __init__(self, last, fail_on=()):
+        self.last = last
+        self.fail_on = set(fail_on)
+        self.requested = []
+
+    def __call__(self, url, params=None, budget_key=None):
+        page = params['start'] // 10 + 1
+        self.requested.append(page)
+        if page in self.fail_on:
+            return None
+        if page > self.last:
+            return SimpleNamespace(text="Your search did not match any documents.")
+        links = f'<a href="/search?q=x&start={page * 10}">Next</a>' if page < self.last else ''
+        result = f'<h3><a href="https://example.com/{page}">Result {page}</a></h3><span>Snippet {page}</span>'
+        return SimpleNamespace(text=result + links)
+
+
+@pytest.fixture
+def discovery():
+    return ReverseSearchDiscovery(max_retries=0, delay_range=(0, 0))
+
+
+class TestFindLastPage:
+    """Test cases for ReverseSearchDiscovery.find_last_page_google."""
+
+    @pytest.mark.parametrize("last", [1, 2, 3, 7, 64, 100, 137, 999, 1000])
+    def test_finds_exact_tail_in_log_requests(self, discovery, monkeypatch, last):
+        google = FakeGoogle(last)
+        monkeypatch.setattr(discovery, "_make_request", google)
+
+        assert discovery.find_last_page_google("indie game") == last
+        assert len(google.requested) <= 2 * math.ceil(math.log2(last + 1)) + 2
+
+    def test_no_next_link_ends_the_search(self, discovery, monkeypatch):
+        google = FakeGoogle(4)
+        monkeypatch.setattr(discovery, "_make_request", google)
+
+        discovery.find_last_page_google("indie game")
+
+        assert google.requested == [1, 2, 4]
+
+    def test_cached_per_query_and_site(self, discovery, monkeypatch):
+        google = FakeGoogle(37)
+        monkeypatch.setattr(discovery, "_make_request", google)
+        discovery.find_last_page_google("indie game")
+        requests_made = len(google.requested)
+
+        other = ReverseSearchDiscovery(max_retries=0, delay_range=(0, 0))
+        monkeypatch.setattr(other, "_make_request", google)
+
+        assert other.find_last_page_google("indie game") == 37
+        assert len(google.requested) == requests_made
+        other.find_last_page_google("indie game", site="example.com")
+        assert len(google.requested) > requests_made
+
+    def test_failed_request_returns_lower_bound_uncached(self, discovery, monkeypatch):
+        google = FakeGoogle(100, fail_on={64})
+        monkeypatch.setattr(discovery, "_make_request", google)
+
+        assert discovery.find_last_page_google("indie game") == 32
+        assert reverse_discovery._last_page_cache == {}
+
+    def test_reverse_search_starts_at_the_tail(self, discovery, monkeypatch):
+        google = FakeGoogle(37)
+        monkeypatch.setattr(discovery, "_make_request", google)
+
+        results = discovery.reverse_search_google("indie game", max_pages=3)
+
+        assert [r.url for r in results] == [f"https://example.com/{page}" for page in (37, 36, 35)]
+        assert google.requested.count(37) == 1  # The probed last page is reused
+
+    def test_requests_are_bounded_by_the_deadline(self, monkeypatch):
+        requests = pytest.importorskip("requests")
+        timeouts = []
+
+        def get(self, url, params=None, timeout=None):
+            timeouts.append(timeout)
+            return SimpleNamespace(text="", raise_for_status=lambda: None)
+        monkeypatch.setattr(requests.Session, "get", get)
+
+        bounded = ReverseSearchDiscovery(max_retries=0, delay_range=(0, 0), deadline=Deadline(0.5))
+        assert bounded._make_request("https://www.google.com/search", {"q": "x"})
+        assert timeouts[0] <= 0.5
+
+        expired = ReverseSearchDiscovery(max_retries=0, delay_range=(0, 0), deadline=Deadline(0.001))
+        time.sleep(0.01)
+        assert expired._make_request("https://www.google.com/search", {"q": "x"}) is None
+        assert len(timeouts) == 1
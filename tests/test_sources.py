@@ -0,0 +1,82 @@
+"""
+Tests for the discovery source registry.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from sources import SourceRegistry, SourceSpec
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class Client:
+    """Stand-in client class loaded through a "module:attribute" target."""
+    instances = 0
+
+    def __init__(self):
+        Client.instances += 1
+
+
+class TestSourceRegistry:
+    """Test cases for SourceRegistry."""
+
+    @pytest.fixture
+    def registry(self):
+        """Registry with one enabled and one disabled source."""
+        Client.instances = 0
+        return SourceRegistry([
+            SourceSpec(name="on", target=f"{__name__}:Client"),
+            SourceSpec(name="off", target=f"{__name__}:Client", enabled=lambda: False),
+        ], load_entry_points=False)
+
+    def test_clients_are_built_on_first_use(self, registry):
+        """Nothing is constructed until a client is asked for, then only once."""
+        assert registry.loaded_names() == []
+        assert registry.is_enabled("on")
+
+        client = registry.get("on")
+        assert isinstance(client, Client)
+        assert registry.get("on") is client
+        assert Client.instances == 1
+        assert registry.loaded_names() == ["on"]
+
+    def test_disabled_sources_are_never_built(self, registry):
+        """A disabled source is skipped without importing its module."""
+        assert registry.enabled_names() == ["on"]
+        assert registry.get("off") is None
+        assert [name for name, _, _ in registry.clients()] == ["on"]
+        assert Client.instances == 1
+
+    def test_set_overrides_and_disables(self, registry):
+        """An injected client replaces the spec; None switches the source off."""
+        injected = object()
+        registry.set("off", injected)
+        assert registry.get("off") is injected
+
+        registry.set("on", None)
+        assert not registry.is_enabled("on")
+        assert [name for name, _, _ in registry.clients()] == ["off"]
+
+    def test_broken_target_disables_source(self, registry):
+        """A source whose module cannot be imported is logged and skipped."""
+        registry.register(SourceSpec(name="broken", target="no_such_module:Client"))
+
+        assert registry.get("broken") is None
+        assert "broken" not in [name for name, _, _ in registry.clients()]
+
+
+def test_engine_import_is_lazy():
+    """Importing the engine does not pull in clients, requests or numpy."""
+    heavy = ["youtube_client", "twitch_client", "requests", "numpy"]
+    code = (
+        "import sys, exposure_engine; "
+        f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == ""
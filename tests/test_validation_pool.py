@@ -0,0 +1,132 @@
+"""
+Tests for the bounded validation pool and the mock Ollama server.
+"""
+import threading
+import time
+
+import pytest
+
+from llm_filter import LLMContentValidator
+from mock_ollama import serve_in_thread
+from validation_pool import ValidationPool
+
+
+class SlowValidator:
+    """validate_batch stand-in that sleeps and records how many calls overlap."""
+
+    batch_size = 2
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def validate_batch(self, items, timeout=None):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return [{"is_match": True, "confidence": 0.8, "reason": title, "method": "llm"}
+                for _, title, _ in items]
+
+    def heuristic_validate_batch(self, items):
+        return [{"is_match": True, "confidence": 0.7, "reason": title, "method": "heuristic"}
+                for _, title, _ in items]
+
+
+class TestValidationPool:
+    """Test cases for ValidationPool."""
+
+    @staticmethod
+    def items(n):
+        return [("gaming", f"Video {i}", "") for i in range(n)]
+
+    def test_concurrency_is_bounded(self):
+        validator = SlowValidator()
+        with ValidationPool(validator, concurrency=2, call_timeout=5, budget_seconds=0) as pool:
+            futures = [pool.submit(self.items(4)), pool.submit(self.items(4))]
+            results = [future.result(timeout=5) for future in futures]
+
+        assert validator.max_active == 2
+        assert [r["reason"] for r in results[0]] == [f"Video {i}" for i in range(4)]
+        assert pool.get_stats()["calls"] == 4
+
+    def test_slow_call_falls_back_at_its_deadline(self):
+        validator = SlowValidator(delay=1.0)
+        with ValidationPool(validator, concurrency=1, call_timeout=0.05, budget_seconds=0) as pool:
+            started = time.monotonic()
+            results = pool.submit(self.items(2)).result(timeout=5)
+
+        assert time.monotonic() - started < 0.5
+        assert [r["method"] for r in results] == ["heuristic", "heuristic"]
+        assert pool.get_stats()["timed_out"] == 2
+
+    def test_work_after_the_budget_gets_heuristics(self):
+        validator = SlowValidator(delay=0.2)
+        with ValidationPool(validator, concurrency=1, call_timeout=5, budget_seconds=0.1) as pool:
+            results = pool.submit(self.items(6)).result(timeout=5)
+
+        stats = pool.get_stats()
+        assert all(r["method"] == "heuristic" for r in results)
+        assert stats["timed_out"] + stats["over_budget"] == 6
+        assert stats["over_budget"] >= 2
+
+    def test_empty_submit(self):
+        with ValidationPool(SlowValidator(), concurrency=1) as pool:
+            assert pool.submit([]).result() == []
+
+
+class TestMockOllama:
+    """The pool against the mock server, end to end over HTTP."""
+
+    @pytest.fixture
+    def server(self):
+        server = serve_in_thread(latency=0.05)
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    def test_batched_verdicts_over_http(self, server):
+        validator = LLMContentValidator(base_url=server.url, batch_size=2, use_cache=False)
+        assert validator.health.wait_ready(5) and validator.ollama_available
+
+        items = [("gaming", "Casino Gambling Tips", ""), ("gaming", "Minecraft Let's Play", ""),
+                 ("cooking", "Sourdough basics", ""), ("music", "Piano practice", "")]
+        with ValidationPool(validator, concurrency=2, call_timeout=5, budget_seconds=0) as pool:
+            results = pool.submit(items).result(timeout=5)
+
+        # The clear mismatch is settled by the heuristics, the rest go to the model
+        assert [r["is_match"] for r in results] == [False, True, True, True]
+        assert [r["method"] for r in results] == ["heuristic", "llm", "llm", "llm"]
+        assert server.requests == 2
+
+    def test_timed_out_calls_free_their_worker(self):
+        """The pool's deadline bounds the HTTP request, so the worker thread is not left wedged."""
+        server = serve_in_thread(latency=2.0)
+        try:
+            validator = LLMContentValidator(base_url=server.url, batch_size=2, use_cache=False)
+            assert validator.health.wait_ready(5)
+            items = [("gaming", "Minecraft Let's Play", ""), ("music", "Piano practice", "")]
+            with ValidationPool(validator, concurrency=1, call_timeout=0.2, budget_seconds=0) as pool:
+                started = time.monotonic()
+                results = pool.submit(items).result(timeout=5)
+                idle = pool._executor.submit(time.monotonic).result(timeout=5)
+
+            assert [r["method"] for r in results] == ["heuristic", "heuristic"]
+            assert idle - started < 1.0
+            assert validator.ollama_available  # Our own deadline is not a server failure
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_single_prompt(self, server):
+        validator = LLMContentValidator(base_url=server.url, use_cache=False)
+        validator.health.wait_ready(5)
+
+        result = validator.validate_search_match("gaming", "Minecraft Let's Play")
+
+        assert result["method"] == "llm" and result["is_match"] is True
+        assert server.requests == 1
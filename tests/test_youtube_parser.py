@@ -0,0 +1,126 @@
+"""
+Tests for the ytInitialData based YouTube parser.
+"""
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from reverse_discovery import ReverseSearchDiscovery, SearchResult
+from youtube_parser import (
+    continuation_request, count_from_text, extract_json, parse_results_page, parse_tree
+)
+
+DATA = Path(__file__).parent / "test_data"
+
+
+@pytest.fixture
+def results_html():
+    return (DATA / "youtube_results.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def continuation_data():
+    return json.loads((DATA / "youtube_continuation.json").read_text())
+
+
+class TestParseResultsPage:
+    """Test cases for parse_results_page and parse_tree."""
+
+    def test_video_renderers_only(self, results_html):
+        page = parse_results_page(results_html)
+
+        # Channel and shorts renderers are skipped; shelves are searched
+        assert [video.video_id for video in page.videos] == [
+            "aaaaaaaaaa1", "aaaaaaaaaa2", "aaaaaaaaaa3", "aaaaaaaaaa4", "aaaaaaaaaa5"]
+
+    def test_fields(self, results_html):
+        video = parse_results_page(results_html).videos[1]
+
+        assert video.title == 'Making a roguelike in Godot {day 40} "live"'
+        assert (video.channel, video.channel_id) == ("Tiny Rogue", "UCtiny")
+        assert video.is_live and video.view_count == 1204
+        assert video.url == "https://www.youtube.com/watch?v=aaaaaaaaaa2"
+
+    def test_continuation_and_client_config(self, results_html):
+        page = parse_results_page(results_html)
+
+        request = continuation_request(page)
+
+        assert request["params"] == {"key": "AIzaSyTestKey000"}
+        assert request["payload"]["continuation"] == page.continuation
+        assert request["payload"]["context"]["client"]["clientVersion"] == "2.20241017.01.00"
+
+    def test_continuation_response(self, continuation_data):
+        page = parse_tree(continuation_data)
+
+        assert [video.video_id for video in page.videos] == ["bbbbbbbbbb1", "aaaaaaaaaa5"]
+        assert page.continuation == "EpMDEgxpbmRpZSBwYWdlMw=="
+
+    def test_page_without_data(self):
+        page = parse_results_page("<html><body>Consent required</body></html>")
+
+        assert page.videos == [] and continuation_request(page) is None
+
+
+class TestHelpers:
+    """Test cases for the JSON and text helpers."""
+
+    def test_extract_json_skips_non_json_occurrences(self):
+        text = 'a = "x = nope"; x = {"b": "}"} tail {'
+
+        assert extract_json(text, "x = ") == {"b": "}"}
+        assert extract_json(text, "y = ") is None
+
+    @pytest.mark.parametrize("text, count", [
+        ("1,234 views", 1234), ("12 watching", 12), ("1 204 visningar", 1204),
+        ("2.1K views", 2100), ("1.2M watching", 1200000), ("15K views", 15000), ("3,4 k vues", 3400),
+        ("1,5k vues", 1500), ("3.4万 回視聴", None), ("No views", None),
+    ])
+    def test_count_from_text(self, text, count):
+        assert count_from_text(text) == count
+
+
+class TestReverseSearchYouTube:
+    """ReverseSearchDiscovery follows continuations instead of refetching HTML."""
+
+    def test_follows_continuations_deepest_first(self, results_html, continuation_data, monkeypatch):
+        discovery = ReverseSearchDiscovery(max_retries=0, delay_range=(0, 0))
+        calls = []
+
+        def fake_request(url, params=None, budget_key=None, payload=None):
+            calls.append((url, payload))
+            if payload is None:
+                return SimpleNamespace(text=results_html)
+            return SimpleNamespace(content=json.dumps(continuation_data).encode())
+        monkeypatch.setattr(discovery, "_make_request", fake_request)
+
+        results = discovery.reverse_search_youtube_live("indie games", max_pages=3)
+
+        assert [url for url, _ in calls] == [
+            "https://www.youtube.com/results",
+            "https://www.youtube.com/youtubei/v1/search",
+            "https://www.youtube.com/youtubei/v1/search",
+        ]
+        assert calls[2][1]["continuation"] == "EpMDEgxpbmRpZSBwYWdlMw=="
+        assert len(results) == 6  # Repeated videos are listed once
+        assert results[0].url.endswith("bbbbbbbbbb1") and results[0].rank == 6
+        first = results[1]  # The shell page follows, in its own order
+        assert first.rank == 1 and first.channel == "Moss Garden Dev"
+        assert first.view_count == 37 and first.is_live
+
+    def test_abbreviated_counts_are_filtered(self, monkeypatch):
+        """Popular videos with abbreviated counts do not pass as underexposed."""
+        discovery = ReverseSearchDiscovery(max_retries=0, delay_range=(0, 0))
+        results = [
+            SearchResult("Big", "https://a", "", "youtube_live", view_count=count_from_text("1.2M watching")),
+            SearchResult("Snippet", "https://b", "Live now - 15K views", "google"),
+            SearchResult("Small", "https://c", "37 views", "google"),
+        ]
+        monkeypatch.setattr(discovery, "reverse_search_google", lambda query, max_pages: results[1:])
+        monkeypatch.setattr(discovery, "reverse_search_youtube_live", lambda query, max_pages: results[:1])
+
+        kept = discovery.discover_underexposed_content(["indie games"])
+
+        assert [result.title for result in kept] == ["Small"]
@@ -81,26 +81,28 @@ class TwitchDiscovery(BaseDiscoveryClient):
             logger.warning(f"Error fetching game info: {e}")
             return {}
     
-    def fetch_live_streams(
+    def fetch_raw_page(
         self,
         game_id: str = None,
         user_login: str = None,
         language: str = None,
         page_token: str = None,
+        deadline=None,
         **kwargs
-    ) -> Tuple[List[Stream], Optional[str]]:
+    ) -> Tuple[List[Dict], Optional[str]]:
         """
-        Fetch currently live streams from Twitch.
+        Fetch one page of raw stream items from Twitch.
         
         Args:
             game_id: Filter by game ID
             user_login: Filter by broadcaster login name
             language: Filter by language code (e.g., 'en', 'es')
             page_token: Cursor for pagination
+            deadline: Optional Deadline bounding the request
             **kwargs: Additional parameters for the API
             
         Returns:
-            Tuple of (list of Stream objects, next page cursor)
+            Tuple of (list of raw API items, next page cursor)
         """
         if not all([self.client_id, self.oauth_token]):
             logger.warning("Twitch credentials not configured")
@@ -120,20 +122,52 @@ class TwitchDiscovery(BaseDiscoveryClient):
         if page_token:
             params['after'] = page_token
         
+        data = self._make_request(
+            f"{self.BASE_URL}/streams",
+            params=params,
+            headers=self._headers,
+            deadline=deadline
+        )
+        return data.get('data', []), data.get('pagination', {}).get('cursor')
+    
+    def decode_items(self, items: List[Dict]) -> List[Stream]:
+        """Convert raw Twitch stream items into Stream objects."""
+        streams = []
+        for item in items:
+            if stream := self._process_stream(item):
+                streams.append(stream)
+        return streams
+    
+    def fetch_live_streams(
+        self,
+        game_id: str = None,
+        user_login: str = None,
+        language: str = None,
+        page_token: str = None,
+        **kwargs
+    ) -> Tuple[List[Stream], Optional[str]]:
+        """
+        Fetch currently live streams from Twitch.
+        
+        Args:
+            game_id: Filter by game ID
+            user_login: Filter by broadcaster login name
+            language: Filter by language code (e.g., 'en', 'es')
+            page_token: Cursor for pagination
+            **kwargs: Additional parameters for the API
+            
+        Returns:
+            Tuple of (list of Stream objects, next page cursor)
+        """
         try:
-            # First, get the streams
-            data = self._make_request(
-                f"{self.BASE_URL}/streams",
-                params=params,
-                headers=self._headers
+            items, next_cursor = self.fetch_raw_page(
+                game_id=game_id,
+                user_login=user_login,
+                language=language,
+                page_token=page_token,
+                **kwargs
             )
-            
-            streams = []
-            for item in data.get('data', []):
-                if stream := self._process_stream(item):
-                    streams.append(stream)
-            
-            return streams, data.get('pagination', {}).get('cursor')
+            return self.decode_items(items), next_cursor
             
         except Exception as e:
             logger.error(f"Error fetching Twitch live streams: {e}")
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Validation Pool - Bounded concurrent content validation.
+Discovery hands each search term's candidates to the pool and moves on to
+the next term, so fetching and validation overlap. At most ``concurrency``
+model calls are in flight; each call has its own deadline and the pool as
+a whole can be given a time budget. The deadline is passed down as the
+call's HTTP timeout, so a timed-out call frees its worker thread instead of
+holding a slot. Items whose call times out, or that are reached after the
+budget ran out, get heuristic verdicts instead.
+
+Usage (offline throughput benchmark against mock_ollama):
+    python validation_pool.py --items 256 --concurrency 4 --latency 0.5
+"""
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from config import config
+from discovery_budget import Deadline
+
+
+class ValidationPool:
+    """
+    Runs ``validator.validate_batch`` calls on a private event loop.
+
+    Work is split into chunks of the validator's batch size; a semaphore
+    bounds how many chunks are being validated at once. ``submit`` can be
+    called from any thread and returns a ``concurrent.futures.Future``.
+    """
+
+    def __init__(self, validator, concurrency: Optional[int] = None, call_timeout: Optional[float] = None,
+                 budget_seconds: Optional[float] = None):
+        """
+        Args:
+            validator: LLMContentValidator (anything with validate_batch
+                taking a ``timeout``, heuristic_validate_batch and batch_size)
+            concurrency: Chunks validated at once (defaults to LLM_CONCURRENCY)
+            call_timeout: Deadline per chunk in seconds (defaults to LLM_TIMEOUT)
+            budget_seconds: Overall time budget from now (defaults to
+                VALIDATION_BUDGET_SECONDS; 0/None = unlimited)
+        """
+        self.validator = validator
+        self.concurrency = max(1, concurrency or config.LLM_CONCURRENCY)
+        self.call_timeout = call_timeout or config.LLM_TIMEOUT
+        self.deadline = Deadline(budget_seconds if budget_seconds is not None else config.VALIDATION_BUDGET_SECONDS)
+        self.stats = {"items": 0, "calls": 0, "timed_out": 0, "over_budget": 0, "errors": 0, "busy_seconds": 0.0}
+        self._stats_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="validate")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._start_lock = threading.Lock()
+
+    def _count(self, key: str, amount=1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _fallback(self, chunk: List[Tuple[str, str, str]]) -> List[Dict]:
+        return self.validator.heuristic_validate_batch(chunk)
+
+    async def _validate_chunk(self, chunk: List[Tuple[str, str, str]]) -> List[Dict]:
+        async with self._semaphore:
+            if self.deadline.expired():
+                self._count("over_budget", len(chunk))
+                return self._fallback(chunk)
+
+            remaining = self.deadline.remaining()
+            timeout = self.call_timeout if remaining is None else min(self.call_timeout, remaining)
+            started = time.monotonic()
+            self._count("calls")
+            call = asyncio.get_running_loop().run_in_executor(
+                self._executor, partial(self.validator.validate_batch, chunk, timeout=timeout)
+            )
+            try:
+                return await asyncio.wait_for(call, timeout)
+            except asyncio.TimeoutError:
+                # The call's own request timeout ends its worker thread about now
+                self._count("timed_out", len(chunk))
+                logger.debug(f"Validation of {len(chunk)} items timed out after {timeout:.1f}s")
+                return self._fallback(chunk)
+            except Exception as e:
+                self._count("errors", len(chunk))
+                logger.warning(f"Validation failed: {e}, falling back to heuristics")
+                return self._fallback(chunk)
+            finally:
+                self._count("busy_seconds", time.monotonic() - started)
+
+    async def validate(self, items: List[Tuple[str, str, str]]) -> List[Dict]:
+        """
+        Validate (query, title, description) triples on the running loop.
+
+        Returns:
+            One verdict per item, in order
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._count("items", len(items))
+        size = max(1, self.validator.batch_size)
+        chunks = [items[start:start + size] for start in range(0, len(items), size)]
+        results = await asyncio.gather(*(self._validate_chunk(chunk) for chunk in chunks))
+        return [verdict for chunk_results in results for verdict in chunk_results]
+
+    def _ensure_loop(self):
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="validation-pool", daemon=True)
+            self._thread.start()
+
+    def submit(self, items: List[Tuple[str, str, str]]) -> Future:
+        """Queue items for validation from any thread; the future yields their verdicts."""
+        if not items:
+            future = Future()
+            future.set_result([])
+            return future
+        self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self.validate(list(items)), self._loop)
+
+    def close(self):
+        """Stop the loop thread; calls still running are abandoned."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get_stats(self) -> Dict:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats["busy_seconds"] = round(stats["busy_seconds"], 3)
+        stats["concurrency"] = self.concurrency
+        stats["elapsed_seconds"] = round(self.deadline.elapsed(), 3)
+        return stats
+
+
+def benchmark(items: int, concurrency: int, latency: float, per_item: float, batch_size: int,
+              token_latency: float = 0.0) -> Dict:
+    """Validate synthetic items against an in-process mock Ollama server."""
+    from llm_filter import LLMContentValidator
+    from mock_ollama import serve_in_thread
+
+    server = serve_in_thread(latency=latency, per_item_latency=per_item, token_latency=token_latency)
+    try:
+        validator = LLMContentValidator(base_url=server.url, batch_size=batch_size, use_cache=False)
+        validator.health.wait_ready(5)
+        triples = [("gaming", f"Synthetic video {i}", "") for i in range(items)]
+        with ValidationPool(validator, concurrency=concurrency) as pool:
+            started = time.monotonic()
+            pool.submit(triples).result()
+            elapsed = time.monotonic() - started
+            stats = pool.get_stats()
+    finally:
+        server.shutdown()
+        server.server_close()
+    stats["items_per_second"] = round(items / elapsed, 2) if elapsed else 0.0
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark bounded validation against a mock Ollama server')
+    parser.add_argument('--items', type=int, default=256)
+    parser.add_argument('--concurrency', type=int, default=config.LLM_CONCURRENCY)
+    parser.add_argument('--batch-size', type=int, default=config.LLM_BATCH_SIZE)
+    parser.add_argument('--latency', type=float, default=0.5, help='Mock seconds per request')
+    parser.add_argument('--per-item', type=float, default=0.02, help='Mock extra seconds per prompt item')
+    parser.add_argument('--token-latency', type=float, default=0.0, help='Mock seconds per generated token')
+    args = parser.parse_args()
+
+    stats = benchmark(args.items, args.concurrency, args.latency, args.per_item, args.batch_size,
+                      args.token_latency)
+    print(f"{args.items} items, concurrency {args.concurrency}, batch size {args.batch_size}: "
+          f"{stats['items_per_second']} items/s over {stats['calls']} calls ({stats['elapsed_seconds']}s)")
+
+
+if __name__ == "__main__":
+    main()
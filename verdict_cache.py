@@ -0,0 +1,196 @@
+"""
+Verdict Cache - Persistent store of content validation results.
+Hourly discovery runs keep re-finding the same titles; caching each verdict
+under a hash of everything that could change it (query, title, description,
+and the model and version of whatever produced it) means validation only runs on cache misses.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+
+class VerdictCache:
+    """
+    SQLite-backed verdict cache with a TTL and a size bound.
+
+    Expired entries are ignored on read and deleted when the cache is
+    pruned; once the cache grows past ``max_entries`` the least recently
+    written entries are evicted.
+    """
+
+    def __init__(self, db_path: str = "validation_cache.db", ttl_seconds: float = 7 * 24 * 3600,
+                 max_entries: int = 50000):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+        self._init_database()
+
+    def _init_database(self):
+        """Create the verdicts table."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS verdicts (
+                key TEXT PRIMARY KEY,
+                verdict TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_verdicts_created ON verdicts(created_at)")
+        # Inputs are kept (when given) so local models can be trained on past verdicts
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(verdicts)")}
+        for column in ("query", "title", "description"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE verdicts ADD COLUMN {column} TEXT")
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def key(query: str, title: str, description: str, model: str, prompt_version: str) -> str:
+        """Cache key for one validation input."""
+        payload = json.dumps([query, title, description or "", model, prompt_version], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _fetch(self, keys: List[str], now: float) -> Dict[str, Dict]:
+        """Unexpired verdicts by key, without touching the hit counters."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Dict] = {}
+        if keys:
+            conn = sqlite3.connect(self.db_path)
+            for start in range(0, len(keys), 500):  # Stay under SQLite's variable limit
+                chunk = keys[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT key, verdict FROM verdicts WHERE created_at > ? AND key IN ({','.join('?' * len(chunk))})",
+                    (now - self.ttl_seconds, *chunk)
+                ).fetchall()
+                found.update((key, json.loads(verdict)) for key, verdict in rows)
+            conn.close()
+        return found
+
+    def get_many(self, keys: Iterable[str], now: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Look up verdicts that have not expired.
+
+        Returns:
+            Verdicts by key; missing or expired keys are absent
+        """
+        keys = list(dict.fromkeys(keys))
+        now = time.time() if now is None else now
+        found = self._fetch(keys, now)
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def get_first(self, key_groups: List[Tuple[str, ...]], now: Optional[float] = None) -> List[Optional[Dict]]:
+        """
+        First unexpired verdict of each group of alternative keys.
+
+        Counts one hit or miss per group, so the hit rate stays per input.
+
+        Returns:
+            One verdict (or None) per group, in order
+        """
+        now = time.time() if now is None else now
+        found = self._fetch([key for group in key_groups for key in group], now)
+        verdicts = [next((found[key] for key in group if key in found), None) for group in key_groups]
+        hits = sum(verdict is not None for verdict in verdicts)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(verdicts) - hits
+        return verdicts
+
+    def put_many(self, verdicts: Dict[str, Dict], now: Optional[float] = None,
+                 inputs: Optional[Dict[str, Tuple[str, str, str]]] = None):
+        """
+        Store verdicts, replacing older ones for the same keys.
+
+        Args:
+            verdicts: Verdicts by key
+            now: Clock snapshot
+            inputs: Optional (query, title, description) by key, kept for training
+        """
+        if not verdicts:
+            return
+        now = time.time() if now is None else now
+        inputs = inputs or {}
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany(
+            "INSERT OR REPLACE INTO verdicts (key, verdict, created_at, query, title, description)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [(key, json.dumps(verdict), now, *inputs.get(key, (None, None, None)))
+             for key, verdict in verdicts.items()]
+        )
+        conn.commit()
+        conn.close()
+
+        with self._lock:
+            self.writes += len(verdicts)
+        if len(self) > self.max_entries:
+            self.prune(now)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete expired entries, then the oldest ones beyond ``max_entries``."""
+        now = time.time() if now is None else now
+        conn = sqlite3.connect(self.db_path)
+        removed = conn.execute("DELETE FROM verdicts WHERE created_at <= ?", (now - self.ttl_seconds,)).rowcount
+        removed += conn.execute("""
+            DELETE FROM verdicts WHERE key IN (
+                SELECT key FROM verdicts ORDER BY created_at DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,)).rowcount
+        conn.commit()
+        conn.close()
+        if removed:
+            logger.debug(f"Pruned {removed} cached verdicts")
+        return removed
+
+    def training_rows(self, method: str = "llm", limit: int = 20000) -> List[Tuple[str, str, str, bool]]:
+        """
+        Newest stored (query, title, description, is_match) examples.
+
+        Args:
+            method: Only use verdicts produced by this validation method
+            limit: Maximum rows to return
+        """
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute("""
+            SELECT query, title, description, verdict FROM verdicts
+            WHERE query IS NOT NULL ORDER BY created_at DESC LIMIT ?
+        """, (limit,)).fetchall()
+        conn.close()
+
+        examples = []
+        for query, title, description, verdict in rows:
+            verdict = json.loads(verdict)
+            if verdict.get("method") == method and "is_match" in verdict:
+                examples.append((query, title, description or "", bool(verdict["is_match"])))
+        return examples
+
+    def __len__(self) -> int:
+        conn = sqlite3.connect(self.db_path)
+        count = conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        conn.close()
+        return count
+
+    def get_stats(self) -> Dict:
+        """Hit rate since this process started, plus the cache size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "writes": self.writes,
+            "size": len(self),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds
+        }
@@ -8,31 +8,48 @@ import time
 from pathlib import Path
 from datetime import datetime
 from threading import Thread
+from typing import Optional
 
 # Try FastAPI first, fall back to Flask
 try:
     from fastapi import FastAPI
-    from fastapi.responses import FileResponse, HTMLResponse
+    from fastapi.responses import HTMLResponse, Response
     from fastapi.staticfiles import StaticFiles
     import uvicorn
     USE_FASTAPI = True
 except ImportError:
-    from flask import Flask, send_file
+    from flask import Flask, Response
     USE_FASTAPI = False
 
-from simple_web_ui import SimpleWebUI
-from exposure_engine import CounterExposureEngine
+from config import config
+from feed_snapshot import get_snapshot_manager
 from loguru import logger
 
+# SimpleWebUI and the engine daemon are imported inside the functions that
+# use them, so importing this module (and booting the server) stays cheap.
+
+def get_daemon():
+    """Shared engine daemon, imported and built on first use."""
+    from discovery_daemon import get_daemon as _get_daemon
+    return _get_daemon()
+
 # Background discovery task
 def run_discovery_loop():
-    """Run discovery every hour in background."""
+    """Run discovery every hour in background, starting with an initial run."""
+    from simple_web_ui import SimpleWebUI
+    
+    logger.info("🚀 Running initial discovery...")
     ui = SimpleWebUI()
     
     while True:
         try:
             logger.info("🔍 Starting discovery...")
-            ui.run()
+            if config.DISCOVERY_WORKERS:
+                # Fan the cycle out to worker processes via the job queue
+                from discovery_workers import DiscoveryCoordinator
+                DiscoveryCoordinator().run_cycle(workers=config.DISCOVERY_WORKERS)
+            else:
+                ui.run()
             logger.info("✅ Discovery complete!")
         except Exception as e:
             logger.error(f"❌ Discovery failed: {e}")
@@ -41,64 +58,115 @@ def run_discovery_loop():
         logger.info("💤 Sleeping for 1 hour...")
         time.sleep(3600)
 
-# Initialize discovery on startup
-logger.info("🚀 Running initial discovery...")
-try:
-    ui = SimpleWebUI()
-    ui.run()
-except Exception as e:
-    logger.error(f"Initial discovery failed: {e}")
+_background_started = False
+
+def start_background_discovery():
+    """Start the discovery loop (and the engine daemon if enabled) once."""
+    global _background_started
+    if _background_started:
+        return
+    _background_started = True
+    
+    # Start background discovery thread; the server answers while it runs
+    discovery_thread = Thread(target=run_discovery_loop, daemon=True)
+    discovery_thread.start()
+    
+    # Resident engine: one instance serves /stats and, when enabled, refreshes
+    # the live-stream feed on its own event loop. Building it loads the
+    # engine, so that happens off the request path too.
+    if config.ENGINE_DAEMON:
+        Thread(target=lambda: get_daemon().start(), daemon=True).start()
+
+def snapshot_headers(snapshot):
+    """Version headers so clients can tell feed snapshots apart."""
+    return {"ETag": snapshot.etag, "X-Feed-Version": str(snapshot.version)}
 
-# Start background discovery thread
-discovery_thread = Thread(target=run_discovery_loop, daemon=True)
-discovery_thread.start()
+def health_status():
+    """Health payload shared by both server backends."""
+    snapshot = get_snapshot_manager().current()
+    db_exists = Path(config.EXPOSURE_TRACKER_DB).exists()
+    
+    return {
+        "status": "healthy" if snapshot and db_exists else "initializing",
+        "feed_exists": snapshot is not None,
+        "feed_version": snapshot.version if snapshot else None,
+        "feed_complete": snapshot.meta.get("discovery", {}).get("complete") if snapshot else None,
+        "database_exists": db_exists,
+        "timestamp": datetime.now().isoformat()
+    }
+
+def feed_status_payload():
+    """Current snapshot's version and per-source discovery completeness."""
+    snapshot = get_snapshot_manager().current()
+    if not snapshot:
+        return {"error": "Feed not generated yet"}
+    return {"version": snapshot.version, "created_at": snapshot.created_at, **snapshot.meta}
 
 # Web Server Setup
 if USE_FASTAPI:
     app = FastAPI(title="Counter-Exposure Engine")
     
+    @app.on_event("startup")
+    async def on_startup():
+        """Kick off background discovery and build the engine daemon in a worker thread."""
+        app.state.daemon = asyncio.get_running_loop().run_in_executor(None, get_daemon)
+        start_background_discovery()
+    
     @app.get("/")
     async def serve_root():
-        """Serve the main feed page."""
-        html_file = Path("counter_exposure_feed.html")
-        if html_file.exists():
-            return FileResponse(html_file)
+        """Serve the main feed page from the current in-memory snapshot."""
+        snapshot = get_snapshot_manager().current()
+        if snapshot:
+            return Response(snapshot.html, media_type="text/html", headers=snapshot_headers(snapshot))
         return HTMLResponse("<h1>Feed not generated yet. Check back in a moment!</h1>")
     
     @app.get("/feed.json")
     async def feed_json():
         """Serve raw feed data."""
-        json_file = Path("feed_data.json")
-        if json_file.exists():
-            return FileResponse(json_file)
+        snapshot = get_snapshot_manager().current()
+        if snapshot:
+            return Response(snapshot.feed_json, media_type="application/json", headers=snapshot_headers(snapshot))
         return {"error": "Feed not generated yet"}
     
+    @app.get("/feed/status")
+    async def feed_status():
+        """Version of the served feed and how complete its discovery run was."""
+        return feed_status_payload()
+    
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        html_exists = Path("counter_exposure_feed.html").exists()
-        db_exists = Path("exposure_tracker.db").exists()
-        
-        return {
-            "status": "healthy" if html_exists and db_exists else "initializing",
-            "feed_exists": html_exists,
-            "database_exists": db_exists,
-            "timestamp": datetime.now().isoformat()
-        }
+        return health_status()
     
     @app.get("/stats")
     async def get_stats():
         """Get discovery statistics."""
         try:
-            engine = CounterExposureEngine()
-            return engine.get_stats()
+            daemon = await app.state.daemon
+            return await asyncio.get_running_loop().run_in_executor(None, daemon.get_stats)
         except Exception as e:
             return {"error": str(e)}
     
+    @app.get("/streams.json")
+    async def streams_json(profile: Optional[str] = None):
+        """Serve the latest live-stream feed (or one profile's) precomputed by the engine daemon."""
+        feed = (await app.state.daemon).latest_feed()
+        if profile is not None and profile not in feed.profiles:
+            return {"error": f"Unknown feed profile '{profile}'", "profiles": list(feed.profiles)}
+        return {
+            "cycle": feed.cycle,
+            "generated_at": feed.generated_at,
+            "profile": profile,
+            "profiles": list(feed.profiles),
+            "streams": list(feed.profiles[profile] if profile is not None else feed.items)
+        }
+    
     @app.post("/discover")
     async def trigger_discovery():
         """Manually trigger discovery."""
         try:
+            from simple_web_ui import SimpleWebUI
+            
             ui = SimpleWebUI()
             content = ui.run()
             return {
@@ -113,24 +181,31 @@ else:
     # Flask fallback
     app = Flask(__name__)
     
+    @app.before_request
+    def start_background_flask():
+        start_background_discovery()
+    
     @app.route("/")
     def serve_root_flask():
-        html_file = Path("counter_exposure_feed.html")
-        if html_file.exists():
-            return send_file(html_file)
+        snapshot = get_snapshot_manager().current()
+        if snapshot:
+            return Response(snapshot.html, mimetype="text/html", headers=snapshot_headers(snapshot))
         return "<h1>Feed not generated yet. Check back in a moment!</h1>"
     
+    @app.route("/feed.json")
+    def feed_json_flask():
+        snapshot = get_snapshot_manager().current()
+        if snapshot:
+            return Response(snapshot.feed_json, mimetype="application/json", headers=snapshot_headers(snapshot))
+        return {"error": "Feed not generated yet"}
+    
+    @app.route("/feed/status")
+    def feed_status_flask():
+        return feed_status_payload()
+    
     @app.route("/health")
     def health_check_flask():
-        html_exists = Path("counter_exposure_feed.html").exists()
-        db_exists = Path("exposure_tracker.db").exists()
-        
-        return {
-            "status": "healthy" if html_exists and db_exists else "initializing",
-            "feed_exists": html_exists,
-            "database_exists": db_exists,
-            "timestamp": datetime.now().isoformat()
-        }
+        return health_status()
 
 # Run server
 if __name__ == "__main__":
@@ -71,17 +71,19 @@ class YouTubeDiscovery(BaseDiscoveryClient):
                 return thumbnails[res]['url']
         return None
     
-    def fetch_live_streams(self, query: str = '', page_token: str = None, **kwargs) -> Tuple[List[Stream], Optional[str]]:
+    def fetch_raw_page(self, query: str = '', page_token: str = None, deadline=None,
+                       **kwargs) -> Tuple[List[Dict], Optional[str]]:
         """
-        Fetch currently live streams from YouTube.
+        Fetch one page of raw search items for currently live streams.
         
         Args:
             query: Search query string
             page_token: Token for pagination
+            deadline: Optional Deadline bounding the request
             **kwargs: Additional parameters for the API
             
         Returns:
-            Tuple of (list of Stream objects, next page token)
+            Tuple of (list of raw API items, next page token)
         """
         if not self.api_key:
             logger.warning("YouTube API key not configured")
@@ -100,18 +102,36 @@ class YouTubeDiscovery(BaseDiscoveryClient):
         if page_token:
             params['pageToken'] = page_token
         
-        try:
-            data = self._make_request(
-                f"{self.BASE_URL}/search",
-                params=params
-            )
-            
-            streams = []
-            for item in data.get('items', []):
-                if stream := self._process_stream(item):
-                    streams.append(stream)
+        data = self._make_request(
+            f"{self.BASE_URL}/search",
+            params=params,
+            deadline=deadline
+        )
+        return data.get('items', []), data.get('nextPageToken')
+    
+    def decode_items(self, items: List[Dict]) -> List[Stream]:
+        """Convert raw YouTube search items into Stream objects."""
+        streams = []
+        for item in items:
+            if stream := self._process_stream(item):
+                streams.append(stream)
+        return streams
+    
+    def fetch_live_streams(self, query: str = '', page_token: str = None, **kwargs) -> Tuple[List[Stream], Optional[str]]:
+        """
+        Fetch currently live streams from YouTube.
+        
+        Args:
+            query: Search query string
+            page_token: Token for pagination
+            **kwargs: Additional parameters for the API
             
-            return streams, data.get('nextPageToken')
+        Returns:
+            Tuple of (list of Stream objects, next page token)
+        """
+        try:
+            items, next_token = self.fetch_raw_page(query=query, page_token=page_token, **kwargs)
+            return self.decode_items(items), next_token
             
         except Exception as e:
             logger.error(f"Error fetching YouTube live streams: {e}")
@@ -0,0 +1,221 @@
+"""
+YouTube Parser - Reads search results out of YouTube's embedded JSON.
+A results page ships its data as ``ytInitialData`` and its client config
+through ``ytcfg.set(...)``. Each blob is found once and decoded in place
+with the C JSON scanner (``raw_decode`` stops at the closing brace, so the
+rest of the page is never scanned). Videos are the ``videoRenderer`` nodes
+of the decoded tree. A continuation token then fetches deeper pages from
+the ``youtubei/v1/search`` endpoint without downloading the HTML shell again.
+"""
+import json
+import re
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+SEARCH_API_URL = "https://www.youtube.com/youtubei/v1/search"
+
+INITIAL_DATA_MARKERS = ('var ytInitialData = ', 'window["ytInitialData"] = ', 'ytInitialData = ')
+LIVE_BADGE_STYLES = frozenset({'BADGE_STYLE_TYPE_LIVE_NOW'})
+COUNT_SUFFIXES = {'K': 10 ** 3, 'M': 10 ** 6, 'B': 10 ** 9}
+
+_decoder = json.JSONDecoder()
+# A number (separators may be commas, dots or spaces) and its unit: a letter
+# right after it, or a lone letter after one space ("3,4 k vues")
+_count = re.compile(r'(\d(?:[\d,.]|\s(?=\d))*)(?:(\w)|\s(\w)(?!\w))?')
+_decimal = re.compile(r'\d+(?:[.,]\d+)?')
+_continuation_token = re.compile(r'"continuationCommand"\s*:\s*\{\s*"token"\s*:\s*"([^"]+)"')
+
+
+class YouTubeVideo(NamedTuple):
+    """One ``videoRenderer`` result."""
+    video_id: str
+    title: str
+    channel: Optional[str]
+    channel_id: Optional[str]
+    is_live: bool
+    view_count: Optional[int]
+    view_text: str
+
+    @property
+    def url(self) -> str:
+        return f"https://www.youtube.com/watch?v={self.video_id}"
+
+
+class YouTubePage(NamedTuple):
+    """Videos of one results page plus what is needed to fetch the next one."""
+    videos: List[YouTubeVideo]
+    continuation: Optional[str]
+    api_key: Optional[str] = None
+    context: Optional[Dict] = None
+
+
+def extract_json(text: str, marker: str, start: int = 0) -> Optional[Any]:
+    """
+    Decode the JSON value after the first occurrence of ``marker`` that is
+    followed by JSON (others, e.g. in string literals, are skipped).
+
+    Returns:
+        The decoded value, or None if no occurrence is followed by JSON
+    """
+    index = text.find(marker, start)
+    while index >= 0:
+        try:
+            value, _ = _decoder.raw_decode(text, index + len(marker))
+        except ValueError:
+            index = text.find(marker, index + 1)
+            continue
+        return value
+    return None
+
+
+def initial_data(html: str) -> Optional[Dict]:
+    """The page's ``ytInitialData`` object."""
+    for marker in INITIAL_DATA_MARKERS:
+        data = extract_json(html, marker)
+        if isinstance(data, dict):
+            return data
+    return None
+
+
+def client_config(html: str) -> Dict:
+    """Merged ``ytcfg.set({...})`` objects of the page."""
+    config: Dict = {}
+    index = html.find('ytcfg.set({')
+    while index >= 0:
+        value = extract_json(html, 'ytcfg.set(', index)
+        if isinstance(value, dict):
+            config.update(value)
+        index = html.find('ytcfg.set({', index + 1)
+    return config
+
+
+def iter_key(node: Any, key: str) -> Iterator[Any]:
+    """Values stored under ``key`` anywhere in a decoded JSON tree, in document order."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            children = []
+            for name, value in current.items():
+                if name == key:
+                    yield value
+                elif isinstance(value, (dict, list)):
+                    children.append(value)
+            stack.extend(reversed(children))
+        elif isinstance(current, list):
+            stack.extend(item for item in reversed(current) if isinstance(item, (dict, list)))
+
+
+def text_of(node: Optional[Dict]) -> str:
+    """Plain text of a ``{"simpleText": ...}`` or ``{"runs": [...]}`` node."""
+    if not node:
+        return ''
+    if 'simpleText' in node:
+        return node['simpleText']
+    return ''.join(run.get('text', '') for run in node.get('runs', ()))
+
+
+def count_from_text(text: str) -> Optional[int]:
+    """
+    Number in a view count text such as "1,234 views" or "12 watching".
+
+    Abbreviated counts ("1.2M watching", "15K views") return the lower bound
+    of what they round, e.g. 1200000. Counts in any other unit ("3.4万")
+    return None rather than a number off by orders of magnitude.
+    """
+    match = _count.search(text)
+    if not match:
+        return None
+    number, unit = match.group(1), match.group(2) or match.group(3)
+    if not unit:
+        return int(re.sub(r'\D', '', number))
+    multiplier = COUNT_SUFFIXES.get(unit.upper())
+    if multiplier is None or not _decimal.fullmatch(number):
+        return None
+    return int(Decimal(number.replace(',', '.')) * multiplier)
+
+
+def _is_live(renderer: Dict) -> bool:
+    for badge in renderer.get('badges', ()):
+        style = badge.get('metadataBadgeRenderer', {}).get('style')
+        if style in LIVE_BADGE_STYLES:
+            return True
+    for overlay in renderer.get('thumbnailOverlays', ()):
+        if overlay.get('thumbnailOverlayTimeStatusRenderer', {}).get('style') == 'LIVE':
+            return True
+    return False
+
+
+def video_from_renderer(renderer: Dict) -> Optional[YouTubeVideo]:
+    """A YouTubeVideo from one ``videoRenderer`` node (None without a video id)."""
+    video_id = renderer.get('videoId')
+    if not video_id:
+        return None
+    owner = renderer.get('ownerText') or renderer.get('longBylineText') or {}
+    runs = owner.get('runs') or [{}]
+    view_node = renderer.get('viewCountText') or {}
+    view_text = text_of(view_node)
+    return YouTubeVideo(
+        video_id=video_id,
+        title=text_of(renderer.get('title')),
+        channel=runs[0].get('text'),
+        channel_id=runs[0].get('navigationEndpoint', {}).get('browseEndpoint', {}).get('browseId'),
+        is_live=_is_live(renderer),
+        view_count=count_from_text(view_text) if view_text else None,
+        view_text=view_text
+    )
+
+
+def parse_tree(data: Any) -> YouTubePage:
+    """Videos and continuation token of a decoded results tree or continuation response."""
+    videos = []
+    seen = set()
+    for renderer in iter_key(data, 'videoRenderer'):
+        video = video_from_renderer(renderer)
+        if video and video.video_id not in seen:
+            seen.add(video.video_id)
+            videos.append(video)
+    continuation = next((command.get('token') for command in iter_key(data, 'continuationCommand')
+                         if command.get('token')), None)
+    return YouTubePage(videos, continuation)
+
+
+def find_continuation(text: str) -> Optional[str]:
+    """
+    Continuation token of a page or response without decoding it.
+
+    Lets the crawler request the next page while the full parse of this
+    one runs elsewhere.
+    """
+    match = _continuation_token.search(text)
+    return match.group(1) if match else None
+
+
+def parse_results_page(html: str) -> YouTubePage:
+    """
+    Parse a ``/results`` HTML page.
+
+    Returns:
+        The page's videos, its continuation token and the API key and client
+        context needed to request the continuation
+    """
+    data = initial_data(html)
+    page = parse_tree(data) if data is not None else YouTubePage([], None)
+    config = client_config(html)
+    return page._replace(api_key=config.get('INNERTUBE_API_KEY'), context=config.get('INNERTUBE_CONTEXT'))
+
+
+def continuation_request(page: YouTubePage) -> Optional[Dict]:
+    """
+    Query parameters and JSON body for the page after ``page``.
+
+    Returns:
+        {"params": ..., "payload": ...}, or None when there is no next page
+    """
+    if not page.continuation:
+        return None
+    context = page.context or {"client": {"clientName": "WEB", "clientVersion": "2.20240101.00.00"}}
+    return {
+        "params": {"key": page.api_key} if page.api_key else {"prettyPrint": "false"},
+        "payload": {"context": context, "continuation": page.continuation}
+    }